@@ -92,6 +92,9 @@ class PublicConnector(ABC):
 
 
 class PrivateConnector(ABC):
+    # order rate limit used when no `rate_limit` is configured for the connector
+    DEFAULT_RATE_LIMIT: RateLimit | None = None
+
     def __init__(
         self,
         account_type,
@@ -117,6 +120,7 @@ class PrivateConnector(ABC):
         self._clock = LiveClock()
         self._msgbus: MessageBus = msgbus
 
+        rate_limit = rate_limit or self.DEFAULT_RATE_LIMIT
         if rate_limit:
             self._limiter = AsyncLimiter(rate_limit.max_rate, rate_limit.time_period)
         else:
@@ -193,6 +197,7 @@ class PrivateConnector(ABC):
     @abstractmethod
     async def connect(self):
         """Connect to the exchange"""
+        self._api_client._init_session()  # one long-lived session per client, reused by every order request
         await self._init_account_balance()
         await self._init_position()
 
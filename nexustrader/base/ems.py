@@ -1,14 +1,16 @@
+import math
 import asyncio
+import msgspec
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Callable, Awaitable, Type
 from typing import Literal
 from decimal import Decimal
 from decimal import ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
 
 from nexustrader.schema import Order, BaseMarket
-from nexustrader.core.log import SpdLog
-from nexustrader.core.entity import TaskManager
-from nexustrader.core.nautilius_core import MessageBus, LiveClock
+from nexustrader.core.log import SpdLog, DEBUG
+from nexustrader.core.entity import TaskManager, SPSCQueue
+from nexustrader.core.nautilius_core import MessageBus, LiveClock, UUID4
 from nexustrader.core.cache import AsyncCache
 from nexustrader.core.registry import OrderRegistry
 from nexustrader.error import OrderError
@@ -17,13 +19,26 @@ from nexustrader.constants import (
     SubmitType,
     OrderType,
     OrderSide,
+    OrderStatus,
     AlgoOrderStatus,
+    STATUS_TRANSITIONS,
 )
 from nexustrader.schema import OrderSubmit, AlgoOrder, InstrumentId
 from nexustrader.base.connector import PrivateConnector
 
+# past this many steps a float ratio may no longer resolve a tick, the value is snapped in Decimal
+_FLOAT_SNAP_MAX_RATIO = 1e13
+_SNAP_ROUNDING = {"round": ROUND_HALF_UP, "ceil": ROUND_CEILING, "floor": ROUND_FLOOR}
+
 
 class ExecutionManagementSystem(ABC):
+    MAX_SUBMIT_BATCH = 32  # max order submits drained from a worker queue at once
+    ALGO_STATUS_FLUSH_INTERVAL = 0.25  # min seconds between algo order progress writes
+
+    # account type class of the exchange, the engine hands every EMS the private
+    # connectors of all exchanges and only these account types are served here
+    ACCOUNT_TYPE: Type[AccountType] = AccountType
+
     def __init__(
         self,
         market: Dict[str, BaseMarket],
@@ -31,6 +46,9 @@ class ExecutionManagementSystem(ABC):
         msgbus: MessageBus,
         task_manager: TaskManager,
         registry: OrderRegistry,
+        submit_queue_max: int = 4096,
+        submit_workers: int = 1,
+        order_timeout: float | None = None,
     ):
         self._log = SpdLog.get_logger(
             name=type(self).__name__, level="DEBUG", flush=True
@@ -42,13 +60,133 @@ class ExecutionManagementSystem(ABC):
         self._task_manager = task_manager
         self._registry = registry
         self._clock = LiveClock()
-        self._order_submit_queues: Dict[AccountType, asyncio.Queue[OrderSubmit]] = {}
+        self._submit_queue_max = submit_queue_max
+        self._submit_workers = max(1, submit_workers)
+        self._order_timeout = order_timeout
+        self._order_submit_queues: Dict[AccountType, List[SPSCQueue[OrderSubmit]]] = {}
         self._private_connectors: Dict[AccountType, PrivateConnector] | None = None
+        self._dispatch: Dict[SubmitType, Callable[[OrderSubmit, AccountType], Awaitable]] = {}
+        # per-symbol precision steps, markets are loaded once by the ExchangeManager
+        # so the entries never need to be invalidated
+        self._amount_steps: Dict[str, Tuple[int, int, Decimal]] = {}
+        self._price_steps: Dict[str, Tuple[int, int, Decimal]] = {}
+        # order uuid -> status updates pushed from the msgbus, only for orders an algo waits on
+        self._order_updates: Dict[str, asyncio.Queue[Order]] = {}
 
     def _build(self, private_connectors: Dict[AccountType, PrivateConnector]):
         self._private_connectors = private_connectors
-        self._build_order_submit_queues()
         self._set_account_type()
+        self._build_order_submit_queues()
+        self._build_dispatch()
+        self._msgbus.subscribe(topic="order_status", handler=self._on_order_status)
+
+    def _build_dispatch(self):
+        """
+        Build the submit type -> handler table used by the submit workers
+        """
+        self._dispatch = {
+            SubmitType.CANCEL: self._cancel_order,
+            SubmitType.CREATE: self._create_order,
+            SubmitType.TWAP: self._create_twap_order,
+            SubmitType.CANCEL_TWAP: self._cancel_twap_order,
+            SubmitType.STOP_LOSS: self._create_stop_loss_order,
+            SubmitType.TAKE_PROFIT: self._create_take_profit_order,
+            SubmitType.BATCH: self._create_batch_orders,
+        }
+
+    def _on_order_status(self, order: Order):
+        """
+        Hand the updated order to the algo order waiting on it
+        """
+        queue = self._order_updates.get(order.uuid)
+        if queue is not None:
+            queue.put_nowait(order)
+
+    @staticmethod
+    def _next_order_state(order: Order, update: Order) -> Order:
+        """
+        Adopt the update only if it is a valid status transition, like the cache does, so
+        an update delivered out of order cannot move the order back to an open state
+        """
+        allowed = STATUS_TRANSITIONS.get(order.status)
+        # local states such as CANCEL_FAILED have no transition table, any update moves on from them
+        if allowed is None or update.status in allowed:
+            return update
+        return order
+
+    async def _wait_order_update(self, uuid: str, timeout: float, order: Order) -> Order:
+        """
+        Wait for the next status update of the order, return its latest state or the
+        given order if the timeout expires first
+        """
+        queue = self._order_updates.get(uuid)
+        if queue is None:
+            queue = self._order_updates[uuid] = asyncio.Queue()
+        try:
+            async with asyncio.timeout(timeout):
+                update = await queue.get()
+        except TimeoutError:
+            return order
+        return self._drain_order_updates(uuid, self._next_order_state(order, update))
+
+    def _drain_order_updates(self, uuid: str, order: Order) -> Order:
+        """
+        Apply the status updates already queued for the order, return its latest state
+        """
+        queue = self._order_updates.get(uuid)
+        if queue is not None:
+            while not queue.empty():
+                order = self._next_order_state(order, queue.get_nowait())
+        return order
+
+    @staticmethod
+    def _precision_step(precision: float) -> Tuple[int, int, Decimal]:
+        """
+        Convert a market precision to its step as (numerator, denominator, Decimal),
+        e.g. 0.01 -> (1, 100, Decimal("0.01")) and 10 -> (10, 1, Decimal("10"))
+        """
+        step = Decimal(int(precision)) if precision >= 1 else Decimal(str(precision))
+        numerator, denominator = step.as_integer_ratio()
+        return numerator, denominator, step
+
+    @staticmethod
+    def _snap_to_step(
+        value: float,
+        step: Tuple[int, int, Decimal],
+        mode: Literal["round", "ceil", "floor"],
+    ) -> Decimal:
+        """
+        Snap the value to a multiple of step. Floats are scaled with the integer ratio of
+        the step (no inexact float step) and only the final product is a Decimal, Decimal
+        values and ratios too large for float resolution are snapped in Decimal
+        """
+        numerator, denominator, step_decimal = step
+        if type(value) is not Decimal:
+            ratio = float(value) * denominator / numerator
+            if -_FLOAT_SNAP_MAX_RATIO < ratio < _FLOAT_SNAP_MAX_RATIO:
+                # snapped on the magnitude so half-way ties round away from zero like
+                # ROUND_HALF_UP, ceil and floor swap for negatives to keep their direction
+                sign = -1 if ratio < 0 else 1
+                magnitude = abs(ratio)
+                # the float error is a few ulps of the ratio, the tolerance absorbs it on exact
+                # multiples and half-way ties while staying below the tick fraction of any
+                # value with 15 significant digits
+                tol = magnitude * 6e-16
+                nearest = math.floor(magnitude + 0.5 + tol)
+                if abs(magnitude - nearest) <= tol:
+                    multiple = nearest
+                elif mode == "round":
+                    multiple = nearest
+                elif (mode == "ceil") == (sign > 0):
+                    multiple = math.ceil(magnitude)
+                else:
+                    multiple = math.floor(magnitude)
+                return Decimal(sign * multiple) * step_decimal
+            value = Decimal(str(float(value)))
+        multiple = (value * denominator / numerator).to_integral_value(
+            rounding=_SNAP_ROUNDING[mode]
+        )
+        return Decimal(int(multiple)) * step_decimal
 
     def _amount_to_precision(
         self,
@@ -59,72 +197,61 @@ class ExecutionManagementSystem(ABC):
         """
         Convert the amount to the precision of the market
         """
-        market = self._market[symbol]
-        amount: Decimal = Decimal(str(amount))
-        precision = market.precision.amount
+        return self._snap_to_step(amount, self._amount_step(symbol), mode)
 
-        if precision >= 1:
-            exp = Decimal(int(precision))
-            precision_decimal = Decimal("1")
-        else:
-            exp = Decimal("1")
-            precision_decimal = Decimal(str(precision))
-
-        if mode == "round":
-            format_amount = (amount / exp).quantize(
-                precision_decimal, rounding=ROUND_HALF_UP
-            ) * exp
-        elif mode == "ceil":
-            format_amount = (amount / exp).quantize(
-                precision_decimal, rounding=ROUND_CEILING
-            ) * exp
-        elif mode == "floor":
-            format_amount = (amount / exp).quantize(
-                precision_decimal, rounding=ROUND_FLOOR
-            ) * exp
-        return format_amount
+    def _amount_step(self, symbol: str) -> Tuple[int, int, Decimal]:
+        """
+        Get the cached amount step of the symbol
+        """
+        step = self._amount_steps.get(symbol)
+        if step is None:
+            step = self._precision_step(self._market[symbol].precision.amount)
+            self._amount_steps[symbol] = step
+        return step
 
     def _price_to_precision(
         self,
         symbol: str,
         price: float,
-        mode: Literal["round", "ceil", "floor"] = "round"
+        mode: Literal["round", "ceil", "floor"] = "round",
     ) -> Decimal:
         """
         Convert the price to the precision of the market
         """
-        market = self._market[symbol]
-        price: Decimal = Decimal(str(price))
+        return self._snap_to_step(price, self._price_step(symbol), mode)
 
-        decimal = market.precision.price
+    def _price_step(self, symbol: str) -> Tuple[int, int, Decimal]:
+        """
+        Get the cached price step of the symbol
+        """
+        step = self._price_steps.get(symbol)
+        if step is None:
+            step = self._precision_step(self._market[symbol].precision.price)
+            self._price_steps[symbol] = step
+        return step
 
-        if decimal >= 1:
-            exp = Decimal(int(decimal))
-            precision_decimal = Decimal("1")
-        else:
-            exp = Decimal("1")
-            precision_decimal = Decimal(str(decimal))
-
-        if mode == "round":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_HALF_UP
-            ) * exp
-        elif mode == "ceil":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_CEILING
-            ) * exp
-        elif mode == "floor":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_FLOOR
-            ) * exp
-        return format_price
+    def _submit_account_types(self) -> List[AccountType]:
+        """
+        The account types of this exchange among the private connectors, each gets its own submit queues
+        """
+        return [
+            account_type
+            for account_type in self._private_connectors
+            if isinstance(account_type, self.ACCOUNT_TYPE)
+        ]
 
-    @abstractmethod
     def _build_order_submit_queues(self):
         """
-        Build the order submit queues
+        Build the order submit queues, one per worker for each account type so a slow
+        account never holds up the submits of another
         """
-        pass
+        self._order_submit_queues = {
+            account_type: [
+                SPSCQueue(maxsize=self._submit_queue_max)
+                for _ in range(self._submit_workers)
+            ]
+            for account_type in self._submit_account_types()
+        }
 
     @abstractmethod
     def _set_account_type(self):
@@ -142,11 +269,37 @@ class ExecutionManagementSystem(ABC):
         """
         pass
 
+    def _put_order_submit(self, account_type: AccountType, order: OrderSubmit):
+        """
+        Put an order submit into the bounded submit queue of its worker, reject it if the
+        account type has no private connector or the queue is full. Within an account type
+        orders are sharded by symbol so the submits of one symbol are always handled in
+        order by the same worker
+        """
+        queues = self._order_submit_queues.get(account_type)
+        if queues is None:
+            raise OrderError(
+                f"No private connector for {account_type}, order {order.uuid} rejected"
+            )
+        if self._submit_workers == 1:
+            queue = queues[0]
+        else:
+            queue = queues[hash(order.symbol) % self._submit_workers]
+        try:
+            queue.put_nowait(order)
+        except asyncio.QueueFull:
+            raise OrderError(
+                f"Order submit queue is full (maxsize={self._submit_queue_max}), order {order.uuid} rejected"
+            )
+
     async def _cancel_order(self, order_submit: OrderSubmit, account_type: AccountType):
         """
-        Cancel an order
+        Cancel an order, the exchange order id is taken from the submit when the caller
+        already has it, otherwise it is looked up in the registry
         """
-        order_id = self._registry.get_order_id(order_submit.uuid)
+        order_id = order_submit.order_id or self._registry.get_order_id(
+            order_submit.uuid
+        )
         if order_id:
             order: Order = await self._private_connectors[account_type].cancel_order(
                 symbol=order_submit.symbol,
@@ -168,9 +321,11 @@ class ExecutionManagementSystem(ABC):
 
     async def _create_order(self, order_submit: OrderSubmit, account_type: AccountType):
         """
-        Create an order
+        Create an order. When the order timeout expires the request is not abandoned, it may
+        already be live on the exchange: the order is reported pending without an exchange
+        order id and the late response is reconciled in the background
         """
-        order: Order = await self._private_connectors[account_type].create_order(
+        request = self._private_connectors[account_type].create_order(
             symbol=order_submit.symbol,
             side=order_submit.side,
             type=order_submit.type,
@@ -180,6 +335,16 @@ class ExecutionManagementSystem(ABC):
             position_side=order_submit.position_side,
             **order_submit.kwargs,
         )
+        if self._order_timeout is None:
+            order: Order = await request
+        else:
+            request = asyncio.create_task(request)
+            try:
+                # the timeout only stops waiting, shield keeps the request itself running
+                async with asyncio.timeout(self._order_timeout):
+                    order: Order = await asyncio.shield(request)
+            except TimeoutError:
+                return self._create_order_timeout(order_submit, request)
         order.uuid = order_submit.uuid
         if order.success:
             self._registry.register_order(order)
@@ -190,6 +355,91 @@ class ExecutionManagementSystem(ABC):
             self._msgbus.send(endpoint="failed", msg=order)
         return order
 
+    def _create_order_timeout(
+        self, order_submit: OrderSubmit, request: asyncio.Task
+    ) -> Order:
+        """
+        Report a create order whose response is late as pending and reconcile it once the
+        response arrives
+        """
+        self._log.warn(
+            f"Create order timeout after {self._order_timeout}s, reconciling: uuid: {order_submit.uuid}, symbol: {order_submit.symbol}"
+        )
+        order = Order(
+            exchange=order_submit.instrument_id.exchange,
+            symbol=order_submit.symbol,
+            status=OrderStatus.PENDING,
+            uuid=order_submit.uuid,
+            timestamp=self._clock.timestamp_ms(),
+            type=order_submit.type,
+            side=order_submit.side,
+            amount=order_submit.amount,
+            price=float(order_submit.price) if order_submit.price else None,
+            time_in_force=order_submit.time_in_force,
+            position_side=order_submit.position_side,
+        )
+        self._cache._order_initialized(order)  # INITIALIZED -> PENDING
+        self._msgbus.send(endpoint="pending", msg=order)
+        self._task_manager.create_task(
+            self._reconcile_create_order(order, request),
+            name=f"reconcile-{order_submit.uuid}",
+        )
+        return order
+
+    async def _reconcile_create_order(self, pending: Order, request: asyncio.Task):
+        """
+        Wait for the late response of a create order. An accepted order replaces the pending
+        placeholder and is registered so the order updates of the exchange are linked to it,
+        a rejected one or a request that raised is failed
+        """
+        try:
+            order: Order = await request
+        except Exception as e:
+            self._log.error(
+                f"Create order failed after timeout, it may still be live on the exchange: uuid: {pending.uuid}, symbol: {pending.symbol}, {type(e).__name__}: {e}"
+            )
+            order = msgspec.structs.replace(
+                pending, status=OrderStatus.FAILED, timestamp=self._clock.timestamp_ms()
+            )
+        order.uuid = pending.uuid
+        if order.success:
+            self._registry.register_order(order)
+            self._cache._order_status_update(order)  # PENDING -> PENDING, now with the order id
+            self._msgbus.send(endpoint="pending", msg=order)
+            self._log.info(
+                f"Create order reconciled: uuid: {order.uuid}, id: {order.id}, symbol: {order.symbol}"
+            )
+        else:
+            self._cache._order_status_update(order)  # PENDING -> FAILED
+            self._msgbus.send(endpoint="failed", msg=order)
+
+    async def _create_batch_orders(
+        self, order_submit: OrderSubmit, account_type: AccountType
+    ) -> List[Order | BaseException]:
+        """
+        Create a batch of orders concurrently, the requests overlap instead of waiting for each other
+        """
+        return await self._gather_create_orders(
+            [(account_type, order) for order in order_submit.batch]
+        )
+
+    async def _gather_create_orders(
+        self, creates: List[Tuple[AccountType, OrderSubmit]]
+    ) -> List[Order | BaseException]:
+        """
+        Run the create order requests concurrently and log the ones that raised
+        """
+        results = await asyncio.gather(
+            *(self._create_order(order, account_type) for account_type, order in creates),
+            return_exceptions=True,
+        )
+        for (_, order), result in zip(creates, results):
+            if isinstance(result, BaseException):
+                self._log.error(
+                    f"BATCH ORDER FAILED: uuid: {order.uuid}, symbol: {order.symbol}, {type(result).__name__}: {result}"
+                )
+        return results
+
     async def _create_stop_loss_order(
         self, order_submit: OrderSubmit, account_type: AccountType
     ):
@@ -257,6 +507,25 @@ class ExecutionManagementSystem(ABC):
         """
         pass
 
+    @staticmethod
+    def _twap_slice_ticks(
+        total_ticks: int, slices: int, min_ticks: int
+    ) -> Tuple[int, int]:
+        """
+        Split total_ticks into slices, return (base_ticks, full_slices). The base slice
+        is rounded half up like `_amount_to_precision(mode="round")` and never below min_ticks
+        """
+        base_ticks = max(min_ticks, (2 * total_ticks + slices) // (2 * slices), 1)
+        return base_ticks, total_ticks // base_ticks
+
+    def _amount_to_ticks(self, symbol: str, amount: Decimal) -> Tuple[int, Decimal]:
+        """
+        Split the amount into whole ticks of the amount step and the sub-tick residual
+        """
+        numerator, denominator, step_decimal = self._amount_step(symbol)
+        ticks = int(amount * denominator // numerator)
+        return ticks, amount - Decimal(ticks) * step_decimal
+
     def _calculate_twap_orders(
         self,
         symbol: str,
@@ -265,42 +534,49 @@ class ExecutionManagementSystem(ABC):
         wait: float,
         min_order_amount: Decimal,
         reduce_only: bool = False,
-    ) -> Tuple[List[Decimal], float]:
+    ) -> Tuple[List[int], Decimal, float]:
         """
-        Calculate the amount list and wait time for the twap order
+        Calculate the slices of the twap order in ticks of the amount step and the wait time.
+        The sub-tick residual of the total amount is returned separately, it goes with the
+        last slice of the list, which is the first one sent
 
         eg:
-        amount_list = [10, 10, 10]
+        tick_list = [10, 10, 10]
+        residual = 0
         wait = 10
         """
-        self._log.debug(f"CALCULATE TWAP ORDERS: symbol: {symbol}, total_amount: {total_amount}, duration: {duration}, wait: {wait}, min_order_amount: {min_order_amount}, reduce_only: {reduce_only}")
-        amount_list = []
+        if self._log.should_log(DEBUG):
+            self._log.debug(f"CALCULATE TWAP ORDERS: symbol: {symbol}, total_amount: {total_amount}, duration: {duration}, wait: {wait}, min_order_amount: {min_order_amount}, reduce_only: {reduce_only}")
         if (total_amount == 0 or total_amount < min_order_amount):
             if reduce_only:
-                return [total_amount], 0
+                ticks, residual = self._amount_to_ticks(symbol, total_amount)
+                return [ticks], residual, 0
             self._log.info(
                 f"TWAP ORDER: {symbol} Total amount is less than min order amount: {total_amount} < {min_order_amount}"
             )
-            return [], 0
+            return [], Decimal(0), 0
 
-        interval = duration // wait
-        base_amount = float(total_amount) / interval
+        numerator, denominator, step_decimal = self._amount_step(symbol)
+        total_ticks, residual = self._amount_to_ticks(symbol, total_amount)
+        min_ticks = math.ceil(min_order_amount * denominator / numerator)
 
-        base_amount = max(
-            min_order_amount, self._amount_to_precision(symbol, base_amount)
+        base_ticks, full_slices = self._twap_slice_ticks(
+            total_ticks, max(1, int(duration // wait)), min_ticks
         )
 
-        interval = int(total_amount // base_amount)
-        remaining = total_amount - interval * base_amount
+        if full_slices == 0:
+            return [total_ticks], residual, duration
+
+        remaining_ticks = total_ticks - full_slices * base_ticks
 
-        if remaining < min_order_amount:
-            amount_list = [base_amount] * interval
-            amount_list[-1] += remaining
+        if Decimal(remaining_ticks) * step_decimal + residual < min_order_amount:
+            tick_list = [base_ticks] * full_slices
+            tick_list[-1] += remaining_ticks
         else:
-            amount_list = [base_amount] * interval + [remaining]
+            tick_list = [base_ticks] * full_slices + [remaining_ticks]
 
-        wait = duration / len(amount_list)
-        return amount_list, wait
+        wait = duration / len(tick_list)
+        return tick_list, residual, wait
 
     def _cal_limit_order_price(
         self, symbol: str, side: OrderSide, market: BaseMarket
@@ -308,7 +584,8 @@ class ExecutionManagementSystem(ABC):
         """
         Calculate the limit order price
         """
-        basis_point = market.precision.price
+        step = self._price_step(symbol)
+        basis_point = step[0] / step[1]  # the tick as float, no Decimal on this path
         book = self._cache.bookl1(symbol)
 
         if side.is_buy:
@@ -323,8 +600,9 @@ class ExecutionManagementSystem(ABC):
                 price = book.bid + basis_point
             else:
                 price = book.ask
-        price = self._price_to_precision(symbol, price)
-        self._log.debug(f"CALCULATE LIMIT ORDER PRICE: symbol: {symbol}, side: {side}, price: {price}, ask: {book.ask}, bid: {book.bid}")
+        price = self._snap_to_step(price, step, "round")
+        if self._log.should_log(DEBUG):
+            self._log.debug(f"CALCULATE LIMIT ORDER PRICE: symbol: {symbol}, side: {side}, price: {price}, ask: {book.ask}, bid: {book.bid}")
         return price
 
     async def _twap_order(self, order_submit: OrderSubmit, account_type: AccountType):
@@ -357,7 +635,9 @@ class ExecutionManagementSystem(ABC):
         self._cache._order_initialized(algo_order)
 
         min_order_amount: Decimal = self._get_min_order_amount(symbol, market)
-        amount_list, wait = self._calculate_twap_orders(
+        step_decimal = self._amount_step(symbol)[2]
+        # slices are integer ticks, Decimal amounts are only built for the outgoing submits
+        tick_list, residual, wait = self._calculate_twap_orders(
             symbol=symbol,
             total_amount=order_submit.amount,
             duration=order_submit.duration,
@@ -366,56 +646,65 @@ class ExecutionManagementSystem(ABC):
             reduce_only=reduce_only,
         )
 
+        # slice templates, each slice only copies them with its own amount, price and uuid
+        limit_template = OrderSubmit(
+            symbol=symbol,
+            instrument_id=instrument_id,
+            submit_type=SubmitType.CREATE,
+            type=OrderType.LIMIT,
+            side=side,
+            position_side=position_side,
+            kwargs=kwargs,
+        )
+        market_template = msgspec.structs.replace(limit_template, type=OrderType.MARKET)
+        cancel_template = OrderSubmit(
+            symbol=symbol,
+            instrument_id=instrument_id,
+            submit_type=SubmitType.CANCEL,
+        )
+
         order_id = None
         elapsed_time = 0
+        loop = asyncio.get_running_loop()
+        # child order appends are written at most once per flush interval, the
+        # status transitions below are always written with the full orders list
+        last_flush = loop.time()
 
         try:
-            while amount_list:
+            while tick_list:
                 if order_id:
-                    order = self._cache.get_order(order_id)
-
-                    is_opened = order.bind_optional(
-                        lambda order: order.is_opened
-                    ).value_or(False)
-                    on_flight = order.bind_optional(
-                        lambda order: order.on_flight
-                    ).value_or(False)
-                    is_closed = order.bind_optional(
-                        lambda order: order.is_closed
-                    ).value_or(False)
-
+                    # order holds the latest state pushed on the msgbus, the cache is not re-read
+                    order = self._drain_order_updates(order_id, order)
                     # 检查现价单是否已成交，不然的话立刻下市价单成交 或者 把remaining amount加到下一个市价单上
-                    if is_opened and not on_flight:
-                        await self._cancel_order(
-                            order_submit=OrderSubmit(
-                                symbol=symbol,
-                                instrument_id=instrument_id,
-                                submit_type=SubmitType.CANCEL,
-                                uuid=order_id,
+                    if order.is_opened and not order.on_flight:
+                        canceling = await self._cancel_order(
+                            order_submit=msgspec.structs.replace(
+                                cancel_template, uuid=order_id, order_id=order.id
                             ),
                             account_type=account_type,
                         )
-                        self._log.info(f"CANCEL: {order.unwrap()}")
-                    elif is_closed:
+                        self._log.info(f"CANCEL: {order}")
+                        if canceling is not None and canceling.success:
+                            order = self._next_order_state(order, canceling)
+                    elif order.is_closed:
+                        self._order_updates.pop(order_id, None)
                         order_id = None
-                        remaining = order.unwrap().remaining
+                        remaining = order.remaining
                         if remaining > min_order_amount or reduce_only:
                             order = await self._create_order(
-                                order_submit=OrderSubmit(
-                                    symbol=symbol,
-                                    instrument_id=instrument_id,
-                                    submit_type=SubmitType.CREATE,
-                                    side=side,
-                                    type=OrderType.MARKET,
+                                order_submit=msgspec.structs.replace(
+                                    market_template,
                                     amount=remaining,
-                                    position_side=position_side,
-                                    kwargs=kwargs,
+                                    uuid=UUID4().value,
                                 ),
                                 account_type=account_type,
                             )
                             if order.success:
                                 algo_order.orders.append(order.uuid)
-                                self._cache._order_status_update(algo_order)
+                                now = loop.time()
+                                if now - last_flush >= self.ALGO_STATUS_FLUSH_INTERVAL:
+                                    self._cache._order_status_update(algo_order)
+                                    last_flush = now
                             else:
                                 algo_order.status = AlgoOrderStatus.FAILED
                                 self._cache._order_status_update(algo_order)
@@ -424,45 +713,57 @@ class ExecutionManagementSystem(ABC):
                                 )
                                 break
                         else:
-                            if amount_list:
-                                amount_list[-1] += remaining
-                    await asyncio.sleep(check_interval)
-                    elapsed_time += check_interval
+                            if tick_list:
+                                remaining_ticks, remaining_residual = self._amount_to_ticks(
+                                    symbol, remaining
+                                )
+                                tick_list[-1] += remaining_ticks
+                                residual += remaining_residual
+                    if order_id:
+                        # wake up on the next status update instead of polling
+                        start = loop.time()
+                        order = await self._wait_order_update(
+                            order_id, check_interval, order
+                        )
+                        elapsed_time += loop.time() - start
+                    else:
+                        # the slice closed, pace the next one by check_interval as before
+                        await asyncio.sleep(check_interval)
+                        elapsed_time += check_interval
                 else:
                     price = self._cal_limit_order_price(
                         symbol=symbol,
                         side=side,
                         market=market,
                     )
-                    amount = amount_list.pop()
-                    if amount_list:
-                        order_submit = OrderSubmit(
-                            symbol=symbol,
-                            instrument_id=instrument_id,
-                            submit_type=SubmitType.CREATE,
-                            type=OrderType.LIMIT,
-                            side=side,
+                    amount = Decimal(tick_list.pop()) * step_decimal
+                    if residual:
+                        amount += residual
+                        residual = Decimal(0)
+                    if tick_list:
+                        order_submit = msgspec.structs.replace(
+                            limit_template,
                             amount=amount,
                             price=price,
-                            position_side=position_side,
-                            kwargs=kwargs,
+                            uuid=UUID4().value,
                         )
                     else:
-                        order_submit = OrderSubmit(
-                            symbol=symbol,
-                            instrument_id=instrument_id,
-                            submit_type=SubmitType.CREATE,
-                            type=OrderType.MARKET,
-                            side=side,
+                        order_submit = msgspec.structs.replace(
+                            market_template,
                             amount=amount,
-                            position_side=position_side,
-                            kwargs=kwargs,
+                            uuid=UUID4().value,
                         )
                     order = await self._create_order(order_submit, account_type)
                     if order.success:
                         order_id = order.uuid
+                        self._order_updates[order_id] = asyncio.Queue()
+                        # an update may have been published before the create returned
+                        order = self._cache.get_order(order_id).value_or(order)
                         algo_order.orders.append(order_id)
-                        self._cache._order_status_update(algo_order)
+                        now = loop.time()
+                        if now - last_flush >= self.ALGO_STATUS_FLUSH_INTERVAL:
+                            self._cache._order_status_update(algo_order)
+                            last_flush = now
                         await asyncio.sleep(wait - elapsed_time)
                         elapsed_time = 0
                     else:
@@ -484,17 +785,23 @@ class ExecutionManagementSystem(ABC):
             algo_order.status = AlgoOrderStatus.CANCELING
             self._cache._order_status_update(algo_order)
 
-            open_orders = self._cache.get_open_orders(symbol=symbol)
-            for uuid in open_orders.copy():
-                await self._cancel_order(
-                    order_submit=OrderSubmit(
-                        symbol=symbol,
-                        instrument_id=instrument_id,
-                        submit_type=SubmitType.CANCEL,
-                        uuid=uuid,
-                    ),
-                    account_type=account_type,
-                )
+            # cancel concurrently, the connector limiter still throttles the requests
+            open_orders = list(self._cache.get_open_orders(symbol=symbol))
+            results = await asyncio.gather(
+                *(
+                    self._cancel_order(
+                        order_submit=msgspec.structs.replace(cancel_template, uuid=uuid),
+                        account_type=account_type,
+                    )
+                    for uuid in open_orders
+                ),
+                return_exceptions=True,
+            )
+            for uuid, result in zip(open_orders, results):
+                if isinstance(result, BaseException):
+                    self._log.error(
+                        f"TWAP CANCEL FAILED: uuid: {uuid}, symbol: {symbol}, {type(result).__name__}: {result}"
+                    )
 
             algo_order.status = AlgoOrderStatus.CANCELED
             self._cache._order_status_update(algo_order)
@@ -502,6 +809,9 @@ class ExecutionManagementSystem(ABC):
             self._log.info(
                 f"TWAP ORDER CANCELLED: symbol: {symbol}, side: {side}, uuid: {twap_uuid}"
             )
+        finally:
+            if order_id:
+                self._order_updates.pop(order_id, None)
 
     async def _create_adp_maker_order(
         self, order_submit: OrderSubmit, account_type: AccountType
@@ -544,35 +854,62 @@ class ExecutionManagementSystem(ABC):
         self._task_manager.cancel_task(uuid)
 
     async def _handle_submit_order(
-        self, account_type: AccountType, queue: asyncio.Queue[OrderSubmit]
+        self, account_type: AccountType, queue: SPSCQueue[OrderSubmit]
     ):
         """
-        Handle the order submit
+        Handle the order submits of one worker queue, orders are processed in submit order.
+        The submits already queued are drained together, consecutive CREATE submits among
+        them are sent concurrently instead of one round-trip after another as long as
+        their symbols differ, a second CREATE of the same symbol waits for the first
         """
-        submit_handlers = {
-            SubmitType.CANCEL: self._cancel_order,
-            SubmitType.CREATE: self._create_order,
-            SubmitType.TWAP: self._create_twap_order,
-            SubmitType.CANCEL_TWAP: self._cancel_twap_order,
-            SubmitType.STOP_LOSS: self._create_stop_loss_order,
-            SubmitType.TAKE_PROFIT: self._create_take_profit_order,
-        }
-
         self._log.debug(f"Handling orders for account type: {account_type}")
         while True:
-            order_submit = await queue.get()
-            self._log.debug(f"[ORDER SUBMIT]: {order_submit}")
-            handler = submit_handlers[order_submit.submit_type]
-            await handler(order_submit, account_type)
-            queue.task_done()
+            submits = [await queue.get()]
+            while len(submits) < self.MAX_SUBMIT_BATCH and not queue.empty():
+                submits.append(queue.get_nowait())
+
+            creates: List[Tuple[AccountType, OrderSubmit]] = []
+            create_symbols = set()
+            debug = self._log.should_log(DEBUG)
+            for order_submit in submits:
+                if debug:
+                    self._log.debug(f"[ORDER SUBMIT]: {order_submit}")
+                if order_submit.submit_type == SubmitType.CREATE:
+                    if order_submit.symbol in create_symbols:
+                        await self._flush_creates(creates)
+                        creates = []
+                        create_symbols.clear()
+                    creates.append((account_type, order_submit))
+                    create_symbols.add(order_submit.symbol)
+                    continue
+                if creates:
+                    await self._flush_creates(creates)
+                    creates = []
+                    create_symbols.clear()
+                await self._dispatch[order_submit.submit_type](
+                    order_submit, account_type
+                )
+            if creates:
+                await self._flush_creates(creates)
+
+    async def _flush_creates(self, creates: List[Tuple[AccountType, OrderSubmit]]):
+        """
+        Send the pending CREATE submits, a single one is awaited directly
+        """
+        if len(creates) == 1:
+            account_type, order_submit = creates[0]
+            await self._create_order(order_submit, account_type)
+        else:
+            await self._gather_create_orders(creates)
 
     async def start(self):
         """
         Start the order submit
         """
-        for account_type in self._order_submit_queues.keys():
-            self._task_manager.create_task(
-                self._handle_submit_order(
-                    account_type, self._order_submit_queues[account_type]
+        name = type(self).__name__
+        for account_type, queues in self._order_submit_queues.items():
+            for idx, queue in enumerate(queues):
+                self._task_manager.create_task(
+                    self._handle_submit_order(account_type, queue),
+                    name=f"{name}-{account_type}-submit-{idx}",
                 )
-            )
@@ -28,21 +28,58 @@ class OrderManagementSystem(ABC):
         self._registry = registry
 
         self._order_msg_queue: asyncio.Queue[Order] = asyncio.Queue()
+        self._queued_order_msgs = 0  # queued or being processed by `_handle_order_event`
 
     def _add_order_msg(self, order: Order):
         """
-        Add an order to the order message queue
+        Add an order to the order message queue, updates whose order id is already
+        linked to its submit uuid are handled inline when nothing is queued ahead
         """
+        if not self._queued_order_msgs:
+            uuid = self._registry.get_uuid(order.id)
+            if uuid:
+                order.uuid = uuid
+                try:
+                    self._handle_order(order)
+                except Exception as e:
+                    self._log.error(f"Error in handle_order_event: {e}")
+                return
+        self._queued_order_msgs += 1
         self._order_msg_queue.put_nowait(order)
 
+    def _handle_order(self, order: Order):
+        match order.status:
+            case OrderStatus.ACCEPTED:
+                self._log.debug(f"ORDER STATUS ACCEPTED: {str(order)}")
+                self._cache._order_status_update(order)
+                self._msgbus.send(endpoint="accepted", msg=order)
+            case OrderStatus.PARTIALLY_FILLED:
+                self._log.debug(f"ORDER STATUS PARTIALLY FILLED: {str(order)}")
+                self._cache._order_status_update(order)
+                self._msgbus.send(endpoint="partially_filled", msg=order)
+            case OrderStatus.CANCELED:
+                self._log.debug(f"ORDER STATUS CANCELED: {str(order)}")
+                self._cache._order_status_update(order)
+                self._msgbus.send(endpoint="canceled", msg=order)
+                self._registry.remove_order(order)
+            case OrderStatus.FILLED:
+                self._log.debug(f"ORDER STATUS FILLED: {str(order)}")
+                self._cache._order_status_update(order)
+                self._msgbus.send(endpoint="filled", msg=order)
+                self._registry.remove_order(order)
+            case OrderStatus.EXPIRED:
+                self._log.debug(f"ORDER STATUS EXPIRED: {str(order)}")
+                self._cache._order_status_update(order)
+        # wake up the algo orders (e.g. TWAP) waiting on this order
+        self._msgbus.publish(topic="order_status", msg=order)
+
     async def _handle_order_event(self):
         """
         Handle the order event
         """
         while True:
+            order = await self._order_msg_queue.get()
             try:
-                order = await self._order_msg_queue.get()
-
                 # handle the ACCEPTED, PARTIALLY_FILLED, CANCELED, FILLED, EXPIRED arived early than the order submit uuid
                 uuid = self._registry.get_uuid(order.id)
                 if not uuid:
@@ -50,31 +87,12 @@ class OrderManagementSystem(ABC):
                     uuid = self._registry.get_uuid(order.id)
                 order.uuid = uuid
 
-                match order.status:
-                    case OrderStatus.ACCEPTED:
-                        self._log.debug(f"ORDER STATUS ACCEPTED: {str(order)}")
-                        self._cache._order_status_update(order)
-                        self._msgbus.send(endpoint="accepted", msg=order)
-                    case OrderStatus.PARTIALLY_FILLED:
-                        self._log.debug(f"ORDER STATUS PARTIALLY FILLED: {str(order)}")
-                        self._cache._order_status_update(order)
-                        self._msgbus.send(endpoint="partially_filled", msg=order)
-                    case OrderStatus.CANCELED:
-                        self._log.debug(f"ORDER STATUS CANCELED: {str(order)}")
-                        self._cache._order_status_update(order)
-                        self._msgbus.send(endpoint="canceled", msg=order)
-                        self._registry.remove_order(order)
-                    case OrderStatus.FILLED:
-                        self._log.debug(f"ORDER STATUS FILLED: {str(order)}")
-                        self._cache._order_status_update(order)
-                        self._msgbus.send(endpoint="filled", msg=order)
-                        self._registry.remove_order(order)
-                    case OrderStatus.EXPIRED:
-                        self._log.debug(f"ORDER STATUS EXPIRED: {str(order)}")
-                        self._cache._order_status_update(order)
-                self._order_msg_queue.task_done()
+                self._handle_order(order)
             except Exception as e:
                 self._log.error(f"Error in handle_order_event: {e}")
+            finally:
+                self._queued_order_msgs -= 1
+                self._order_msg_queue.task_done()
 
     async def start(self):
         """
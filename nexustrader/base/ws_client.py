@@ -1,8 +1,11 @@
+import ssl
 import asyncio
+import random
+import certifi
 import orjson
 from abc import ABC, abstractmethod
 from typing import Any
-from typing import Callable, Literal
+from typing import Callable, Literal, Dict, List
 
 
 from aiolimiter import AsyncLimiter
@@ -18,22 +21,26 @@ from picows import (
 )
 from nexustrader.core.nautilius_core import LiveClock
 
+# one context for every websocket, the CA bundle is loaded once instead of on each (re)connect
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
 class Listener(WSListener):
     """WebSocket listener implementation that handles connection events and message frames.
     
     Inherits from picows.WSListener to provide WebSocket event handling functionality.
     """
     
-    def __init__(self, logger, specific_ping_msg=None, *args, **kwargs):
+    def __init__(self, logger, callback, specific_ping_msg=None, *args, **kwargs):
         """Initialize the WebSocket listener.
         
         Args:
             logger: Logger instance for logging events
+            callback: Handler called synchronously with the raw bytes of each text frame
             specific_ping_msg: Optional custom ping message
         """
         super().__init__(*args, **kwargs)
         self._log = logger
-        self.msg_queue = asyncio.Queue()
+        self._callback = callback
         self._specific_ping_msg = specific_ping_msg
 
     def send_user_specific_ping(self, transport: WSTransport) -> None:
@@ -73,15 +80,16 @@ class Listener(WSListener):
             frame (picows.WSFrame): Received WebSocket frame
         """
         try:
+            # market data text frames dominate, so they are matched first
             match frame.msg_type:
+                case WSMsgType.TEXT:
+                    # Dispatch raw bytes to the handler directly, no queue hop
+                    self._callback(frame.get_payload_as_bytes())
+                    return
                 case WSMsgType.PING:
                     # Only send pong if auto_pong is disabled
                     transport.send_pong(frame.get_payload_as_bytes())
                     return
-                case WSMsgType.TEXT:
-                    # Queue raw bytes for handler to decode
-                    self.msg_queue.put_nowait(frame.get_payload_as_bytes())
-                    return
                 case WSMsgType.CLOSE:
                     close_code = frame.get_close_code()
                     close_msg = frame.get_close_message()
@@ -94,6 +102,10 @@ class Listener(WSListener):
 
 
 class WSClient(ABC):
+    MAX_RECONNECT_INTERVAL = 30
+    # a connection up for longer than this resets the reconnect backoff
+    STABLE_CONNECTION_SECS = 60
+
     def __init__(
         self,
         url: str,
@@ -120,7 +132,8 @@ class WSClient(ABC):
         self._enable_auto_ping = enable_auto_ping
         self._listener: Listener = None
         self._transport = None
-        self._subscriptions = {}
+        self._connect_task: asyncio.Task | None = None
+        self._subscriptions: Dict[Any, Any] = {}  # subscription id -> subscribe params replayed by `_resubscribe`
         self._limiter = limiter
         self._callback = handler
         if auto_ping_strategy == "ping_when_idle":
@@ -135,10 +148,13 @@ class WSClient(ABC):
         return self._transport and self._listener
 
     async def _connect(self):
-        WSListenerFactory = lambda: Listener(self._log, self._specific_ping_msg)  # noqa: E731
+        WSListenerFactory = lambda: Listener(  # noqa: E731
+            self._log, self._callback, self._specific_ping_msg
+        )
         self._transport, self._listener = await ws_connect(
             WSListenerFactory,
             self._url,
+            ssl_context=_SSL_CONTEXT if self._url.startswith("wss://") else None,
             enable_auto_ping=self._enable_auto_ping,
             auto_ping_idle_timeout=self._ping_idle_timeout,
             auto_ping_reply_timeout=self._ping_reply_timeout,
@@ -147,37 +163,69 @@ class WSClient(ABC):
         )
 
     async def connect(self):
-        if not self.connected:
+        if self.connected:
+            return
+        # concurrent subscribes wait on one connect attempt instead of each dialing,
+        # and all resume together once it is done
+        if self._connect_task is None:
+            self._connect_task = asyncio.create_task(self._connect_once())
+        await asyncio.shield(self._connect_task)
+
+    async def _connect_once(self):
+        try:
             await self._connect()
-            self._task_manager.create_task(self._msg_handler(self._listener.msg_queue))
             self._task_manager.create_task(self._connection_handler())
+        finally:
+            self._connect_task = None
 
     async def _connection_handler(self):
+        loop = asyncio.get_running_loop()
+        delay = self._reconnect_interval
         while True:
+            connected_at = None
             try:
                 if not self.connected:
                     await self._connect()
-                    self._task_manager.create_task(
-                        self._msg_handler(self._listener.msg_queue)
-                    )
                     await self._resubscribe()
+                connected_at = loop.time()
                 await self._transport.wait_disconnected()
             except Exception as e:
                 self._log.error(f"Connection error: {e}")
             finally:
+                # a connection that held up resets the backoff, failing or quickly
+                # dropped connections double it up to `MAX_RECONNECT_INTERVAL`
+                if (
+                    connected_at is not None
+                    and loop.time() - connected_at > self.STABLE_CONNECTION_SECS
+                ):
+                    delay = self._reconnect_interval
                 self._log.debug("Websocket reconnecting...")
                 self._transport, self._listener = None, None
-                await asyncio.sleep(self._reconnect_interval)
+                # jitter spreads out the clients dropped at the same moment
+                await asyncio.sleep(delay * random.uniform(1, 1.5))
+                delay = min(delay * 2, self.MAX_RECONNECT_INTERVAL)
 
     async def _send(self, payload: dict):
+        await self._send_bytes(orjson.dumps(payload))
+
+    async def _send_bytes(self, raw: bytes):
         await self._limiter.acquire()
-        self._transport.send(WSMsgType.TEXT, orjson.dumps(payload))
+        self._transport.send(WSMsgType.TEXT, raw)
 
-    async def _msg_handler(self, queue: asyncio.Queue):
-        while True:
-            msg = await queue.get()
-            self._callback(msg)
-            queue.task_done()
+    async def _send_batch(self, raws: List[bytes]):
+        """
+        Send pre-encoded frames back-to-back, the limiter is acquired once for the
+        whole batch when it fits in the rate, otherwise frame by frame
+        """
+        if not raws:
+            return
+        if len(raws) > self._limiter.max_rate:
+            for raw in raws:
+                await self._send_bytes(raw)
+            return
+        await self._limiter.acquire(len(raws))
+        for raw in raws:
+            self._transport.send(WSMsgType.TEXT, raw)
 
     def disconnect(self):
         if self.connected:
@@ -53,3 +53,6 @@ class Config:
     zero_mq_signal_config: ZeroMQSignalConfig | None = None
     cache_sync_interval: int = 60
     cache_expire_time: int = 3600
+    submit_queue_max: int = 4096
+    submit_workers: int = 1
+    order_timeout: float | None = None
@@ -90,6 +90,7 @@ class SubmitType(Enum):
     CANCEL_VWAP = 5
     STOP_LOSS = 6
     TAKE_PROFIT = 7
+    BATCH = 8
 
 
 class EventType(Enum):
@@ -235,6 +236,7 @@ class OptionType(Enum):
 
 STATUS_TRANSITIONS: Dict[OrderStatus, List[OrderStatus]] = {
     OrderStatus.PENDING: [
+        OrderStatus.PENDING,
         OrderStatus.CANCELED,
         OrderStatus.CANCELING,
         OrderStatus.ACCEPTED,
@@ -242,6 +244,7 @@ STATUS_TRANSITIONS: Dict[OrderStatus, List[OrderStatus]] = {
         OrderStatus.CANCELED,
         OrderStatus.FILLED,
         OrderStatus.CANCEL_FAILED,
+        OrderStatus.FAILED,
     ],
     OrderStatus.CANCELING: [
         OrderStatus.CANCELED,
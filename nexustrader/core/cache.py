@@ -1,9 +1,10 @@
+import heapq
 import msgspec
 import asyncio
 import aiosqlite
 import sqlite3
 
-from typing import Dict, Set, Type, List, Optional
+from typing import Any, Dict, Set, Type, List, Optional, Tuple
 from collections import defaultdict
 from returns.maybe import maybe
 from pathlib import Path
@@ -20,13 +21,47 @@ from nexustrader.schema import (
     AccountBalance,
     Balance,
 )
-from nexustrader.constants import STATUS_TRANSITIONS, AccountType, KlineInterval
+from nexustrader.constants import STATUS_TRANSITIONS, AccountType, KlineInterval, OrderStatus
 from nexustrader.core.entity import TaskManager, RedisClient
-from nexustrader.core.log import SpdLog
+from nexustrader.core.log import SpdLog, DEBUG
 from nexustrader.core.nautilius_core import LiveClock, MessageBus
 from nexustrader.constants import StorageBackend
 
+# stored values are only read back by this process, msgpack is smaller and faster than json
+_ENCODER = msgspec.msgpack.Encoder()
+_DECODERS = {
+    Order: msgspec.msgpack.Decoder(Order),
+    Position: msgspec.msgpack.Decoder(Position),
+    AlgoOrder: msgspec.msgpack.Decoder(AlgoOrder),
+}
+
+
+def _bulk_encode(objs: List[Order | Position | AlgoOrder]) -> List[bytes]:
+    # runs in an executor thread, the module level encode does not share _ENCODER
+    return [msgspec.msgpack.encode(obj) for obj in objs]
+
+
+def _sym_set(d: Dict[Any, Set[str]], key: Any) -> Set[str]:
+    # get-or-create without the defaultdict.__missing__ detour on the hit path
+    s = d.get(key)
+    if s is None:
+        d[key] = s = set()
+    return s
+
+
 class AsyncCache:
+    PIPELINE_BATCH = 1000  # max commands buffered in a redis pipeline before it is executed
+    ENCODE_OFFLOAD_MIN = 256  # min objects in a sync batch before encoding moves off the loop
+    FLUSH_DELAY = 0.1  # seconds changes are batched for after the first one before they are flushed
+    _DIRTY_SETS = (
+        "_dirty_orders",
+        "_dirty_algo_orders",
+        "_dirty_positions",
+        "_dirty_open_order_exchanges",
+        "_dirty_symbol_orders",
+        "_dirty_symbol_open_orders",
+    )
+
     def __init__(
         self,
         strategy_id: str,
@@ -43,21 +78,48 @@ class AsyncCache:
         self._storage_backend = storage_backend
         self._db_path = db_path
 
+        # redis keys share these prefixes, they are built once instead of per access
+        self._key_prefix = f"strategy:{strategy_id}:user_id:{user_id}"
+        self._orders_key = f"{self._key_prefix}:orders"
+        self._algo_orders_key = f"{self._key_prefix}:algo_orders"
+        # uuid scored by order timestamp, bounds the warm load to the unexpired orders
+        self._orders_ts_key = f"{self._orders_key}:ts"
+        self._algo_orders_ts_key = f"{self._algo_orders_key}:ts"
+        self._exchange_key_prefixes: Dict[ExchangeType, str] = {}
+        self._symbol_orders_keys: Dict[str, str] = {}  # symbol -> symbol_orders key
+        self._symbol_open_orders_keys: Dict[str, str] = {}  # symbol -> symbol_open_orders key
+        self._last_synced_sets: Dict[str, frozenset] = {}  # redis set key -> members last written
+
         self._log = SpdLog.get_logger(
             name=type(self).__name__, level="DEBUG", flush=True
         )
         self._clock = LiveClock()
 
         # in-memory save
-        self._mem_closed_orders: Dict[str, bool] = {}  # uuid -> bool
         self._mem_orders: Dict[str, Order] = {}  # uuid -> Order
         self._mem_algo_orders: Dict[str, AlgoOrder] = {}  # uuid -> AlgoOrder
-        self._mem_open_orders: Dict[ExchangeType, Set[str]] = defaultdict(set)  # exchange_id -> set(uuid)
-        self._mem_symbol_open_orders: Dict[str, Set[str]] = defaultdict(set)  # symbol -> set(uuid)
-        self._mem_symbol_orders: Dict[str, Set[str]] = defaultdict(set)  # symbol -> set(uuid)
+        self._mem_open_orders: Dict[ExchangeType, Set[str]] = {}  # exchange_id -> set(uuid)
+        self._mem_symbol_orders: Dict[str, Set[str]] = {}  # symbol -> set(uuid)
+        self._mem_symbol_open_orders: Dict[str, Set[str]] = {}  # symbol -> set(uuid)
         self._mem_positions: Dict[str, Position] = {}  # symbol -> Position
         self._mem_account_balance: Dict[AccountType, AccountBalance] = defaultdict(AccountBalance)
 
+        # keys changed since the last sync, only these are written to the storage
+        self._dirty_orders: Set[str] = set()  # uuid
+        self._dirty_algo_orders: Set[str] = set()  # uuid
+        self._dirty_positions: Set[str] = set()  # symbol
+        self._dirty_open_order_exchanges: Set[ExchangeType] = set()
+        self._dirty_symbol_orders: Set[str] = set()  # symbol
+        self._dirty_symbol_open_orders: Set[str] = set()  # symbol
+
+        # (timestamp, uuid) min-heaps, expiry cleanup only pops the expired prefix
+        self._order_expiry_heap: List[Tuple[int, str]] = []
+        self._algo_order_expiry_heap: List[Tuple[int, str]] = []
+
+        # set on every change, wakes the background flush; syncs never overlap
+        self._dirty_event = asyncio.Event()
+        self._sync_lock = asyncio.Lock()
+
         # set params
         self._sync_interval = sync_interval  # sync interval
         self._expire_time = expire_time  # expire time
@@ -69,22 +131,69 @@ class AsyncCache:
         self._trade_cache: Dict[str, Trade] = {}
 
         self._msgbus = msgbus
-        self._msgbus.subscribe(topic="kline", handler=self._update_kline_cache)
-        self._msgbus.subscribe(topic="bookl1", handler=self._update_bookl1_cache)
-        self._msgbus.subscribe(topic="trade", handler=self._update_trade_cache)
+        # market data handlers run per tick, they store through the dict's bound __setitem__
+        # instead of going through the _update_*_cache methods and their self lookups
+        self._msgbus.subscribe(
+            topic="kline",
+            handler=lambda kline, _store=self._kline_cache.__setitem__: _store(
+                f"{kline.symbol}-{kline.interval.value}", kline
+            ),
+        )
+        self._msgbus.subscribe(
+            topic="bookl1",
+            handler=lambda bookl1, _store=self._bookl1_cache.__setitem__: _store(
+                bookl1.symbol, bookl1
+            ),
+        )
+        self._msgbus.subscribe(
+            topic="trade",
+            handler=lambda trade, _store=self._trade_cache.__setitem__: _store(
+                trade.symbol, trade
+            ),
+        )
         
         self._storage_initialized = False
 
     ################# # base functions ####################
 
     def _encode(self, obj: Order | Position | AlgoOrder) -> bytes:
-        return msgspec.json.encode(obj)
+        return _ENCODER.encode(obj)
 
     def _decode(
         self, data: bytes, obj_type: Type[Order | Position | AlgoOrder]
     ) -> Order | Position | AlgoOrder:
-        return msgspec.json.decode(data, type=obj_type)
+        try:
+            return _DECODERS[obj_type].decode(data)
+        except msgspec.DecodeError:
+            # values synced before the switch to msgpack are json
+            return msgspec.json.decode(data, type=obj_type)
     
+    def _exchange_key_prefix(self, exchange: ExchangeType) -> str:
+        prefix = self._exchange_key_prefixes.get(exchange)
+        if prefix is None:
+            prefix = self._exchange_key_prefixes[exchange] = (
+                f"{self._key_prefix}:exchange:{exchange.value}"
+            )
+        return prefix
+
+    def _symbol_orders_key(self, symbol: str) -> str:
+        key = self._symbol_orders_keys.get(symbol)
+        if key is None:
+            exchange = InstrumentId.from_str(symbol).exchange
+            key = self._symbol_orders_keys[symbol] = (
+                f"{self._exchange_key_prefix(exchange)}:symbol_orders:{symbol}"
+            )
+        return key
+
+    def _symbol_open_orders_key(self, symbol: str) -> str:
+        key = self._symbol_open_orders_keys.get(symbol)
+        if key is None:
+            exchange = InstrumentId.from_str(symbol).exchange
+            key = self._symbol_open_orders_keys[symbol] = (
+                f"{self._exchange_key_prefix(exchange)}:symbol_open_orders:{symbol}"
+            )
+        return key
+
     async def _init_storage(self):
         """Initialize the storage backend"""
         if self._storage_backend == StorageBackend.REDIS:
@@ -151,132 +260,338 @@ class AsyncCache:
     async def start(self):
         """Start the cache"""
         await self._init_storage()
+        if self._storage_backend == StorageBackend.REDIS:
+            await self._warm_load_from_redis()
         self._task_manager.create_task(self._periodic_sync())
+        self._task_manager.create_task(self._flush_dirty())
 
-    async def _periodic_sync(self):
-        """Periodically sync the cache"""
-        while not self._shutdown_event.is_set():
+    async def _warm_load_from_redis(self):
+        """
+        Load the unexpired orders and algo orders, so the first get_order calls are served
+        from memory. The timestamp index bounds the load to the expiry window, the orders
+        hash itself keeps the full history. The orders are read-only history: the registry
+        knows none of their ids, so they stay out of the open and symbol order sets.
+        Positions are not preloaded, get_all_positions deliberately only reports the
+        positions of this run
+        """
+        expire_before = self._clock.timestamp_ms() - self._expire_time * 1000
+        async with self._r_async.pipeline(transaction=False) as pipe:
+            for ts_key in (self._orders_ts_key, self._algo_orders_ts_key):
+                pipe.zremrangebyscore(ts_key, "-inf", f"({expire_before}")
+                pipe.zrangebyscore(ts_key, expire_before, "+inf")
+            _, order_uuids, _, algo_order_uuids = await pipe.execute()
+        if not order_uuids and not algo_order_uuids:
+            return
+
+        async with self._r_async.pipeline(transaction=False) as pipe:
+            if order_uuids:
+                pipe.hmget(self._orders_key, order_uuids)
+            if algo_order_uuids:
+                pipe.hmget(self._algo_orders_key, algo_order_uuids)
+            results = iter(await pipe.execute())
+
+        for uuids, obj_type, mem_dict in (
+            (order_uuids, Order, self._mem_orders),
+            (algo_order_uuids, AlgoOrder, self._mem_algo_orders),
+        ):
+            if not uuids:
+                continue
+            for uuid, data in zip(uuids, next(results)):
+                uuid = uuid.decode()
+                if data is None or uuid in mem_dict:
+                    continue
+                order = self._decode(data, obj_type)
+                mem_dict[uuid] = order
+                self._track_expiry(order)
+        self._log.debug(
+            f"warm loaded {len(self._mem_orders)} orders, {len(self._mem_algo_orders)} algo orders from redis"
+        )
+
+    async def _sync(self):
+        """Sync the dirty entries to the storage backend, one sync at a time"""
+        async with self._sync_lock:
             if self._storage_backend == StorageBackend.REDIS:
                 await self._sync_to_redis()
             elif self._storage_backend == StorageBackend.SQLITE:
                 await self._sync_to_sqlite()
+
+    async def _periodic_sync(self):
+        """Periodically sync the cache, a safety net behind the background flush"""
+        while not self._shutdown_event.is_set():
+            await self._sync()
             self._cleanup_expired_data()
             await asyncio.sleep(self._sync_interval)
 
-    async def _sync_to_redis(self):
-        """Sync the cache to Redis"""
-        self._log.debug("syncing to redis")
-        for uuid, order in self._mem_orders.copy().items():
-            orders_key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:orders"
-            await self._r_async.hset(orders_key, uuid, self._encode(order))
-        
-        for uuid, algo_order in self._mem_algo_orders.copy().items():
-            algo_orders_key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:algo_orders"
-            await self._r_async.hset(algo_orders_key, uuid, self._encode(algo_order))
-
-        for exchange, open_order_uuids in self._mem_open_orders.copy().items():
-            open_orders_key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{exchange.value}:open_orders"
+    async def _flush_dirty(self):
+        """Flush changes shortly after they happen instead of waiting for the periodic sync"""
+        while not self._shutdown_event.is_set():
+            await self._dirty_event.wait()
+            await asyncio.sleep(self.FLUSH_DELAY)
+            # cleared before syncing, changes made during the sync trigger the next flush
+            self._dirty_event.clear()
+            try:
+                await self._sync()
+            except Exception as e:
+                # the dirty sets were restored, the next flush or periodic sync retries them
+                self._log.error(f"Error flushing cache: {type(e).__name__}: {e}")
 
-            await self._r_async.delete(open_orders_key)
+    async def _sync_to_redis(self):
+        """Sync the entries changed since the last sync to Redis, all writes go through one pipeline"""
+        dirty = self._take_dirty()
+        try:
+            orders = {
+                uuid: order
+                for uuid in dirty["_dirty_orders"]
+                if (order := self._mem_orders.get(uuid))
+            }
+            algo_orders = {
+                uuid: algo_order
+                for uuid in dirty["_dirty_algo_orders"]
+                if (algo_order := self._mem_algo_orders.get(uuid))
+            }
+            positions = {
+                f"{self._exchange_key_prefix(position.exchange)}:symbol_positions:{symbol}": position
+                for symbol in dirty["_dirty_positions"]
+                if (position := self._mem_positions.get(symbol))
+            }
+            order_ts = {
+                uuid: order.timestamp
+                for uuid, order in orders.items()
+                if order.timestamp is not None
+            }
+            algo_order_ts = {
+                uuid: algo_order.timestamp
+                for uuid, algo_order in algo_orders.items()
+                if algo_order.timestamp is not None
+            }
+            encoded = iter(
+                await self._encode_many(
+                    [*orders.values(), *algo_orders.values(), *positions.values()]
+                )
+            )
+            orders = dict(zip(orders, encoded))
+            algo_orders = dict(zip(algo_orders, encoded))
+            positions = dict(zip(positions, encoded))
+
+            async with self._r_async.pipeline(transaction=False) as pipe:
+                # each hash is written with a single multi-field HSET
+                if orders:
+                    pipe.hset(self._orders_key, mapping=orders)
+                if order_ts:
+                    pipe.zadd(self._orders_ts_key, order_ts)
+
+                if algo_orders:
+                    pipe.hset(self._algo_orders_key, mapping=algo_orders)
+                if algo_order_ts:
+                    pipe.zadd(self._algo_orders_ts_key, algo_order_ts)
+
+                # sets are recorded as synced only once the whole pipeline went through
+                synced_sets: Dict[str, frozenset] = {}
+                for exchange in dirty["_dirty_open_order_exchanges"]:
+                    self._queue_set_rewrite(
+                        pipe,
+                        f"{self._exchange_key_prefix(exchange)}:open_orders",
+                        self._mem_open_orders.get(exchange),
+                        synced_sets,
+                    )
+                    await self._flush_pipeline(pipe)
+
+                for symbol in dirty["_dirty_symbol_orders"]:
+                    self._queue_set_rewrite(
+                        pipe,
+                        self._symbol_orders_key(symbol),
+                        self._mem_symbol_orders.get(symbol),
+                        synced_sets,
+                    )
+                    await self._flush_pipeline(pipe)
+
+                for symbol in dirty["_dirty_symbol_open_orders"]:
+                    self._queue_set_rewrite(
+                        pipe,
+                        self._symbol_open_orders_key(symbol),
+                        self._mem_symbol_open_orders.get(symbol),
+                        synced_sets,
+                    )
+                    await self._flush_pipeline(pipe)
+
+                # Add position sync, all positions go in one MSET
+                if positions:
+                    pipe.mset(positions)
+
+                await pipe.execute()
+            self._last_synced_sets.update(synced_sets)
+            if self._log.should_log(DEBUG):
+                self._log.debug(
+                    f"synced to redis: {len(orders)} orders, {len(algo_orders)} algo orders, {len(positions)} positions"
+                )
+        except BaseException:
+            self._restore_dirty(dirty)
+            raise
 
-            if open_order_uuids:
-                await self._r_async.sadd(open_orders_key, *open_order_uuids)
+    def _queue_set_rewrite(
+        self,
+        pipe,
+        key: str,
+        members: Set[str] | None,
+        synced_sets: Dict[str, frozenset],
+    ):
+        """
+        Queue the unlink + sadd rewrite of a redis set unless its members are the ones
+        last written, the pair is queued back to back so a flush never splits it
+        """
+        current = frozenset(members or ())
+        if self._last_synced_sets.get(key) == current:
+            return
+        pipe.unlink(key)
+        if current:
+            pipe.sadd(key, *current)
+        synced_sets[key] = current
+
+    async def _encode_many(
+        self, objs: List[Order | Position | AlgoOrder]
+    ) -> List[bytes]:
+        """
+        Encode a sync batch, large batches are encoded in the default executor so the
+        event loop keeps serving market data while they are serialized
+        """
+        if len(objs) < self.ENCODE_OFFLOAD_MIN:
+            return [_ENCODER.encode(obj) for obj in objs]
+        return await asyncio.get_running_loop().run_in_executor(None, _bulk_encode, objs)
 
-        for symbol, uuids in self._mem_symbol_orders.copy().items():
-            instrument_id = InstrumentId.from_str(symbol)
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_orders:{symbol}"
-            await self._r_async.delete(key)
-            if uuids:
-                await self._r_async.sadd(key, *uuids)
+    async def _flush_pipeline(self, pipe):
+        """Execute the pipeline once it holds PIPELINE_BATCH commands, bounding its memory"""
+        if len(pipe) >= self.PIPELINE_BATCH:
+            await pipe.execute()
 
-        for symbol, uuids in self._mem_symbol_open_orders.copy().items():
-            instrument_id = InstrumentId.from_str(symbol)
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_open_orders:{symbol}"
-            await self._r_async.delete(key)
-            if uuids:
-                await self._r_async.sadd(key, *uuids)
-
-        # Add position sync        
-        for symbol, position in self._mem_positions.copy().items():
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{position.exchange.value}:symbol_positions:{symbol}"
-            await self._r_async.set(key, self._encode(position))
-    
     async def _sync_to_sqlite(self):
-        """Sync the cache to SQLite"""
-        async with self._db_async.cursor() as cursor:
-            # sync orders
-            for uuid, order in self._mem_orders.copy().items():
-                await cursor.execute(
-                    "INSERT OR REPLACE INTO orders (uuid, strategy_id, user_id, symbol, data, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
-                    (uuid, self.strategy_id, self.user_id, order.symbol, self._encode(order), order.timestamp)
-                )
-
-            # sync algo orders
-            for uuid, algo_order in self._mem_algo_orders.copy().items():
-                await cursor.execute(
-                    "INSERT OR REPLACE INTO algo_orders (uuid, strategy_id, user_id, symbol, data, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
-                    (uuid, self.strategy_id, self.user_id, algo_order.symbol, self._encode(algo_order), algo_order.timestamp)
-                )
+        """Sync the entries changed since the last sync to SQLite"""
+        dirty = self._take_dirty()
+        try:
+            async with self._db_async.cursor() as cursor:
+                # sync orders
+                for uuid in dirty["_dirty_orders"]:
+                    if order := self._mem_orders.get(uuid):
+                        await cursor.execute(
+                            "INSERT OR REPLACE INTO orders (uuid, strategy_id, user_id, symbol, data, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+                            (uuid, self.strategy_id, self.user_id, order.symbol, self._encode(order), order.timestamp)
+                        )
 
-            # sync positions
-            for symbol, position in self._mem_positions.copy().items():
-                await cursor.execute(
-                    "INSERT OR REPLACE INTO positions (symbol, strategy_id, user_id, exchange, data) VALUES (?, ?, ?, ?, ?)",
-                    (symbol, self.strategy_id, self.user_id, position.exchange.value, self._encode(position))
-                )
+                # sync algo orders
+                for uuid in dirty["_dirty_algo_orders"]:
+                    if algo_order := self._mem_algo_orders.get(uuid):
+                        await cursor.execute(
+                            "INSERT OR REPLACE INTO algo_orders (uuid, strategy_id, user_id, symbol, data, timestamp) VALUES (?, ?, ?, ?, ?, ?)",
+                            (uuid, self.strategy_id, self.user_id, algo_order.symbol, self._encode(algo_order), algo_order.timestamp)
+                        )
 
-            # sync open orders
-            await cursor.execute("DELETE FROM open_orders WHERE strategy_id = ? AND user_id = ?",
-                               (self.strategy_id, self.user_id))
-            
-            for exchange, uuids in self._mem_open_orders.copy().items():
-                for uuid in uuids:
-                    order = self._mem_orders.get(uuid)
-                    if order:
+                # sync positions
+                for symbol in dirty["_dirty_positions"]:
+                    if position := self._mem_positions.get(symbol):
                         await cursor.execute(
-                            "INSERT INTO open_orders (uuid, exchange, symbol, strategy_id, user_id) VALUES (?, ?, ?, ?, ?)",
-                            (uuid, exchange.value, order.symbol, self.strategy_id, self.user_id)
+                            "INSERT OR REPLACE INTO positions (symbol, strategy_id, user_id, exchange, data) VALUES (?, ?, ?, ?, ?)",
+                            (symbol, self.strategy_id, self.user_id, position.exchange.value, self._encode(position))
                         )
 
-            await self._db_async.commit()
+                # sync open orders, the table is rewritten only when an open order set changed
+                if dirty["_dirty_open_order_exchanges"]:
+                    await cursor.execute("DELETE FROM open_orders WHERE strategy_id = ? AND user_id = ?",
+                                       (self.strategy_id, self.user_id))
+
+                    # rows are collected without awaiting, so the sets cannot change under the loop
+                    rows = [
+                        (uuid, exchange.value, order.symbol, self.strategy_id, self.user_id)
+                        for exchange, uuids in self._mem_open_orders.items()
+                        for uuid in uuids
+                        if (order := self._mem_orders.get(uuid))
+                    ]
+                    await cursor.executemany(
+                        "INSERT INTO open_orders (uuid, exchange, symbol, strategy_id, user_id) VALUES (?, ?, ?, ?, ?)",
+                        rows,
+                    )
+
+                await self._db_async.commit()
+        except BaseException:
+            self._restore_dirty(dirty)
+            raise
+
+    def _take_dirty(self) -> Dict[str, Set]:
+        """Swap out the dirty sets, updates made while syncing land in the fresh sets"""
+        dirty = {}
+        for name in self._DIRTY_SETS:
+            dirty[name] = getattr(self, name)
+            setattr(self, name, set())
+        return dirty
+
+    def _restore_dirty(self, dirty: Dict[str, Set]):
+        """Merge back the dirty sets of a failed sync so the next one retries them"""
+        for name in self._DIRTY_SETS:
+            getattr(self, name).update(dirty[name])
 
     def _cleanup_expired_data(self):
         """Cleanup expired data"""
         current_time = self._clock.timestamp_ms()
         expire_before = current_time - self._expire_time * 1000
 
+        debug = self._log.should_log(DEBUG)
+
         # Clean up expired orders
-        expired_orders = [
-            uuid
-            for uuid, order in self._mem_orders.copy().items()
-            if order.timestamp < expire_before
-        ]
-        for uuid in expired_orders:
-            del self._mem_orders[uuid]
-            self._mem_closed_orders.pop(uuid, None)
-            self._log.debug(f"removing order {uuid} from memory")
-            for symbol, order_set in self._mem_symbol_orders.copy().items():
-                self._log.debug(f"removing order {uuid} from symbol {symbol}")
+        for uuid in self._pop_expired(self._order_expiry_heap, self._mem_orders, expire_before):
+            # the order carries its symbol, so only its own symbol sets are touched
+            order = self._mem_orders.pop(uuid)
+            symbol = order.symbol
+            if (order_set := self._mem_symbol_orders.get(symbol)) and uuid in order_set:
                 order_set.discard(uuid)
-        
-        expired_algo_orders = [
-            uuid
-            for uuid, algo_order in self._mem_algo_orders.copy().items()
-            if algo_order.timestamp < expire_before
-        ]
-        for uuid in expired_algo_orders:
+                self._dirty_symbol_orders.add(symbol)
+            if debug:
+                self._log.debug(f"removing order {uuid} of symbol {symbol} from memory")
+
+        for uuid in self._pop_expired(
+            self._algo_order_expiry_heap, self._mem_algo_orders, expire_before
+        ):
             del self._mem_algo_orders[uuid]
-            self._log.debug(f"removing algo order {uuid} from memory")
+            if debug:
+                self._log.debug(f"removing algo order {uuid} from memory")
+
+    @staticmethod
+    def _pop_expired(
+        heap: List[Tuple[int, str]],
+        mem: Dict[str, Order] | Dict[str, AlgoOrder],
+        expire_before: int,
+    ) -> Set[str]:
+        """
+        Pop the expired entries off the expiry heap. An entry is checked against the
+        order in memory, orders already removed are skipped and orders whose timestamp
+        moved past expire_before are pushed back with their current timestamp
+        """
+        expired = set()
+        while heap and heap[0][0] < expire_before:
+            _, uuid = heapq.heappop(heap)
+            order = mem.get(uuid)
+            if order is None:
+                continue
+            if order.timestamp < expire_before:
+                expired.add(uuid)
+            else:
+                heapq.heappush(heap, (order.timestamp, uuid))
+        return expired
+
+    def _track_expiry(self, order: Order | AlgoOrder):
+        """Register an order newly held in memory for expiry cleanup"""
+        if order.timestamp is None:
+            return
+        if isinstance(order, AlgoOrder):
+            heapq.heappush(self._algo_order_expiry_heap, (order.timestamp, order.uuid))
+        else:
+            heapq.heappush(self._order_expiry_heap, (order.timestamp, order.uuid))
 
     async def close(self):
         """关闭缓存"""
         self._shutdown_event.set()
         if self._storage_initialized:
+            await self._sync()
             if self._storage_backend == StorageBackend.REDIS:
-                await self._sync_to_redis()
                 await self._r_async.aclose()
             elif self._storage_backend == StorageBackend.SQLITE:
-                await self._sync_to_sqlite()
                 await self._db_async.close()
                 self._db.close()
 
@@ -306,6 +621,9 @@ class AsyncCache:
         """
         Retrieve a BookL1 object from the cache by symbol.
 
+        The cached BookL1 is replaced (not mutated) on every update, so call this
+        per use instead of holding on to the returned object.
+
         :param symbol: The symbol of the BookL1 to retrieve.
         :return: The BookL1 object if found, otherwise None.
         """
@@ -322,21 +640,31 @@ class AsyncCache:
 
     ################ # cache private data  ###################
 
-    def _check_status_transition(self, order: Order):
-        previous_order = self._mem_orders.get(order.uuid)
-        if not previous_order:
-            return True
-
-        if order.status not in STATUS_TRANSITIONS[previous_order.status]:
+    def _register_order(self, order: Order) -> bool:
+        """
+        Store the order if its status transition is valid and mark it dirty. The previous
+        order is looked up once for both the transition check and the expiry registration
+        """
+        uuid = order.uuid
+        mem_orders = self._mem_orders
+        previous_order = mem_orders.get(uuid)
+        if previous_order is None:
+            self._track_expiry(order)
+        elif order.status not in STATUS_TRANSITIONS[previous_order.status]:
             self._log.debug(
-                f"Order id: {order.uuid} Invalid status transition: {previous_order.status} -> {order.status}"
+                f"Order id: {uuid} Invalid status transition: {previous_order.status} -> {order.status}"
             )
             return False
 
+        mem_orders[uuid] = order
+        self._dirty_orders.add(uuid)
+        self._dirty_event.set()
         return True
     
     def _apply_position(self, position: Position):
         self._mem_positions[position.symbol] = position
+        self._dirty_positions.add(position.symbol)
+        self._dirty_event.set()
     
     def _apply_balance(self, account_type: AccountType, balances: List[Balance]):
         self._mem_account_balance[account_type]._apply(balances)
@@ -346,7 +674,7 @@ class AsyncCache:
     
     
     def _get_position_from_redis(self, instrument_id: InstrumentId) -> Position | None:
-        key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_positions:{instrument_id.symbol}"
+        key = f"{self._exchange_key_prefix(instrument_id.exchange)}:symbol_positions:{instrument_id.symbol}"
         if position_data := self._r.get(key):
             position = self._decode(position_data, Position)
             self._mem_positions[instrument_id.symbol] = position  # Cache in memory
@@ -391,7 +719,7 @@ class AsyncCache:
     
     def _get_all_positions_from_redis(self, exchange: ExchangeType) -> Dict[str, Position]:
         positions = {}
-        key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{exchange.value}:symbol_positions:*"
+        key = f"{self._exchange_key_prefix(exchange)}:symbol_positions:*"
         if keys := self._r.keys(key):
             for position_key in keys:
                 symbol = position_key.decode().split(":")[-1]
@@ -422,7 +750,7 @@ class AsyncCache:
         return positions
         
     def get_all_positions(self, exchange: ExchangeType) -> Dict[str, Position]:
-        positions = {symbol: position for symbol, position in self._mem_positions.copy().items() if position.exchange == exchange}
+        positions = {symbol: position for symbol, position in self._mem_positions.items() if position.exchange == exchange}
         
         # if self._storage_backend == StorageBackend.REDIS:
         #     positions.update(self._get_all_positions_from_redis(exchange))
@@ -433,25 +761,36 @@ class AsyncCache:
 
     def _order_initialized(self, order: Order | AlgoOrder):
         if isinstance(order, AlgoOrder):
+            if order.uuid not in self._mem_algo_orders:
+                self._track_expiry(order)
             self._mem_algo_orders[order.uuid] = order
-        else:
-            if not self._check_status_transition(order):
-                return
-            self._mem_orders[order.uuid] = order
-            self._mem_open_orders[order.exchange].add(order.uuid)
-            self._mem_symbol_orders[order.symbol].add(order.uuid)
-            self._mem_symbol_open_orders[order.symbol].add(order.uuid)
+            self._dirty_algo_orders.add(order.uuid)
+            self._dirty_event.set()
+        elif self._register_order(order):
+            uuid = order.uuid
+            exchange = order.exchange
+            symbol = order.symbol
+            _sym_set(self._mem_open_orders, exchange).add(uuid)
+            _sym_set(self._mem_symbol_orders, symbol).add(uuid)
+            _sym_set(self._mem_symbol_open_orders, symbol).add(uuid)
+            self._dirty_open_order_exchanges.add(exchange)
+            self._dirty_symbol_orders.add(symbol)
+            self._dirty_symbol_open_orders.add(symbol)
 
     def _order_status_update(self, order: Order | AlgoOrder):
         if isinstance(order, AlgoOrder):
+            if order.uuid not in self._mem_algo_orders:
+                self._track_expiry(order)
             self._mem_algo_orders[order.uuid] = order
-        else:
-            if not self._check_status_transition(order):
-                return
-            self._mem_orders[order.uuid] = order
-            if order.is_closed:
-                self._mem_open_orders[order.exchange].discard(order.uuid)
-                self._mem_symbol_open_orders[order.symbol].discard(order.uuid)
+            self._dirty_algo_orders.add(order.uuid)
+            self._dirty_event.set()
+        elif self._register_order(order):
+            # a rejected create never reaches the exchange, it leaves the open sets as well
+            if order.is_closed or order.status == OrderStatus.FAILED:
+                _sym_set(self._mem_open_orders, order.exchange).discard(order.uuid)
+                _sym_set(self._mem_symbol_open_orders, order.symbol).discard(order.uuid)
+                self._dirty_open_order_exchanges.add(order.exchange)
+                self._dirty_symbol_open_orders.add(order.symbol)
 
     
     def _get_order_from_redis(self, uuid: str) -> Optional[Order | AlgoOrder]:
@@ -459,19 +798,20 @@ class AsyncCache:
         if uuid.startswith("ALGO-"):
             if order := self._mem_algo_orders.get(uuid):
                 return order
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:algo_orders"
+            key = self._algo_orders_key
             obj_type = AlgoOrder
             mem_dict = self._mem_algo_orders
         else:
             if order := self._mem_orders.get(uuid):
                 return order
-            key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:orders"
+            key = self._orders_key
             obj_type = Order
             mem_dict = self._mem_orders
 
         if raw_order := self._r.hget(key, uuid):
             order = self._decode(raw_order, obj_type)
             mem_dict[uuid] = order
+            self._track_expiry(order)
             return order
         return None
     
@@ -504,6 +844,7 @@ class AsyncCache:
             if row := cursor.fetchone():
                 order = self._decode(row[0], obj_type)
                 mem_dict[uuid] = order  # Cache in memory
+                self._track_expiry(order)
                 return order
                 
             return None
@@ -521,7 +862,7 @@ class AsyncCache:
     
     
     def _get_symbol_orders_from_redis(self, instrument_id: InstrumentId) -> Set[str]:
-        key = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{instrument_id.exchange.value}:symbol_orders:{instrument_id.symbol}"
+        key = self._symbol_orders_key(instrument_id.symbol)
         if redis_orders := self._r.smembers(key):
             return {uuid.decode() for uuid in redis_orders}
         return set()
@@ -552,13 +893,8 @@ class AsyncCache:
         self, symbol: str | None = None, exchange: ExchangeType | None = None
     ) -> Set[str]:
         if symbol is not None:
-            return self._mem_symbol_open_orders[symbol]
+            return _sym_set(self._mem_symbol_open_orders, symbol)
         elif exchange is not None:
-            return self._mem_open_orders[exchange]
+            return _sym_set(self._mem_open_orders, exchange)
         else:
             raise ValueError("Either `symbol` or `exchange` must be specified")
-
-
-
-
-
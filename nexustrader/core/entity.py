@@ -1,8 +1,8 @@
 import signal
 import asyncio
 import socket
-from typing import Callable
-from typing import Dict, List
+from typing import Callable, Generic, TypeVar
+from typing import Dict, List, Tuple
 import warnings
 
 import redis
@@ -26,6 +26,67 @@ class RateLimit:
     time_period: float = 60
 
 
+T = TypeVar("T")
+
+
+class SPSCQueue(Generic[T]):
+    """
+    Single producer single consumer queue backed by a preallocated ring buffer and
+    an asyncio.Event, the consumer only waits on the event when the ring is empty,
+    so nothing is allocated per item as in asyncio.Queue
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive for a ring buffer")
+        self._maxsize = maxsize
+        self._buffer: List[T | None] = [None] * maxsize
+        self._head = 0  # next slot to read
+        self._tail = 0  # next slot to write
+        self._size = 0
+        self._not_empty = asyncio.Event()
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def put_nowait(self, item: T) -> None:
+        """
+        Put an item, raise asyncio.QueueFull if the ring is full
+        """
+        if self._size == self._maxsize:
+            raise asyncio.QueueFull
+        self._buffer[self._tail] = item
+        self._tail += 1
+        if self._tail == self._maxsize:
+            self._tail = 0
+        self._size += 1
+        if not self._not_empty.is_set():
+            self._not_empty.set()
+
+    async def get(self) -> T:
+        while self._size == 0:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    def get_nowait(self) -> T:
+        """
+        Get an item, raise asyncio.QueueEmpty if the ring is empty
+        """
+        if self._size == 0:
+            raise asyncio.QueueEmpty
+        item = self._buffer[self._head]
+        self._buffer[self._head] = None  # release the reference
+        self._head += 1
+        if self._head == self._maxsize:
+            self._head = 0
+        self._size -= 1
+        return item
+
+
 class TaskManager:
     def __init__(
         self, loop: asyncio.AbstractEventLoop, enable_signal_handlers: bool = True
@@ -139,7 +200,7 @@ class Clock:
         self._tick_size = tick_size  # Tick size in seconds
         self._current_tick = (time.time() // self._tick_size) * self._tick_size
         self._clock = LiveClock()
-        self._tick_callbacks: List[Callable[[float], None]] = []
+        self._tick_callbacks: List[Tuple[bool, Callable[[float], None]]] = []  # (is_coroutine, callback)
         self._started = False
 
     @property
@@ -155,7 +216,7 @@ class Clock:
         Register a callback to be called on each tick.
         :param callback: Function to be called with current_tick as argument.
         """
-        self._tick_callbacks.append(callback)
+        self._tick_callbacks.append((asyncio.iscoroutinefunction(callback), callback))
 
     async def run(self):
         if self._started:
@@ -171,8 +232,8 @@ class Clock:
                 # If we're behind schedule, skip to the next tick to prevent drift
                 next_tick_time = now
             self._current_tick = next_tick_time
-            for callback in self._tick_callbacks:
-                if asyncio.iscoroutinefunction(callback):
+            for is_coroutine, callback in self._tick_callbacks:
+                if is_coroutine:
                     await callback(self.current_timestamp)
                 else:
                     callback(self.current_timestamp)
@@ -185,12 +246,15 @@ class ZeroMQSignalRecv:
         self._task_manager = task_manager
 
     async def _recv(self):
+        socket = self._socket
+        callback = self._callback
+        is_coro = asyncio.iscoroutinefunction(callback)  # resolved once, not per message
         while True:
-            date = await self._socket.recv()
-            if asyncio.iscoroutinefunction(self._callback):
-                await self._callback(date)
+            date = await socket.recv()
+            if is_coro:
+                await callback(date)
             else:
-                self._callback(date)
+                callback(date)
 
     async def start(self):
         self._task_manager.create_task(self._recv())
@@ -210,6 +274,7 @@ class DataReady:
         self._timeout = timeout
         self._clock = LiveClock()
         self._first_data_time: int | None = None
+        self._is_ready = False
 
     def input(self, data: Kline | BookL1 | Trade) -> None:
         """
@@ -236,6 +301,10 @@ class DataReady:
         Returns:
             bool: if all data is ready or timed out, return True
         """
+        # once ready it stays ready, skip the clock read on every later input
+        if self._is_ready:
+            return True
+
         if self._first_data_time is None:
             return False
 
@@ -245,7 +314,9 @@ class DataReady:
                 warnings.warn(
                     f"Data receiving timed out. The following symbols are not ready: {', '.join(not_ready)}"
                 )
+            self._is_ready = True
             return True
 
         # check if all data is ready
-        return all(self._symbols.values())
+        self._is_ready = all(self._symbols.values())
+        return self._is_ready
@@ -5,6 +5,10 @@ import traceback
 import asyncio
 import spdlog as spd
 
+# the spdlog bindings only take formatted strings, so hot paths check
+# logger.should_log(DEBUG) before building an f-string that would be dropped
+DEBUG = spd.LogLevel.DEBUG
+
 
 class SpdLog:
     """
@@ -1,6 +1,5 @@
 import asyncio
-from collections import defaultdict
-from typing import Optional
+from typing import Dict, Optional
 from nexustrader.core.log import SpdLog
 from nexustrader.schema import Order
 
@@ -11,13 +10,15 @@ class OrderRegistry:
         )
         self._uuid_to_order_id = {}
         self._order_id_to_uuid = {}
-        self._uuid_init_events = defaultdict(asyncio.Event)
+        self._uuid_init_events: Dict[str, asyncio.Event] = {}  # only created for waiters
 
     def register_order(self, order: Order) -> None:
         """Register a new order ID to UUID mapping"""
         self._order_id_to_uuid[order.id] = order.uuid
         self._uuid_to_order_id[order.uuid] = order.id
-        self._uuid_init_events[order.id].set() # the order id is linked to the order submit uuid
+        event = self._uuid_init_events.pop(order.id, None)
+        if event:
+            event.set() # the order id is linked to the order submit uuid
         self._log.debug(f"[ORDER REGISTER]: linked order id {order.id} with uuid {order.uuid}")
 
     def get_order_id(self, uuid: str) -> Optional[str]:
@@ -30,7 +31,12 @@ class OrderRegistry:
 
     async def wait_for_order_id(self, order_id: str) -> None:
         """Wait for an order ID to be registered"""
-        await self._uuid_init_events[order_id].wait()
+        if order_id in self._order_id_to_uuid:
+            return
+        event = self._uuid_init_events.get(order_id)
+        if event is None:
+            event = self._uuid_init_events[order_id] = asyncio.Event()
+        await event.wait()
 
     def remove_order(self, order: Order) -> None:
         """Remove order mapping when no longer needed"""
@@ -1,5 +1,6 @@
 import asyncio
 import platform
+from functools import partial
 from typing import Dict
 from nexustrader.constants import AccountType, ExchangeType
 from nexustrader.config import Config
@@ -47,10 +48,14 @@ from nexustrader.constants import DataType
 class Engine:
     @staticmethod
     def set_loop_policy():
-        if platform.system() != "Windows":
+        if platform.system() == "Windows":
+            return
+        try:
             import uvloop
-
-            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            # uvloop is only pulled in transitively; fall back to the stock loop
+            return
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     def __init__(self, config: Config):
         self._config = config
@@ -58,6 +63,8 @@ class Engine:
         self._scheduler_started = False
         self.set_loop_policy()
         self._loop = asyncio.new_event_loop()
+        # pin the loop so `asyncio.get_event_loop()` callers share it
+        asyncio.set_event_loop(self._loop)
         self._task_manager = TaskManager(self._loop)
 
         self._exchanges: Dict[ExchangeType, ExchangeManager] = {}
@@ -308,6 +315,9 @@ class Engine:
                         msgbus=self._msgbus,
                         task_manager=self._task_manager,
                         registry=self._registry,
+                        submit_queue_max=self._config.submit_queue_max,
+                        submit_workers=self._config.submit_workers,
+                        order_timeout=self._config.order_timeout,
                     )
                     self._ems[exchange_id]._build(self._private_connectors)
                 case ExchangeType.BINANCE:
@@ -318,6 +328,9 @@ class Engine:
                         msgbus=self._msgbus,
                         task_manager=self._task_manager,
                         registry=self._registry,
+                        submit_queue_max=self._config.submit_queue_max,
+                        submit_workers=self._config.submit_workers,
+                        order_timeout=self._config.order_timeout,
                     )
                     self._ems[exchange_id]._build(self._private_connectors)
                 case ExchangeType.OKX:
@@ -328,6 +341,9 @@ class Engine:
                         msgbus=self._msgbus,
                         task_manager=self._task_manager,
                         registry=self._registry,
+                        submit_queue_max=self._config.submit_queue_max,
+                        submit_workers=self._config.submit_workers,
+                        order_timeout=self._config.order_timeout,
                     )
                     self._ems[exchange_id]._build(self._private_connectors)
 
@@ -443,47 +459,39 @@ class Engine:
                 return account_types[0].account_type
 
     async def _start_connectors(self):
-        for connector in self._private_connectors.values():
-            await connector.connect()
+        # each connect is a handshake with its exchange, run them concurrently
+        await asyncio.gather(
+            *(connector.connect() for connector in self._private_connectors.values())
+        )
 
+        # connectors are resolved first, so a missing one fails before anything is
+        # subscribed, then all subscriptions run concurrently
+        subscriptions = []
         for data_type, sub in self._strategy._subscriptions.items():
             match data_type:
                 case DataType.BOOKL1:
                     for symbol in sub:
                         instrument_id = InstrumentId.from_str(symbol)
-                        account_type = self._instrument_id_to_account_type(
-                            instrument_id
+                        connector = self._get_public_connector(instrument_id)
+                        subscriptions.append(
+                            partial(connector.subscribe_bookl1, instrument_id.symbol)
                         )
-                        connector = self._public_connectors.get(account_type, None)
-                        if connector is None:
-                            raise SubscriptionError(
-                                f"Please add `{account_type}` public connector to the `config.public_conn_config`."
-                            )
-                        await connector.subscribe_bookl1(instrument_id.symbol)
                 case DataType.TRADE:
                     for symbol in sub:
                         instrument_id = InstrumentId.from_str(symbol)
-                        account_type = self._instrument_id_to_account_type(
-                            instrument_id
+                        connector = self._get_public_connector(instrument_id)
+                        subscriptions.append(
+                            partial(connector.subscribe_trade, instrument_id.symbol)
                         )
-                        connector = self._public_connectors.get(account_type, None)
-                        if connector is None:
-                            raise SubscriptionError(
-                                f"Please add `{account_type}` public connector to the `config.public_conn_config`."
-                            )
-                        await connector.subscribe_trade(instrument_id.symbol)
                 case DataType.KLINE:
                     for symbol, interval in sub.items():
                         instrument_id = InstrumentId.from_str(symbol)
-                        account_type = self._instrument_id_to_account_type(
-                            instrument_id
-                        )
-                        connector = self._public_connectors.get(account_type, None)
-                        if connector is None:
-                            raise SubscriptionError(
-                                f"Please add `{account_type}` public connector to the `config.public_conn_config`."
+                        connector = self._get_public_connector(instrument_id)
+                        subscriptions.append(
+                            partial(
+                                connector.subscribe_kline, instrument_id.symbol, interval
                             )
-                        await connector.subscribe_kline(instrument_id.symbol, interval)
+                        )
                 case DataType.MARK_PRICE:
                     pass  # TODO: implement
                 case DataType.FUNDING_RATE:
@@ -491,6 +499,17 @@ class Engine:
                 case DataType.INDEX_PRICE:
                     pass  # TODO: implement
 
+        await asyncio.gather(*(subscribe() for subscribe in subscriptions))
+
+    def _get_public_connector(self, instrument_id: InstrumentId) -> PublicConnector:
+        account_type = self._instrument_id_to_account_type(instrument_id)
+        connector = self._public_connectors.get(account_type, None)
+        if connector is None:
+            raise SubscriptionError(
+                f"Please add `{account_type}` public connector to the `config.public_conn_config`."
+            )
+        return connector
+
     async def _start_ems(self):
         for ems in self._ems.values():
             await ems.start()
@@ -504,8 +523,7 @@ class Engine:
         self._scheduler_started = True
 
     async def _start(self):
-        await self._cache.start()
-        await self._start_oms()
+        await asyncio.gather(self._cache.start(), self._start_oms())
         await self._start_ems()
         await self._start_connectors()
         if self._custom_signal_recv:
@@ -20,6 +20,7 @@ from nexustrader.exchange.binance.rest_api import BinanceApiClient
 from nexustrader.exchange.binance.constants import BinanceAccountType
 from nexustrader.exchange.binance.websockets import BinanceWSClient
 from nexustrader.exchange.binance.exchange import BinanceExchangeManager
+from nexustrader.exchange.binance.error import retry_after
 from nexustrader.exchange.binance.constants import (
     BinanceWsEventType,
     BinanceUserDataStreamWsEventType,
@@ -47,6 +48,18 @@ from nexustrader.core.nautilius_core import MessageBus
 from nexustrader.core.entity import TaskManager, RateLimit
 
 
+def _symbols_by_exchange_id(market_id: Dict[str, str], suffix: str) -> Dict[str, str]:
+    """
+    Map the raw exchange symbol to the symbol of one market type, so websocket
+    parsers look symbols up without building the suffixed market id per message
+    """
+    return {
+        id.removesuffix(suffix): symbol
+        for id, symbol in market_id.items()
+        if id.endswith(suffix)
+    }
+
+
 class BinancePublicConnector(PublicConnector):
     _ws_client: BinanceWSClient
     _account_type: BinanceAccountType
@@ -92,6 +105,13 @@ class BinancePublicConnector(PublicConnector):
         )
         self._ws_kline_decoder = msgspec.json.Decoder(BinanceKline)
         self._ws_mark_price_decoder = msgspec.json.Decoder(BinanceMarkPrice)
+        self._ws_handlers = {
+            BinanceWsEventType.TRADE: self._parse_trade,
+            BinanceWsEventType.BOOK_TICKER: self._parse_futures_book_ticker,
+            BinanceWsEventType.KLINE: self._parse_kline,
+            BinanceWsEventType.MARK_PRICE_UPDATE: self._parse_mark_price,
+        }
+        self._ws_symbol = _symbols_by_exchange_id(self._market_id, self.market_type)
 
     @property
     def market_type(self):
@@ -202,18 +222,14 @@ class BinancePublicConnector(PublicConnector):
         try:
             msg = self._ws_general_decoder.decode(raw)
             if msg.e:
-                match msg.e:
-                    case BinanceWsEventType.TRADE:
-                        self._parse_trade(raw)
-                    case BinanceWsEventType.BOOK_TICKER:
-                        self._parse_futures_book_ticker(raw)
-                    case BinanceWsEventType.KLINE:
-                        self._parse_kline(raw)
-                    case BinanceWsEventType.MARK_PRICE_UPDATE:
-                        self._parse_mark_price(raw)
+                handler = self._ws_handlers.get(msg.e)
+                if handler:
+                    handler(raw)
             elif msg.u:
                 # spot book ticker doesn't have "e" key. FUCK BINANCE
                 self._parse_spot_book_ticker(raw)
+            elif msg.id is not None:
+                self._ws_client.on_subscribe_response(msg.id, msg.error)
         except msgspec.DecodeError as e:
             self._log.error(f"Error decoding message: {str(raw)} {str(e)}")
 
@@ -243,8 +259,7 @@ class BinancePublicConnector(PublicConnector):
 
     def _parse_kline(self, raw: bytes) -> Kline:
         res = self._ws_kline_decoder.decode(raw)
-        id = res.s + self.market_type
-        symbol = self._market_id[id]
+        symbol = self._ws_symbol[res.s]
         interval = BinanceEnumParser.parse_kline_interval(res.k.i)
         ticker = Kline(
             exchange=self._exchange_id,
@@ -264,8 +279,7 @@ class BinancePublicConnector(PublicConnector):
     def _parse_trade(self, raw: bytes) -> Trade:
         res = self._ws_trade_decoder.decode(raw)
 
-        id = res.s + self.market_type
-        symbol = self._market_id[id]  # map exchange id to ccxt symbol
+        symbol = self._ws_symbol[res.s]
 
         trade = Trade(
             exchange=self._exchange_id,
@@ -278,8 +292,7 @@ class BinancePublicConnector(PublicConnector):
 
     def _parse_spot_book_ticker(self, raw: bytes) -> BookL1:
         res = self._ws_spot_book_ticker_decoder.decode(raw)
-        id = res.s + self.market_type
-        symbol = self._market_id[id]
+        symbol = self._ws_symbol[res.s]
 
         bookl1 = BookL1(
             exchange=self._exchange_id,
@@ -294,8 +307,7 @@ class BinancePublicConnector(PublicConnector):
 
     def _parse_futures_book_ticker(self, raw: bytes) -> BookL1:
         res = self._ws_futures_book_ticker_decoder.decode(raw)
-        id = res.s + self.market_type
-        symbol = self._market_id[id]
+        symbol = self._ws_symbol[res.s]
         bookl1 = BookL1(
             exchange=self._exchange_id,
             symbol=symbol,
@@ -309,8 +321,7 @@ class BinancePublicConnector(PublicConnector):
 
     def _parse_mark_price(self, raw: bytes):
         res = self._ws_mark_price_decoder.decode(raw)
-        id = res.s + self.market_type
-        symbol = self._market_id[id]
+        symbol = self._ws_symbol[res.s]
 
         mark_price = MarkPrice(
             exchange=self._exchange_id,
@@ -345,6 +356,8 @@ class BinancePrivateConnector(PrivateConnector):
     _market_id: Dict[str, str]
     _api_client: BinanceApiClient
 
+    DEFAULT_RATE_LIMIT = RateLimit(max_rate=100, time_period=10)  # spot order rate limit is 100 orders/10s, futures allow more
+
     def __init__(
         self,
         account_type: BinanceAccountType,
@@ -388,6 +401,25 @@ class BinancePrivateConnector(PrivateConnector):
         self._ws_msg_futures_account_update_decoder = msgspec.json.Decoder(
             BinanceFuturesUpdateMsg
         )
+        self._ws_handlers = {
+            # futures order update
+            BinanceUserDataStreamWsEventType.ORDER_TRADE_UPDATE: self._parse_order_trade_update,
+            # spot order update
+            BinanceUserDataStreamWsEventType.EXECUTION_REPORT: self._parse_execution_report,
+            # futures account update
+            BinanceUserDataStreamWsEventType.ACCOUNT_UPDATE: self._parse_account_update,
+            # spot account update
+            BinanceUserDataStreamWsEventType.OUT_BOUND_ACCOUNT_POSITION: self._parse_out_bound_account_position,
+        }
+        market_type = self.market_type
+        self._ws_symbol = (
+            _symbols_by_exchange_id(self._market_id, market_type) if market_type else {}
+        )
+        # Only portfolio margin has "UM" and "CM" event business unit
+        self._ws_unit_symbol = {
+            BinanceBusinessUnit.UM: _symbols_by_exchange_id(self._market_id, "_linear"),
+            BinanceBusinessUnit.CM: _symbols_by_exchange_id(self._market_id, "_inverse"),
+        }
 
     async def _init_account_balance(self):
         if (
@@ -475,17 +507,21 @@ class BinancePrivateConnector(PrivateConnector):
         self, listen_key: str, interval: int = 20, max_retry: int = 5
     ):
         retry_count = 0
+        delay = 60 * interval
         while retry_count < max_retry:
-            await asyncio.sleep(60 * interval)
+            await asyncio.sleep(delay)
             try:
                 await self._keep_alive_listen_key(listen_key)
                 retry_count = 0  # Reset retry count on successful keep-alive
+                delay = 60 * interval
             except Exception as e:
                 error_msg = f"{type(e).__name__}: {str(e)}"
                 self._log.error(f"Failed to keep alive listen key: {error_msg}")
                 retry_count += 1
                 if retry_count < max_retry:
-                    await asyncio.sleep(5)
+                    # retry well before the key expires, backing off exponentially and
+                    # never sooner than a rate limited response asks for
+                    delay = max(5 * 2 ** (retry_count - 1), retry_after(e))
                 else:
                     self._log.error(
                         f"Max retries ({max_retry}) reached. Stopping keep-alive attempts."
@@ -508,23 +544,11 @@ class BinancePrivateConnector(PrivateConnector):
         try:
             msg = self._ws_msg_general_decoder.decode(raw)
             if msg.e:
-                match msg.e:
-                    case (
-                        BinanceUserDataStreamWsEventType.ORDER_TRADE_UPDATE
-                    ):  # futures order update
-                        self._parse_order_trade_update(raw)
-                    case (
-                        BinanceUserDataStreamWsEventType.EXECUTION_REPORT
-                    ):  # spot order update
-                        self._parse_execution_report(raw)
-                    case (
-                        BinanceUserDataStreamWsEventType.ACCOUNT_UPDATE
-                    ):  # futures account update
-                        self._parse_account_update(raw)
-                    case (
-                        BinanceUserDataStreamWsEventType.OUT_BOUND_ACCOUNT_POSITION
-                    ):  # spot account update
-                        self._parse_out_bound_account_position(raw)
+                handler = self._ws_handlers.get(msg.e)
+                if handler:
+                    handler(raw)
+            elif msg.id is not None:
+                self._ws_client.on_subscribe_response(msg.id, msg.error)
         except msgspec.DecodeError:
             self._log.error(f"Error decoding message: {str(raw)}")
 
@@ -538,17 +562,9 @@ class BinancePrivateConnector(PrivateConnector):
         balances = res.a.parse_to_balances()
         self._cache._apply_balance(account_type=self._account_type, balances=balances)
 
-        event_unit = res.fs
+        symbols = self._ws_unit_symbol.get(res.fs, self._ws_symbol)
         for position in res.a.P:
-            if event_unit == BinanceBusinessUnit.UM:
-                id = position.s + "_linear"
-                symbol = self._market_id[id]
-            elif event_unit == BinanceBusinessUnit.CM:
-                id = position.s + "_inverse"
-                symbol = self._market_id[id]
-            else:
-                id = position.s + self.market_type
-                symbol = self._market_id[id]
+            symbol = symbols[position.s]
 
             signed_amount = Decimal(position.pa)
             side = position.ps.parse_to_position_side()
@@ -575,38 +591,33 @@ class BinancePrivateConnector(PrivateConnector):
         res = self._ws_msg_futures_order_update_decoder.decode(raw)
 
         event_data = res.o
-        event_unit = res.fs
+        symbol = self._ws_unit_symbol.get(res.fs, self._ws_symbol)[event_data.s]
 
-        # Only portfolio margin has "UM" and "CM" event business unit
-        if event_unit == BinanceBusinessUnit.UM:
-            id = event_data.s + "_linear"
-            symbol = self._market_id[id]
-        elif event_unit == BinanceBusinessUnit.CM:
-            id = event_data.s + "_inverse"
-            symbol = self._market_id[id]
-        else:
-            id = event_data.s + self.market_type
-            symbol = self._market_id[id]
+        # each decimal field is converted once and shared by the derived values below
+        amount = Decimal(event_data.q)
+        filled = Decimal(event_data.z)
+        last_filled = Decimal(event_data.l)
+        average = Decimal(event_data.ap)
 
         # we use the last filled quantity to calculate the cost, instead of the accumulated filled quantity
         type = event_data.o
         if type.is_market:
-            cost = Decimal(event_data.l) * Decimal(event_data.ap)
-            cum_cost = Decimal(event_data.z) * Decimal(event_data.ap)
+            cost = last_filled * average
+            cum_cost = filled * average
         elif type.is_limit:
-            price = Decimal(event_data.ap) or Decimal(
+            price = average or Decimal(
                 event_data.p
             )  # if average price is 0 or empty, use price
-            cost = Decimal(event_data.l) * price
-            cum_cost = Decimal(event_data.z) * price
+            cost = last_filled * price
+            cum_cost = filled * price
 
         order = Order(
             exchange=self._exchange_id,
             symbol=symbol,
             status=BinanceEnumParser.parse_order_status(event_data.X),
             id=event_data.i,
-            amount=Decimal(event_data.q),
-            filled=Decimal(event_data.z),
+            amount=amount,
+            filled=filled,
             client_order_id=event_data.c,
             timestamp=res.E,
             type=BinanceEnumParser.parse_futures_order_type(event_data.o),
@@ -616,7 +627,7 @@ class BinancePrivateConnector(PrivateConnector):
             average=float(event_data.ap),
             last_filled_price=float(event_data.L),
             last_filled=float(event_data.l),
-            remaining=Decimal(event_data.q) - Decimal(event_data.z),
+            remaining=amount - filled,
             fee=Decimal(event_data.n),
             fee_currency=event_data.N,
             cum_cost=cum_cost,
@@ -630,23 +641,22 @@ class BinancePrivateConnector(PrivateConnector):
     def _parse_execution_report(self, raw: bytes) -> Order:
         event_data = self._ws_msg_spot_order_update_decoder.decode(raw)
 
-        id = event_data.s + self.market_type
-        symbol = self._market_id[id]
+        symbol = self._ws_symbol[event_data.s]
+
+        amount = Decimal(event_data.q)
+        filled = Decimal(event_data.z)
 
         # Calculate average price only if filled amount is non-zero
-        average = (
-            float(event_data.Z) / float(event_data.z)
-            if float(event_data.z) != 0
-            else None
-        )
+        filled_qty = float(event_data.z)
+        average = float(event_data.Z) / filled_qty if filled_qty != 0 else None
 
         order = Order(
             exchange=self._exchange_id,
             symbol=symbol,
             status=BinanceEnumParser.parse_order_status(event_data.X),
             id=event_data.i,
-            amount=Decimal(event_data.q),
-            filled=Decimal(event_data.z),
+            amount=amount,
+            filled=filled,
             client_order_id=event_data.c,
             timestamp=event_data.E,
             type=BinanceEnumParser.parse_spot_order_type(event_data.o),
@@ -656,7 +666,7 @@ class BinancePrivateConnector(PrivateConnector):
             average=average,
             last_filled_price=float(event_data.L),
             last_filled=float(event_data.l),
-            remaining=Decimal(event_data.q) - Decimal(event_data.z),
+            remaining=amount - filled,
             fee=Decimal(event_data.n),
             fee_currency=event_data.N,
             cum_cost=Decimal(event_data.Z),
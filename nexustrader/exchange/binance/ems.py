@@ -1,4 +1,3 @@
-import asyncio
 from decimal import Decimal
 from typing import Dict
 from nexustrader.constants import AccountType
@@ -14,6 +13,7 @@ from nexustrader.base import ExecutionManagementSystem
 
 class BinanceExecutionManagementSystem(ExecutionManagementSystem):
     _market: Dict[str, BinanceMarket]
+    ACCOUNT_TYPE = BinanceAccountType
     
     BINANCE_SPOT_PRIORITY = [
         BinanceAccountType.ISOLATED_MARGIN,
@@ -29,6 +29,9 @@ class BinanceExecutionManagementSystem(ExecutionManagementSystem):
         msgbus: MessageBus,
         task_manager: TaskManager,
         registry: OrderRegistry,
+        submit_queue_max: int = 4096,
+        submit_workers: int = 1,
+        order_timeout: float | None = None,
     ):
         super().__init__(
             market=market,
@@ -36,6 +39,9 @@ class BinanceExecutionManagementSystem(ExecutionManagementSystem):
             msgbus=msgbus,
             task_manager=task_manager,
             registry=registry,
+            submit_queue_max=submit_queue_max,
+            submit_workers=submit_workers,
+            order_timeout=order_timeout,
         )
         self._binance_spot_account_type: BinanceAccountType = None
         self._binance_linear_account_type: BinanceAccountType = None
@@ -78,17 +84,12 @@ class BinanceExecutionManagementSystem(ExecutionManagementSystem):
         elif instrument_id.is_inverse:
             return self._binance_inverse_account_type
 
-    def _build_order_submit_queues(self):
-        for account_type in self._private_connectors.keys():
-            if isinstance(account_type, BinanceAccountType):
-                self._order_submit_queues[account_type] = asyncio.Queue()
-
     def _submit_order(
         self, order: OrderSubmit, account_type: AccountType | None = None
     ):
         if not account_type:
             account_type = self._instrument_id_to_account_type(order.instrument_id)
-        self._order_submit_queues[account_type].put_nowait(order)
+        self._put_order_submit(account_type, order)
     
     def _get_min_order_amount(self, symbol: str, market: BinanceMarket) -> Decimal:
         book = self._cache.bookl1(symbol)
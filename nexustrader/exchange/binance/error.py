@@ -46,7 +46,35 @@ def should_retry(error: BaseException) -> bool:
         True if should retry, otherwise False.
 
     """
-    if isinstance(error, BinanceError):
-        error_code = BinanceErrorCode(error.message["code"])
+    # a non-JSON body (e.g. a gateway html page) is kept as text and carries no code
+    if isinstance(error, BinanceError) and isinstance(error.message, dict):
+        try:
+            error_code = BinanceErrorCode(error.message.get("code"))
+        except ValueError:
+            return False
         return error_code in BINANCE_RETRY_ERRORS
     return False
+
+
+def retry_after(error: BaseException) -> float:
+    """
+    Get the wait in seconds Binance asks for before the next request.
+
+    Parameters
+    ----------
+    error : BaseException
+        The error to check.
+
+    Returns
+    -------
+    float
+        The `Retry-After` header of a rate limited (429) or banned (418) response,
+        otherwise 0. The rust http client reports header names lowercased.
+
+    """
+    if isinstance(error, BinanceClientError) and error.status in (418, 429):
+        try:
+            return float(error.headers.get("retry-after", 0))
+        except (AttributeError, TypeError, ValueError):
+            return 0
+    return 0
@@ -1,19 +1,16 @@
-import hmac
 import orjson
-import hashlib
 import msgspec
-import asyncio
-import aiohttp
 
 
 from typing import Any, Dict
-from urllib.parse import urljoin, urlencode
 
 from nexustrader.base import ApiClient
+from nexustrader.base.api_client import encode_query, HTTP_METHODS
+from nexustrader.core.log import DEBUG
 from nexustrader.exchange.binance.schema import BinanceOrder, BinanceListenKey, BinanceSpotAccountInfo, BinanceFuturesAccountInfo, BinanceResponseKline
 from nexustrader.exchange.binance.constants import BinanceAccountType
 from nexustrader.exchange.binance.error import BinanceClientError, BinanceServerError
-from nexustrader.core.nautilius_core import hmac_signature
+from nexustrader.core.nautilius_core import hmac_signature, HttpResponse
 
 class BinanceApiClient(ApiClient):
     def __init__(
@@ -37,18 +34,31 @@ class BinanceApiClient(ApiClient):
             self._headers["X-MBX-APIKEY"] = api_key
         
         self._testnet = testnet
+        # resolved once, every request used to walk the account type / testnet branches
+        self._base_urls: Dict[BinanceAccountType, str] = {
+            BinanceAccountType.SPOT: (
+                BinanceAccountType.SPOT_TESTNET if testnet else BinanceAccountType.SPOT
+            ).base_url,
+            BinanceAccountType.MARGIN: BinanceAccountType.MARGIN.base_url,
+            BinanceAccountType.ISOLATED_MARGIN: BinanceAccountType.ISOLATED_MARGIN.base_url,
+            BinanceAccountType.USD_M_FUTURE: (
+                BinanceAccountType.USD_M_FUTURE_TESTNET
+                if testnet
+                else BinanceAccountType.USD_M_FUTURE
+            ).base_url,
+            BinanceAccountType.COIN_M_FUTURE: (
+                BinanceAccountType.COIN_M_FUTURE_TESTNET
+                if testnet
+                else BinanceAccountType.COIN_M_FUTURE
+            ).base_url,
+            BinanceAccountType.PORTFOLIO_MARGIN: BinanceAccountType.PORTFOLIO_MARGIN.base_url,
+        }
         self._order_decoder = msgspec.json.Decoder(BinanceOrder)
         self._spot_account_decoder = msgspec.json.Decoder(BinanceSpotAccountInfo)
         self._futures_account_decoder = msgspec.json.Decoder(BinanceFuturesAccountInfo)
         self._listen_key_decoder = msgspec.json.Decoder(BinanceListenKey)
         self._kline_response_decoder = msgspec.json.Decoder(list[BinanceResponseKline])
 
-    def _generate_signature(self, query: str) -> str:
-        signature = hmac.new(
-            self._secret.encode("utf-8"), query.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
-        return signature
-    
     def _generate_signature_v2(self, query: str) -> str:
         signature = hmac_signature(self._secret, query)
         return signature
@@ -64,63 +74,43 @@ class BinanceApiClient(ApiClient):
     ) -> Any:
         self._init_session()
         
-        url = urljoin(base_url, endpoint)
-        payload = payload or {}
+        url = base_url + endpoint  # base urls are bare hosts and endpoints absolute paths
+        payload = encode_query(payload) if payload else ""
         if required_timestamp:
-            payload["timestamp"] = self._clock.timestamp_ms()
-        payload = urlencode(payload)
+            # spliced onto the encoded query as the last field, the payload dict is left untouched
+            timestamp = f"timestamp={self._clock.timestamp_ms()}"
+            payload = f"{payload}&{timestamp}" if payload else timestamp
 
         if signed:
             signature = self._generate_signature_v2(payload)
             payload += f"&signature={signature}"
 
         url += f"?{payload}"
-        self._log.debug(f"Request: {url}")
+        if self._log.should_log(DEBUG):
+            self._log.debug(f"Request: {url}")
 
         try:
-            response = await self._session.request(
-                method=method,
+            response: HttpResponse = await self._client.request(
+                method=HTTP_METHODS[method],
                 url=url,
                 headers=self._headers,
+                timeout_secs=self._timeout,
             )
-            raw = await response.read()
+            raw = response.body
             self.raise_error(raw, response.status, response.headers)
             return raw
-        except aiohttp.ClientError as e:
-            self._log.error(f"Client Error {method} Url: {url} {e}")
-            raise
-        except asyncio.TimeoutError:
-            self._log.error(f"Timeout {method} Url: {url}")
-            raise
         except Exception as e:
             self._log.error(f"Error {method} Url: {url} {e}")
             raise
 
     def raise_error(self, raw: bytes, status: int, headers: Dict[str, Any]):
         if 400 <= status < 500:
-            raise BinanceClientError(status, orjson.loads(raw), headers)
+            raise BinanceClientError(status, self._decode_error_body(raw), headers)
         elif status >= 500:
-            raise BinanceServerError(status, orjson.loads(raw), headers)
+            raise BinanceServerError(status, self._decode_error_body(raw), headers)
 
     def _get_base_url(self, account_type: BinanceAccountType) -> str:
-        if account_type == BinanceAccountType.SPOT:
-            if self._testnet:
-                return BinanceAccountType.SPOT_TESTNET.base_url
-            return BinanceAccountType.SPOT.base_url
-        elif account_type == BinanceAccountType.MARGIN:
-            return BinanceAccountType.MARGIN.base_url
-        elif account_type == BinanceAccountType.ISOLATED_MARGIN:
-            return BinanceAccountType.ISOLATED_MARGIN.base_url
-        elif account_type == BinanceAccountType.USD_M_FUTURE:
-            if self._testnet:
-                return BinanceAccountType.USD_M_FUTURE_TESTNET.base_url
-            return BinanceAccountType.USD_M_FUTURE.base_url
-        elif account_type == BinanceAccountType.COIN_M_FUTURE:
-            if self._testnet:
-                return BinanceAccountType.COIN_M_FUTURE_TESTNET.base_url
-            return BinanceAccountType.COIN_M_FUTURE.base_url
-        elif account_type == BinanceAccountType.PORTFOLIO_MARGIN:
-            return BinanceAccountType.PORTFOLIO_MARGIN.base_url
+        return self._base_urls[account_type]
 
     async def put_dapi_v1_listen_key(self):
         """
@@ -1,12 +1,10 @@
-import hashlib
-import hmac
 import orjson
 
 from typing import Any, Dict
-from urllib.parse import urljoin, urlencode
 
 
-from nexustrader.core.log import SpdLog
+from nexustrader.core.log import SpdLog, DEBUG
+from nexustrader.base.api_client import hmac_sha256, encode_query
 from nexustrader.constants import OrderSide, OrderType
 from nexustrader.exchange.binance.error import BinanceClientError, BinanceServerError
 from nexustrader.core.nautilius_core import LiveClock, HttpClient, HttpMethod, HttpResponse
@@ -32,12 +30,13 @@ class BinanceHttpClient:
         }
 
         self._client = HttpClient()
+        # keyed once, signing copies it instead of re-deriving the key pads per request
+        self._hmac_proto = hmac_sha256(secret)
 
     def _generate_signature(self, query: str) -> str:
-        signature = hmac.new(
-            self._secret.encode("utf-8"), query.encode("utf-8"), hashlib.sha256
-        ).hexdigest()
-        return signature
+        mac = self._hmac_proto.copy()
+        mac.update(query.encode("utf-8"))
+        return mac.hexdigest()
 
     async def _fetch(
         self,
@@ -47,17 +46,17 @@ class BinanceHttpClient:
         payload: Dict[str, Any] = None,
         signed: bool = False,
     ):
-        url = urljoin(base_url, endpoint)
-        payload = payload or {}
-        payload["timestamp"] = self._clock.timestamp_ms()
-        payload = urlencode(payload)
+        url = base_url + endpoint
+        timestamp = f"timestamp={self._clock.timestamp_ms()}"
+        payload = f"{encode_query(payload)}&{timestamp}" if payload else timestamp
 
         if signed:
             signature = self._generate_signature(payload)
             payload += f"&signature={signature}"
 
         url += f"?{payload}"
-        self._log.debug(f"Request: {url}")
+        if self._log.should_log(DEBUG):
+            self._log.debug(f"Request: {url}")
 
         response: HttpResponse = await self._client.request(
             method=method,
@@ -285,13 +285,22 @@ class BinanceFuturesBookTicker(msgspec.Struct):
     A: str
 
 
+class BinanceWsError(msgspec.Struct):
+    code: int
+    msg: str
+
+
 class BinanceWsMessageGeneral(msgspec.Struct):
     e: BinanceWsEventType | None = None
     u: int | None = None
+    id: int | None = None  # only set on the response to a SUBSCRIBE request
+    error: BinanceWsError | None = None
 
 
 class BinanceUserDataStreamMsg(msgspec.Struct):
     e: BinanceUserDataStreamWsEventType | None = None
+    id: int | None = None  # only set on the response to a SUBSCRIBE request
+    error: BinanceWsError | None = None
 
 
 class BinanceListenKey(msgspec.Struct):
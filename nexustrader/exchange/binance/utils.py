@@ -5,33 +5,51 @@ from decimal import Decimal
 from nexustrader.schema import Order
 
 
+# the known binance values, lowercased by lookup instead of a str.lower per order
+_ORDER_STATUS_MAP = {
+    status: status.lower()
+    for status in (
+        "NEW",
+        "PARTIALLY_FILLED",
+        "FILLED",
+        "CANCELED",
+        "PENDING_CANCEL",
+        "REJECTED",
+        "EXPIRED",
+        "EXPIRED_IN_MATCH",
+    )
+}
+_POSITION_SIDE_MAP = {"LONG": "long", "SHORT": "short", "BOTH": "both"}
+
+
 def in_orders(orders: List[Order], method: str, params: Dict[str, Any]) -> bool:
-    for order in orders:
-        match method:
-            case "place_limit_order":
-                if (
-                    order.symbol == params["symbol"]
-                    and order.side == params["side"]
-                    and order.amount == params["amount"]
-                    and order.price == params["price"]
-                    and order.type == "limit"
-                ):
-                    return True
-            case "place_market_order":
-                if (
-                    order.symbol == params["symbol"]
-                    and order.side == params["side"]
-                    and order.amount == params["amount"]
-                    and order.type == "market"
-                ):
-                    return True
-            case "cancel_order":
-                if (
-                    order.symbol == params["symbol"]
-                    and order.id == params["id"]
-                    and order.status == "canceled"
-                ):
-                    return True
+    # the method is matched once, then the orders are scanned until the first hit
+    match method:
+        case "place_limit_order":
+            return any(
+                order.symbol == params["symbol"]
+                and order.side == params["side"]
+                and order.amount == params["amount"]
+                and order.price == params["price"]
+                and order.type == "limit"
+                for order in orders
+            )
+        case "place_market_order":
+            return any(
+                order.symbol == params["symbol"]
+                and order.side == params["side"]
+                and order.amount == params["amount"]
+                and order.type == "market"
+                for order in orders
+            )
+        case "cancel_order":
+            return any(
+                order.symbol == params["symbol"]
+                and order.id == params["id"]
+                and order.status == "canceled"
+                for order in orders
+            )
+    return False
 
 
 def parse_ccxt_order(res: Dict[str, Any], exchange: str) -> Order:
@@ -47,10 +65,14 @@ def parse_ccxt_order(res: Dict[str, Any], exchange: str) -> Order:
     amount = res.get("amount", None)
     filled = res.get("filled", None)
     remaining = res.get("remaining", None)
-    status = raw.get("status", None).lower()
+    status = raw.get("status", None)
+    status = _ORDER_STATUS_MAP.get(status) or status.lower()
     cost = res.get("cost", None)
     reduce_only = raw.get("reduceOnly", None)
-    position_side = raw.get("positionSide", "").lower() or None  # long or short
+    position_side = raw.get("positionSide", "")
+    position_side = (
+        _POSITION_SIDE_MAP.get(position_side) or position_side.lower() or None
+    )  # long or short
     time_in_force = res.get("timeInForce", None)
 
     return Order(
@@ -81,39 +103,39 @@ def parse_websocket_stream(
     market_id: Dict[str, Any],
     market_type: Optional[Literal["spot", "swap"]] = None,
 ):
-    event = event_data.get("e", None)
-    match event:
-        case "kline":
-            """
-            {
-                'e': 'kline', 
-                'E': 1727525244267, 
-                's': 'BTCUSDT', 
-                'k': {
-                    't': 1727525220000, 
-                    'T': 1727525279999, 
-                    's': 'BTCUSDT', 
-                    'i': '1m', 
-                    'f': 5422081499, 
-                    'L': 5422081624, 
-                    'o': '65689.80', 
-                    'c': '65689.70', 
-                    'h': '65689.80', 
-                    'l': '65689.70', 
-                    'v': '9.027', 
-                    'n': 126, 
-                    'x': False, 
-                    'q': '592981.58290', 
-                    'V': '6.610', 
-                    'Q': '434209.57800', 
-                    'B': '0'
-                }
-            }
-            """
-            id = f"{event_data['s']}_{market_type}" if market_type else event_data["s"]
-            market = market_id[id]
-            event_data["s"] = market["symbol"]
-            return event_data
+    """
+    {
+        'e': 'kline', 
+        'E': 1727525244267, 
+        's': 'BTCUSDT', 
+        'k': {
+            't': 1727525220000, 
+            'T': 1727525279999, 
+            's': 'BTCUSDT', 
+            'i': '1m', 
+            'f': 5422081499, 
+            'L': 5422081624, 
+            'o': '65689.80', 
+            'c': '65689.70', 
+            'h': '65689.80', 
+            'l': '65689.70', 
+            'v': '9.027', 
+            'n': 126, 
+            'x': False, 
+            'q': '592981.58290', 
+            'V': '6.610', 
+            'Q': '434209.57800', 
+            'B': '0'
+        }
+    }
+    """
+    # kline is the only stream parsed here, no match statement needed
+    if event_data.get("e", None) != "kline":
+        return None
+    id = f"{event_data['s']}_{market_type}" if market_type else event_data["s"]
+    market = market_id[id]
+    event_data["s"] = market["symbol"]
+    return event_data
 
 
 def parse_user_data_stream(event_data: Dict[str, Any], market_id: Dict[str, Any]):
@@ -227,14 +249,11 @@ def parse_user_data_stream(event_data: Dict[str, Any], market_id: Dict[str, Any]
                 }
             }
             """
-            positions = []
+            # the positions are rewritten in place, the list itself stays as decoded
             for position in event_data["a"]["P"]:
-                if (market := market_id.get(position["s"], None)) is None:
-                    id = f"{position['s']}_swap"
-                    market = market_id[id]
+                s = position["s"]
+                market = market_id.get(s) or market_id[f"{s}_swap"]
                 position["s"] = market["symbol"]
-                positions.append(position)
-            event_data["a"]["P"] = positions
             return event_data
 
         case "balanceUpdate":
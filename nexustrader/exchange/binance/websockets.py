@@ -1,5 +1,6 @@
+import orjson
 from typing import Literal, Callable
-from typing import Any
+from typing import Any, Dict, List, Tuple
 from aiolimiter import AsyncLimiter
 
 
@@ -9,6 +10,11 @@ from nexustrader.core.entity import TaskManager
 
 
 class BinanceWSClient(WSClient):
+    # binance takes a list of streams per SUBSCRIBE and caps a connection at 1024
+    MAX_STREAMS_PER_FRAME = 200
+
+    _subscriptions: Dict[str, str]  # subscription id -> stream name
+
     def __init__(
         self,
         account_type: BinanceAccountType,
@@ -23,18 +29,58 @@ class BinanceWSClient(WSClient):
             handler=handler,
             task_manager=task_manager,
         )
+        self._pending_streams: List[str] = []
+        # (request id, streams, frame), rebuilt when streams change
+        self._resubscribe_frames: List[Tuple[int, List[str], bytes]] | None = None
+        self._request_id = 0
+        self._pending_acks: Dict[int, List[str]] = {}  # request id -> streams
+
+    def _subscribe_frames(self, streams: List[str]) -> List[Tuple[int, List[str], bytes]]:
+        step = self.MAX_STREAMS_PER_FRAME
+        frames = []
+        for i in range(0, len(streams), step):
+            # a counter keeps ids unique, so each ack maps back to its streams
+            self._request_id += 1
+            params = streams[i : i + step]
+            raw = orjson.dumps(
+                {"method": "SUBSCRIBE", "params": params, "id": self._request_id}
+            )
+            frames.append((self._request_id, params, raw))
+        return frames
+
+    async def _send_subscribe_frames(self, frames: List[Tuple[int, List[str], bytes]]):
+        for id, params, _ in frames:
+            self._pending_acks[id] = params
+        await self._send_batch([raw for _, _, raw in frames])
+
+    async def _flush_subscriptions(self):
+        streams, self._pending_streams = self._pending_streams, []
+        if not self.connected:
+            # the connection dropped since the subscribe, the streams are already in
+            # `_subscriptions` and go out with the resubscribe of the reconnect
+            self._log.debug(f"Not connected, {len(streams)} streams wait for the resubscribe")
+            return
+        await self._send_subscribe_frames(self._subscribe_frames(streams))
+
+    def on_subscribe_response(self, id: int, error: Any = None):
+        """Match the response of a SUBSCRIBE request to its streams, failures are logged"""
+        streams = self._pending_acks.pop(id, None)
+        if streams is None:
+            return
+        if error:
+            self._log.error(f"Failed to subscribe to {streams}: {error}")
+        else:
+            self._log.debug(f"Subscribed to {len(streams)} streams")
 
     async def _subscribe(self, params: str, subscription_id: str):
         if subscription_id not in self._subscriptions:
             await self.connect()
-            id = self._clock.timestamp_ms()
-            payload = {
-                "method": "SUBSCRIBE",
-                "params": [params],
-                "id": id,
-            }
-            self._subscriptions[subscription_id] = payload
-            await self._send(payload)
+            self._subscriptions[subscription_id] = params
+            self._resubscribe_frames = None
+            # subscribe calls made in the same loop tick share one SUBSCRIBE frame
+            self._pending_streams.append(params)
+            if len(self._pending_streams) == 1:
+                self._task_manager.create_task(self._flush_subscriptions())
             self._log.debug(f"Subscribing to {subscription_id}...")
         else:
             self._log.debug(f"Already subscribed to {subscription_id}")
@@ -105,6 +151,11 @@ class BinanceWSClient(WSClient):
         await self._subscribe(params, subscription_id)
 
     async def _resubscribe(self):
-        for _, payload in self._subscriptions.items():
-            await self._send(payload)
+        # pending streams are already in `_subscriptions`, they go out with the rest
+        self._pending_streams.clear()
+        if self._resubscribe_frames is None:
+            self._resubscribe_frames = self._subscribe_frames(
+                list(self._subscriptions.values())
+            )
+        await self._send_subscribe_frames(self._resubscribe_frames)
 
@@ -91,6 +91,18 @@ class BybitPublicConnector(PublicConnector):
 
     def _ws_msg_handler(self, raw: bytes):
         try:
+            # market data frames start with the topic field, dispatch on the prefix
+            # and decode only once into the typed struct
+            if raw.startswith(b'{"topic":"orderbook'):
+                self._handle_orderbook(raw)
+                return
+            if raw.startswith(b'{"topic":"publicTrade'):
+                self._handle_trade(raw)
+                return
+            if raw.startswith(b'{"topic":"kline'):
+                self._handle_kline(raw)
+                return
+
             ws_msg: BybitWsMessageGeneral = self._ws_msg_general_decoder.decode(raw)
             if ws_msg.ret_msg == "pong":
                 self._ws_client._transport.notify_user_specific_pong_received()
@@ -101,7 +113,7 @@ class BybitPublicConnector(PublicConnector):
                 return
 
             if "orderbook" in ws_msg.topic:
-                self._handle_orderbook(raw, ws_msg.topic)
+                self._handle_orderbook(raw)
             elif "publicTrade" in ws_msg.topic:
                 self._handle_trade(raw)
             elif "kline" in ws_msg.topic:
@@ -145,7 +157,7 @@ class BybitPublicConnector(PublicConnector):
             )
             self._msgbus.publish(topic="trade", msg=trade)
 
-    def _handle_orderbook(self, raw: bytes, topic: str):
+    def _handle_orderbook(self, raw: bytes):
         msg: BybitWsOrderbookDepthMsg = self._ws_msg_orderbook_decoder.decode(raw)
         id = msg.data.s + self.market_type
         symbol = self._market_id[id]
@@ -210,6 +222,8 @@ class BybitPrivateConnector(PrivateConnector):
     _market_id: Dict[str, str]
     _api_client: BybitApiClient
 
+    DEFAULT_RATE_LIMIT = RateLimit(max_rate=10, time_period=1)  # default tier of `/v5/order/create` is 10 req/s
+
     def __init__(
         self,
         exchange: BybitExchangeManager,
@@ -1,4 +1,3 @@
-import asyncio
 from typing import Dict
 from decimal import Decimal
 from nexustrader.constants import AccountType
@@ -13,6 +12,7 @@ from nexustrader.base import ExecutionManagementSystem
 
 class BybitExecutionManagementSystem(ExecutionManagementSystem):
     _market: Dict[str, BybitMarket]
+    ACCOUNT_TYPE = BybitAccountType
 
     def __init__(
         self,
@@ -21,6 +21,9 @@ class BybitExecutionManagementSystem(ExecutionManagementSystem):
         msgbus: MessageBus,
         task_manager: TaskManager,
         registry: OrderRegistry,
+        submit_queue_max: int = 4096,
+        submit_workers: int = 1,
+        order_timeout: float | None = None,
     ):
         super().__init__(
             market=market,
@@ -28,14 +31,12 @@ class BybitExecutionManagementSystem(ExecutionManagementSystem):
             msgbus=msgbus,
             task_manager=task_manager,
             registry=registry,
+            submit_queue_max=submit_queue_max,
+            submit_workers=submit_workers,
+            order_timeout=order_timeout,
         )
         self._bybit_account_type: BybitAccountType = None
 
-    def _build_order_submit_queues(self):
-        for account_type in self._private_connectors.keys():
-            if isinstance(account_type, BybitAccountType):
-                self._order_submit_queues[account_type] = asyncio.Queue()
-
     def _set_account_type(self):
         account_types = self._private_connectors.keys()
         self._bybit_account_type = (
@@ -49,7 +50,7 @@ class BybitExecutionManagementSystem(ExecutionManagementSystem):
     ):
         if not account_type:
             account_type = self._bybit_account_type
-        self._order_submit_queues[account_type].put_nowait(order)
+        self._put_order_submit(account_type, order)
         
     def _get_min_order_amount(self, symbol: str, market: BybitMarket) -> Decimal:
         book = self._cache.bookl1(symbol)
@@ -1,17 +1,14 @@
-import hmac
-import hashlib
-import aiohttp
-import asyncio
 import msgspec
 import orjson
-from typing import Any, Dict, List
-from urllib.parse import urljoin, urlencode
+from typing import Any, Dict, List, Tuple
 from decimal import Decimal
 
 from nexustrader.base import ApiClient
+from nexustrader.base.api_client import encode_query, HTTP_METHODS
+from nexustrader.core.log import DEBUG
 from nexustrader.exchange.bybit.constants import BybitBaseUrl
 from nexustrader.exchange.bybit.error import BybitError
-from nexustrader.core.nautilius_core import hmac_signature
+from nexustrader.core.nautilius_core import hmac_signature, HttpResponse
 from nexustrader.exchange.bybit.schema import (
     BybitResponse,
     BybitOrderResponse,
@@ -22,6 +19,58 @@ from nexustrader.exchange.bybit.schema import (
 )
 
 
+class BybitOrderEncoder:
+    """
+    Encode `/v5/order/create` bodies from a cached JSON prefix per
+    (category, symbol, side, order type), only qty and the extra params are
+    serialized per order
+    """
+
+    # prefix keys a kwarg can repeat, the others are bound to parameters
+    _KEYS = frozenset(("orderType",))
+
+    def __init__(self):
+        self._prefixes: Dict[Tuple[str, str, str, str], str] = {}
+
+    def encode(
+        self,
+        category: str,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: Decimal,
+        **kwargs,
+    ) -> str:
+        key = (category, symbol, side, order_type)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            head = orjson.dumps(
+                {
+                    "category": category,
+                    "symbol": symbol,
+                    "side": side,
+                    "orderType": order_type,
+                }
+            ).decode("utf-8")
+            prefix = f'{head[:-1]},"qty":"'
+            self._prefixes[key] = prefix
+
+        if kwargs:
+            if not self._KEYS.isdisjoint(kwargs):
+                # a kwarg overrides a prefix field, splicing would emit the key twice
+                payload = {
+                    "category": category,
+                    "symbol": symbol,
+                    "side": side,
+                    "orderType": order_type,
+                    "qty": str(qty),
+                    **kwargs,
+                }
+                return orjson.dumps(payload).decode("utf-8")
+            return f'{prefix}{qty}",{orjson.dumps(kwargs).decode("utf-8")[1:]}'
+        return f'{prefix}{qty}"}}'
+
+
 class BybitApiClient(ApiClient):
     def __init__(
         self,
@@ -66,6 +115,14 @@ class BybitApiClient(ApiClient):
         if api_key:
             self._headers["X-BAPI-API-KEY"] = api_key
 
+        # static part of the signed headers, built once per client
+        self._signed_headers = {
+            **self._headers,
+            "X-BAPI-RECV-WINDOW": str(self._recv_window),
+        }
+        # api key and recv window sit between the timestamp and the payload in every signed string
+        self._sign_static = f"{self._api_key}{self._recv_window}"
+
         self._response_decoder = msgspec.json.Decoder(BybitResponse)
         self._order_response_decoder = msgspec.json.Decoder(BybitOrderResponse)
         self._position_response_decoder = msgspec.json.Decoder(BybitPositionResponse)
@@ -78,20 +135,11 @@ class BybitApiClient(ApiClient):
         self._wallet_balance_response_decoder = msgspec.json.Decoder(
             BybitWalletBalanceResponse
         )
-
-    def _generate_signature(self, payload: str) -> List[str]:
-        timestamp = str(self._clock.timestamp_ms())
-
-        param = str(timestamp) + self._api_key + str(self._recv_window) + payload
-        hash = hmac.new(
-            bytes(self._secret, "utf-8"), param.encode("utf-8"), hashlib.sha256
-        )
-        signature = hash.hexdigest()
-        return [signature, timestamp]
+        self._order_encoder = BybitOrderEncoder()
 
     def _generate_signature_v2(self, payload: str) -> List[str]:
         timestamp = str(self._clock.timestamp_ms())
-        param = f"{timestamp}{self._api_key}{self._recv_window}{payload}"
+        param = f"{timestamp}{self._sign_static}{payload}"
         signature = hmac_signature(self._secret, param)  # return hex digest string
         return [signature, timestamp]
 
@@ -100,47 +148,56 @@ class BybitApiClient(ApiClient):
         method: str,
         base_url: str,
         endpoint: str,
-        payload: Dict[str, Any] = None,
+        payload: Dict[str, Any] | str = None,
         signed: bool = False,
     ):
+        """
+        `payload` may be a pre-encoded JSON body for POST requests
+        """
         self._init_session()
 
-        url = urljoin(base_url, endpoint)
+        url = base_url + endpoint
         payload = payload or {}
 
-        payload_str = (
-            urlencode(payload)
-            if method == "GET"
-            else orjson.dumps(payload).decode("utf-8")
-        )
+        # the signature needs the payload as str, the request body as bytes
+        body = None
+        if isinstance(payload, str):
+            payload_str = payload
+            if method != "GET":
+                body = payload.encode("utf-8")
+        elif method == "GET":
+            payload_str = encode_query(payload)
+        else:
+            body = orjson.dumps(payload)
+            payload_str = body.decode("utf-8")
 
         headers = self._headers
         if signed:
             signature, timestamp = self._generate_signature_v2(payload_str)
             headers = {
-                **headers,
+                **self._signed_headers,
                 "X-BAPI-TIMESTAMP": timestamp,
                 "X-BAPI-SIGN": signature,
-                "X-BAPI-RECV-WINDOW": str(self._recv_window),
             }
 
         if method == "GET":
             url += f"?{payload_str}"
-            payload_str = None
 
         try:
-            self._log.debug(f"Request: {url} {payload_str}")
-            response = await self._session.request(
-                method=method,
+            if self._log.should_log(DEBUG):
+                self._log.debug(f"Request: {url} {payload_str if body is not None else None}")
+            response: HttpResponse = await self._client.request(
+                method=HTTP_METHODS[method],
                 url=url,
                 headers=headers,
-                data=payload_str,
+                body=body,
+                timeout_secs=self._timeout,
             )
-            raw = await response.read()
+            raw = response.body
             if response.status >= 400:
                 raise BybitError(
                     code=response.status,
-                    message=orjson.loads(raw) if raw else None,
+                    message=self._decode_error_body(raw),
                 )
             bybit_response: BybitResponse = self._response_decoder.decode(raw)
             if bybit_response.retCode == 0:
@@ -150,12 +207,6 @@ class BybitApiClient(ApiClient):
                     code=bybit_response.retCode,
                     message=bybit_response.retMsg,
                 )
-        except aiohttp.ClientError as e:
-            self._log.error(f"Client Error {method} Url: {url} {e}")
-            raise
-        except asyncio.TimeoutError:
-            self._log.error(f"Timeout {method} Url: {url}")
-            raise
         except Exception as e:
             self._log.error(f"Error {method} Url: {url} {e}")
             raise
@@ -173,14 +224,9 @@ class BybitApiClient(ApiClient):
         https://bybit-exchange.github.io/docs/v5/order/create-order
         """
         endpoint = "/v5/order/create"
-        payload = {
-            "category": category,
-            "symbol": symbol,
-            "side": side,
-            "orderType": order_type,
-            "qty": str(qty),
-            **kwargs,
-        }
+        payload = self._order_encoder.encode(
+            category, symbol, side, order_type, qty, **kwargs
+        )
         raw = await self._fetch("POST", self._base_url, endpoint, payload, signed=True)
         return self._order_response_decoder.decode(raw)
 
@@ -1,3 +1,4 @@
+import heapq
 import msgspec
 from decimal import Decimal
 from typing import Final
@@ -212,21 +213,30 @@ class BybitOrderBook(msgspec.Struct):
             self.asks[float(price)] = float(size)
 
     def _handle_delta(self, data: BybitWsOrderbookDepth) -> None:
+        bids = self.bids
         for price, size in data.b:
-            if float(size) == 0:
-                self.bids.pop(float(price))
+            size = float(size)
+            if size == 0:
+                bids.pop(float(price), None)
             else:
-                self.bids[float(price)] = float(size)
+                bids[float(price)] = size
 
+        asks = self.asks
         for price, size in data.a:
-            if float(size) == 0:
-                self.asks.pop(float(price))
+            size = float(size)
+            if size == 0:
+                asks.pop(float(price), None)
             else:
-                self.asks[float(price)] = float(size)
+                asks[float(price)] = size
 
     def _get_orderbook(self, levels: int):
-        bids = sorted(self.bids.items(), reverse=True)[:levels]  # bids descending
-        asks = sorted(self.asks.items())[:levels]  # asks ascending
+        # partial selection instead of sorting the whole book on every update
+        if levels == 1:
+            bids = [max(self.bids.items())] if self.bids else []
+            asks = [min(self.asks.items())] if self.asks else []
+        else:
+            bids = heapq.nlargest(levels, self.bids.items())  # bids descending
+            asks = heapq.nsmallest(levels, self.asks.items())  # asks ascending
         return {
             "bids": bids,
             "asks": asks,
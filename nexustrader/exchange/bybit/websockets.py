@@ -2,7 +2,7 @@ import hmac
 import orjson
 import asyncio
 
-from typing import Any, Callable
+from typing import Any, Callable, Dict, List
 from aiolimiter import AsyncLimiter
 
 from nexustrader.base import WSClient
@@ -11,6 +11,11 @@ from nexustrader.exchange.bybit.constants import BybitAccountType, BybitKlineInt
 
 
 class BybitWSClient(WSClient):
+    # bybit accepts up to 10 topics per subscribe request
+    MAX_TOPICS_PER_FRAME = 10
+
+    _subscriptions: Dict[str, str]  # subscription id -> topic
+
     def __init__(
         self,
         account_type: BybitAccountType,
@@ -38,6 +43,7 @@ class BybitWSClient(WSClient):
             specific_ping_msg=orjson.dumps({"op": "ping"}),
             auto_ping_strategy="ping_when_idle",
         )
+        self._resubscribe_frames: List[bytes] | None = None  # rebuilt when topics change
 
     @property
     def is_private(self):
@@ -45,13 +51,11 @@ class BybitWSClient(WSClient):
 
     def _generate_signature(self):
         expires = self._clock.timestamp_ms() + 1_000
-        signature = str(
-            hmac.new(
-                bytes(self._secret, "utf-8"),
-                bytes(f"GET/realtime{expires}", "utf-8"),
-                digestmod="sha256",
-            ).hexdigest()
-        )
+        signature = hmac.digest(
+            self._secret.encode("utf-8"),
+            f"GET/realtime{expires}".encode("utf-8"),
+            "sha256",
+        ).hex()
         return signature, expires
 
     def _get_auth_payload(self):
@@ -64,14 +68,21 @@ class BybitWSClient(WSClient):
             self._authed = True
             await asyncio.sleep(5)
 
+    def _subscribe_frames(self, topics: List[str]) -> List[bytes]:
+        step = self.MAX_TOPICS_PER_FRAME
+        return [
+            orjson.dumps({"op": "subscribe", "args": topics[i : i + step]})
+            for i in range(0, len(topics), step)
+        ]
+
     async def _subscribe(self, topic: str, auth: bool = False):
         if topic not in self._subscriptions:
             await self.connect()
-            payload = {"op": "subscribe", "args": [topic]}
             if auth:
                 await self._auth()
-            self._subscriptions[topic] = payload
-            await self._send(payload)
+            self._subscriptions[topic] = topic
+            self._resubscribe_frames = None
+            await self._send({"op": "subscribe", "args": [topic]})
             self._log.debug(f"Subscribing to {topic}.{self._account_type.value}...")
         else:
             self._log.debug(f"Already subscribed to {topic}")
@@ -100,8 +111,11 @@ class BybitWSClient(WSClient):
         if self.is_private:
             self._authed = False
             await self._auth()
-        for _, payload in self._subscriptions.items():
-            await self._send(payload)
+        if self._resubscribe_frames is None:
+            self._resubscribe_frames = self._subscribe_frames(
+                list(self._subscriptions.values())
+            )
+        await self._send_batch(self._resubscribe_frames)
 
     async def subscribe_order(self, topic: str = "order"):
         """subscribe to order"""
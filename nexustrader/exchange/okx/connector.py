@@ -36,6 +36,23 @@ from nexustrader.exchange.okx.constants import (
     OkxKlineInterval,
 )
 
+# data pushes are serialized as {"arg":{"channel":"<channel>",...},"data":[...]}
+_PUSH_PREFIX = b'{"arg":{"channel":"'
+_PUSH_PREFIX_LEN = len(_PUSH_PREFIX)
+
+
+def _push_channel(raw: bytes) -> str | None:
+    """
+    Read the channel of a data push straight from the frame bytes, so the frame is decoded
+    once by its channel decoder. None for event frames or any other layout, those go through
+    the general decoder
+    """
+    if raw.startswith(_PUSH_PREFIX):
+        end = raw.find(b'"', _PUSH_PREFIX_LEN)
+        if end != -1:
+            return raw[_PUSH_PREFIX_LEN:end].decode()
+    return None
+
 
 class OkxPublicConnector(PublicConnector):
     _ws_client: OkxWSClient
@@ -73,9 +90,15 @@ class OkxPublicConnector(PublicConnector):
             business_url=True,
         )
         self._ws_msg_general_decoder = msgspec.json.Decoder(OkxWsGeneralMsg)
-        self._ws_msg_bbo_tbt_decoder = msgspec.json.Decoder(OkxWsBboTbtMsg)
+        self._ws_msg_bbo_tbt_decoder = msgspec.json.Decoder(OkxWsBboTbtMsg, strict=False)
         self._ws_msg_candle_decoder = msgspec.json.Decoder(OkxWsCandleMsg)
-        self._ws_msg_trade_decoder = msgspec.json.Decoder(OkxWsTradeMsg)
+        self._ws_msg_trade_decoder = msgspec.json.Decoder(OkxWsTradeMsg, strict=False)
+        self._ws_handlers = {
+            "bbo-tbt": self._handle_bbo_tbt,
+            "trades": self._handle_trade,
+            # candles arrive on the business socket
+            **{interval.value: self._handle_kline for interval in OkxKlineInterval},
+        }
 
     def request_klines(
         self,
@@ -113,13 +136,16 @@ class OkxPublicConnector(PublicConnector):
             self._log.debug(f"Pong received:{str(raw)}")
             return
         try:
-            ws_msg: OkxWsGeneralMsg = self._ws_msg_general_decoder.decode(raw)
-            if ws_msg.is_event_msg:
-                self._handle_event_msg(ws_msg)
-            else:
-                channel: str = ws_msg.arg.channel
-                if channel.startswith("candle"):
-                    self._handle_kline(raw)
+            channel = _push_channel(raw)
+            if channel is None:
+                ws_msg: OkxWsGeneralMsg = self._ws_msg_general_decoder.decode(raw)
+                if ws_msg.is_event_msg:
+                    self._handle_event_msg(ws_msg)
+                    return
+                channel = ws_msg.arg.channel
+            handler = self._ws_handlers.get(channel)
+            if handler:
+                handler(raw)
         except msgspec.DecodeError:
             self._log.error(f"Error decoding message: {str(raw)}")
 
@@ -129,17 +155,16 @@ class OkxPublicConnector(PublicConnector):
             self._log.debug(f"Pong received:{str(raw)}")
             return
         try:
-            ws_msg: OkxWsGeneralMsg = self._ws_msg_general_decoder.decode(raw)
-            if ws_msg.is_event_msg:
-                self._handle_event_msg(ws_msg)
-            else:
-                channel: str = ws_msg.arg.channel
-                if channel == "bbo-tbt":
-                    self._handle_bbo_tbt(raw)
-                elif channel == "trades":
-                    self._handle_trade(raw)
-                elif channel.startswith("candle"):
-                    self._handle_kline(raw)
+            channel = _push_channel(raw)
+            if channel is None:
+                ws_msg: OkxWsGeneralMsg = self._ws_msg_general_decoder.decode(raw)
+                if ws_msg.is_event_msg:
+                    self._handle_event_msg(ws_msg)
+                    return
+                channel = ws_msg.arg.channel
+            handler = self._ws_handlers.get(channel)
+            if handler:
+                handler(raw)
         except msgspec.DecodeError:
             self._log.error(f"Error decoding message: {str(raw)}")
 
@@ -183,9 +208,9 @@ class OkxPublicConnector(PublicConnector):
             trade = Trade(
                 exchange=self._exchange_id,
                 symbol=symbol,
-                price=float(d.px),
-                size=float(d.sz),
-                timestamp=int(d.ts),
+                price=d.px,
+                size=d.sz,
+                timestamp=d.ts,
             )
             self._msgbus.publish(topic="trade", msg=trade)
 
@@ -199,11 +224,11 @@ class OkxPublicConnector(PublicConnector):
             bookl1 = BookL1(
                 exchange=self._exchange_id,
                 symbol=symbol,
-                bid=float(d.bids[0][0]),
-                ask=float(d.asks[0][0]),
-                bid_size=float(d.bids[0][1]),
-                ask_size=float(d.asks[0][1]),
-                timestamp=int(d.ts),
+                bid=d.bids[0][0],
+                ask=d.asks[0][0],
+                bid_size=d.bids[0][1],
+                ask_size=d.asks[0][1],
+                timestamp=d.ts,
             )
             self._msgbus.publish(topic="bookl1", msg=bookl1)
 
@@ -219,6 +244,8 @@ class OkxPrivateConnector(PrivateConnector):
     _market: Dict[str, OkxMarket]
     _market_id: Dict[str, str]
 
+    DEFAULT_RATE_LIMIT = RateLimit(max_rate=60, time_period=2)  # `/api/v5/trade/order` allows 60 req/2s
+
     def __init__(
         self,
         exchange: OkxExchangeManager,
@@ -265,6 +292,11 @@ class OkxPrivateConnector(PrivateConnector):
         self._decoder_ws_account_msg = msgspec.json.Decoder(
             OkxWsAccountMsg, strict=False
         )
+        self._ws_handlers = {
+            "orders": self._handle_orders,
+            "positions": self._handle_positions,
+            "account": self._handle_account,
+        }
 
     async def connect(self):
         await super().connect()
@@ -323,17 +355,16 @@ class OkxPrivateConnector(PrivateConnector):
             self._log.debug(f"Pong received: {str(raw)}")
             return
         try:
-            ws_msg: OkxWsGeneralMsg = self._decoder_ws_general_msg.decode(raw)
-            if ws_msg.is_event_msg:
-                self._handle_event_msg(ws_msg)
-            else:
+            channel = _push_channel(raw)
+            if channel is None:
+                ws_msg: OkxWsGeneralMsg = self._decoder_ws_general_msg.decode(raw)
+                if ws_msg.is_event_msg:
+                    self._handle_event_msg(ws_msg)
+                    return
                 channel = ws_msg.arg.channel
-                if channel == "orders":
-                    self._handle_orders(raw)
-                elif channel == "positions":
-                    self._handle_positions(raw)
-                elif channel == "account":
-                    self._handle_account(raw)
+            handler = self._ws_handlers.get(channel)
+            if handler:
+                handler(raw)
         except msgspec.DecodeError as e:
             self._log.error(f"Error decoding message: {str(raw)} {e}")
 
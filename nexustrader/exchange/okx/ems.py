@@ -1,6 +1,5 @@
-import asyncio
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, List
 from nexustrader.constants import AccountType
 from nexustrader.schema import OrderSubmit
 from nexustrader.core.cache import AsyncCache
@@ -14,6 +13,7 @@ from nexustrader.base import ExecutionManagementSystem
 
 class OkxExecutionManagementSystem(ExecutionManagementSystem):
     _market: Dict[str, OkxMarket]
+    ACCOUNT_TYPE = OkxAccountType
 
     OKX_ACCOUNT_TYPE_PRIORITY = [
         OkxAccountType.DEMO,
@@ -28,6 +28,9 @@ class OkxExecutionManagementSystem(ExecutionManagementSystem):
         msgbus: MessageBus,
         task_manager: TaskManager,
         registry: OrderRegistry,
+        submit_queue_max: int = 4096,
+        submit_workers: int = 1,
+        order_timeout: float | None = None,
     ):
         super().__init__(
             market=market,
@@ -35,14 +38,17 @@ class OkxExecutionManagementSystem(ExecutionManagementSystem):
             msgbus=msgbus,
             task_manager=task_manager,
             registry=registry,
+            submit_queue_max=submit_queue_max,
+            submit_workers=submit_workers,
+            order_timeout=order_timeout,
         )
         self._okx_account_type: OkxAccountType = None
 
-    def _build_order_submit_queues(self):
-        for account_type in self._private_connectors.keys():
-            if isinstance(account_type, OkxAccountType):
-                self._order_submit_queues[account_type] = asyncio.Queue()
-                break
+    def _submit_account_types(self) -> List[AccountType]:
+        # okx trades through a single account, the one picked by priority gets the submit queues
+        if self._okx_account_type is None:
+            return []
+        return [self._okx_account_type]
 
     def _set_account_type(self):
         account_types = self._private_connectors.keys()
@@ -56,7 +62,7 @@ class OkxExecutionManagementSystem(ExecutionManagementSystem):
     ):
         if not account_type:
             account_type = self._okx_account_type
-        self._order_submit_queues[account_type].put_nowait(order)
+        self._put_order_submit(account_type, order)
 
     def _get_min_order_amount(self, symbol: str, market: OkxMarket) -> Decimal:
         min_order_amount = market.limits.amount.min
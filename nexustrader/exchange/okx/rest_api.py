@@ -1,12 +1,11 @@
+import time
 import msgspec
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import orjson
-import hmac
-import base64
-import asyncio
-import aiohttp
-from urllib.parse import urljoin, urlencode
+import binascii
 from nexustrader.base import ApiClient
+from nexustrader.base.api_client import encode_query, HTTP_METHODS
+from nexustrader.core.log import DEBUG
 from nexustrader.exchange.okx.constants import OkxRestUrl
 from nexustrader.exchange.okx.error import OkxHttpError, OkxRequestError
 from nexustrader.exchange.okx.schema import (
@@ -17,7 +16,59 @@ from nexustrader.exchange.okx.schema import (
     OkxBalanceResponse,
     OkxPositionResponse,
 )
-from nexustrader.core.nautilius_core import hmac_signature
+from nexustrader.core.nautilius_core import hmac_signature, HttpResponse
+
+
+class OkxOrderEncoder:
+    """
+    Encode `/api/v5/trade/order` bodies from a cached JSON prefix per
+    (instId, tdMode, side, ordType), only sz and the extra params are
+    serialized per order
+    """
+
+    # prefix keys a kwarg can repeat, `side` and `sz` are bound to parameters
+    _KEYS = frozenset(("instId", "tdMode", "ordType"))
+
+    def __init__(self):
+        self._prefixes: Dict[Tuple[str, str, str, str], str] = {}
+
+    def encode(
+        self,
+        inst_id: str,
+        td_mode: str,
+        side: str,
+        ord_type: str,
+        sz: str,
+        **kwargs,
+    ) -> str:
+        key = (inst_id, td_mode, side, ord_type)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            head = orjson.dumps(
+                {
+                    "instId": inst_id,
+                    "tdMode": td_mode,
+                    "side": side,
+                    "ordType": ord_type,
+                }
+            ).decode("utf-8")
+            prefix = f'{head[:-1]},"sz":"'
+            self._prefixes[key] = prefix
+
+        if kwargs:
+            if not self._KEYS.isdisjoint(kwargs):
+                # a kwarg overrides a prefix field, splicing would emit the key twice
+                payload = {
+                    "instId": inst_id,
+                    "tdMode": td_mode,
+                    "side": side,
+                    "ordType": ord_type,
+                    "sz": sz,
+                    **kwargs,
+                }
+                return orjson.dumps(payload).decode("utf-8")
+            return f'{prefix}{sz}",{orjson.dumps(kwargs).decode("utf-8")[1:]}'
+        return f'{prefix}{sz}"}}'
 
 
 class OkxApiClient(ApiClient):
@@ -48,7 +99,18 @@ class OkxApiClient(ApiClient):
             "Content-Type": "application/json",
             "User-Agent": "TradingBot/1.0",
         }
-        
+        # static part of the signed headers, built once per client
+        self._signed_headers = {
+            **self._headers,
+            "OK-ACCESS-KEY": api_key,
+            "OK-ACCESS-PASSPHRASE": passphrase,
+        }
+        if testnet:
+            self._signed_headers["x-simulated-trading"] = "1"
+        self._order_encoder = OkxOrderEncoder()
+        self._ts_sec: int | None = None
+        self._ts_prefix = ""
+
     async def get_api_v5_account_balance(self, ccy: str | None = None) -> OkxBalanceResponse:
         endpoint = "/api/v5/account/balance"
         payload = {"ccy": ccy} if ccy else {}
@@ -83,14 +145,9 @@ class OkxApiClient(ApiClient):
         {'arg': {'channel': 'orders', 'instType': 'ANY', 'uid': '611800569950521616'}, 'data': [{'instType': 'SWAP', 'instId': 'BTC-USDT-SWAP', 'tgtCcy': '', 'ccy': '', 'ordId': '1993784914940116992', 'clOrdId': '', 'algoClOrdId': '', 'algoId': '', 'tag': '', 'px': '80000', 'sz': '0.1', 'notionalUsd': '80.0128', 'ordType': 'limit', 'side': 'buy', 'posSide': 'long', 'tdMode': 'cross', 'accFillSz': '0', 'fillNotionalUsd': '', 'avgPx': '0', 'state': 'canceled', 'lever': '3', 'pnl': '0', 'feeCcy': 'USDT', 'fee': '0', 'rebateCcy': 'USDT', 'rebate': '0', 'category': 'normal', 'uTime': '1731921825881', 'cTime': '1731921820806', 'source': '', 'reduceOnly': 'false', 'cancelSource': '1', 'quickMgnType': '', 'stpId': '', 'stpMode': 'cancel_maker', 'attachAlgoClOrdId': '', 'lastPx': '91880', 'isTpLimit': 'false', 'slTriggerPx': '', 'slTriggerPxType': '', 'tpOrdPx': '', 'tpTriggerPx': '', 'tpTriggerPxType': '', 'slOrdPx': '', 'fillPx': '', 'tradeId': '', 'fillSz': '0', 'fillTime': '', 'fillPnl': '0', 'fillFee': '0', 'fillFeeCcy': '', 'execType': '', 'fillPxVol': '', 'fillPxUsd': '', 'fillMarkVol': '', 'fillFwdPx': '', 'fillMarkPx': '', 'amendSource': '', 'reqId': '', 'amendResult': '', 'code': '0', 'msg': '', 'pxType': '', 'pxUsd': '', 'pxVol': '', 'linkedAlgoOrd': {'algoId': ''}, 'attachAlgoOrds': []}]}
         """
         endpoint = "/api/v5/trade/order"
-        payload = {
-            "instId": inst_id,
-            "tdMode": td_mode,
-            "side": side,
-            "ordType": ord_type,
-            "sz": sz,
-            **kwargs,
-        }
+        payload = self._order_encoder.encode(
+            inst_id, td_mode, side, ord_type, sz, **kwargs
+        )
         raw = await self._fetch("POST", endpoint, payload=payload, signed=True)
         return self._place_order_decoder.decode(raw)
 
@@ -111,114 +168,105 @@ class OkxApiClient(ApiClient):
         raw = await self._fetch("POST", endpoint, payload=payload, signed=True)
         return self._cancel_order_decoder.decode(raw)
 
-    def _generate_signature(self, message: str) -> str:
-        mac = hmac.new(
-            bytes(self._secret, encoding="utf8"),
-            bytes(message, encoding="utf-8"),
-            digestmod="sha256",
-        )
-        return base64.b64encode(mac.digest()).decode()
-
     def _generate_signature_v2(self, message: str) -> str:
         hex_digest = hmac_signature(self._secret, message)
         digest = bytes.fromhex(hex_digest)
-        return base64.b64encode(digest).decode()
-
-    async def _get_signature(
-        self, ts: str, method: str, request_path: str, payload: Dict[str, Any] = None
-    ) -> str:
-        body = ""
-        if payload:
-            body = orjson.dumps(payload).decode()
+        return binascii.b2a_base64(digest, newline=False).decode("ascii")
 
+    def _get_signature(self, ts: str, method: str, request_path: str, body: str) -> str:
         sign_str = f"{ts}{method}{request_path}{body}"
         signature = self._generate_signature_v2(sign_str)
         return signature
 
     def _get_timestamp(self) -> str:
-        return (
-            self._clock.utc_now()
-            .isoformat(timespec="milliseconds")
-            .replace("+00:00", "Z")
-        )
+        """ISO 8601 UTC with milliseconds, e.g. `2024-11-18T09:23:40.881Z`"""
+        sec, ms = divmod(self._clock.timestamp_ms(), 1000)
+        if sec != self._ts_sec:
+            # the seconds part only changes once per second, format it then
+            self._ts_sec = sec
+            self._ts_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        return f"{self._ts_prefix}.{ms:03d}Z"
 
-    async def _get_headers(
-        self, ts: str, method: str, request_path: str, payload: Dict[str, Any] = None
+    def _get_headers(
+        self, ts: str, method: str, request_path: str, body: str
     ) -> Dict[str, Any]:
-        headers = self._headers
-        signature = await self._get_signature(ts, method, request_path, payload)
-        headers.update(
-            {
-                "OK-ACCESS-KEY": self._api_key,
-                "OK-ACCESS-SIGN": signature,
-                "OK-ACCESS-TIMESTAMP": ts,
-                "OK-ACCESS-PASSPHRASE": self._passphrase,
-            }
-        )
-        if self._testnet:
-            headers["x-simulated-trading"] = "1"
-        return headers
+        signature = self._get_signature(ts, method, request_path, body)
+        return {
+            **self._signed_headers,
+            "OK-ACCESS-SIGN": signature,
+            "OK-ACCESS-TIMESTAMP": ts,
+        }
 
     async def _fetch(
         self,
         method: str,
         endpoint: str,
-        payload: Dict[str, Any] = None,
+        payload: Dict[str, Any] | str = None,
         signed: bool = False,
     ) -> bytes:
+        """
+        `payload` may be a pre-encoded JSON body for POST requests
+        """
         self._init_session()
-        url = urljoin(self._base_url, endpoint)
-        request_path = endpoint
         headers = self._headers
-        timestamp = self._get_timestamp()
 
         payload = payload or {}
 
-        payload_json = urlencode(payload) if method == "GET" else orjson.dumps(payload)
-
+        # the signature covers exactly what is sent: the query for GET, the JSON body otherwise
         if method == "GET":
-            url += f"?{payload_json}"
+            request_path = f"{endpoint}?{encode_query(payload)}" if payload else endpoint
             payload_json = None
+            body = ""
+        elif isinstance(payload, str):
+            request_path = endpoint
+            payload_json = payload.encode("utf-8")
+            body = payload
+        else:
+            request_path = endpoint
+            payload_json = orjson.dumps(payload)
+            body = payload_json.decode("utf-8")
+        url = self._base_url + request_path
 
         if signed and self._api_key:
-            headers = await self._get_headers(timestamp, method, request_path, payload)
+            headers = self._get_headers(self._get_timestamp(), method, request_path, body)
 
         try:
-            self._log.debug(
-                f"Request {method} Url: {url} Headers: {headers} Payload: {payload_json}"
-            )
+            if self._log.should_log(DEBUG):
+                self._log.debug(
+                    f"Request {method} Url: {url} Headers: {headers} Payload: {payload_json}"
+                )
 
-            response = await self._session.request(
-                method=method,
+            response: HttpResponse = await self._client.request(
+                method=HTTP_METHODS[method],
                 url=url,
                 headers=headers,
-                data=payload_json,
+                body=payload_json,
+                timeout_secs=self._timeout,
             )
-            raw = await response.read()
+            raw = response.body
 
             if response.status >= 400:
                 raise OkxHttpError(
                     status_code=response.status,
-                    message=orjson.loads(raw),
+                    message=self._decode_error_body(raw),
                     headers=response.headers,
                 )
             okx_response = self._general_response_decoder.decode(raw)
             if okx_response.code == "0":
                 return raw
-            else:
-                okx_error_response = self._error_response_decoder.decode(raw)
-                for data in okx_error_response.data:
-                    raise OkxRequestError(
-                        error_code=data.sCode,
-                        status_code=response.status,
-                        message=data.sMsg,
-                    )
-        except aiohttp.ClientError as e:
-            self._log.error(f"Client Error {method} Url: {url} {e}")
-            raise
-        except asyncio.TimeoutError:
-            self._log.error(f"Timeout {method} Url: {url}")
-            raise
+            # error bodies are small and rare, decode the per-item details only here
+            okx_error_response = self._error_response_decoder.decode(raw)
+            for data in okx_error_response.data:
+                raise OkxRequestError(
+                    error_code=data.sCode,
+                    status_code=response.status,
+                    message=data.sMsg,
+                )
+            raise OkxRequestError(
+                error_code=okx_response.code,
+                status_code=response.status,
+                message=okx_response.msg,
+            )
         except Exception as e:
             self._log.error(f"Error {method} Url: {url} {e}")
             raise
@@ -38,10 +38,11 @@ class OkxWsGeneralMsg(msgspec.Struct):
 
 
 class OkxWsBboTbtData(msgspec.Struct):
-    ts: str
+    # OKX sends the numbers as strings, decode with `strict=False` to get them as numbers
+    ts: int
     seqId: int
-    asks: list[list[str]]
-    bids: list[list[str]]
+    asks: list[list[float]]
+    bids: list[list[float]]
 
 
 class OkxWsBboTbtMsg(msgspec.Struct):
@@ -80,12 +81,13 @@ class OkxWsCandleMsg(msgspec.Struct):
 
 
 class OkxWsTradeData(msgspec.Struct):
+    # OKX sends the numbers as strings, decode with `strict=False` to get them as numbers
     instId: str
     tradeId: str
-    px: str
-    sz: str
+    px: float
+    sz: float
     side: str
-    ts: str
+    ts: int
     count: str
 
 
@@ -205,8 +207,8 @@ class OkxErrorData(msgspec.Struct):
 
 class OkxErrorResponse(msgspec.Struct):
     code: str
-    data: list[OkxErrorData]
     msg: str
+    data: list[OkxErrorData] = []
 
 
 class OkxCancelOrderData(msgspec.Struct):
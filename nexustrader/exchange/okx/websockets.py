@@ -1,19 +1,31 @@
 import time
 import hmac
-import base64
+import binascii
 import asyncio
+import orjson
 
 from typing import Literal
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import List
+from typing import Tuple
 from aiolimiter import AsyncLimiter
 
 from nexustrader.base import WSClient
 from nexustrader.exchange.okx.constants import OkxAccountType, OkxKlineInterval
 from nexustrader.core.entity import TaskManager
 
+# the login signs `{timestamp}GET/users/self/verify`
+_AUTH_SUFFIX = b"GET/users/self/verify"
+
+
 class OkxWSClient(WSClient):
+    # okx takes a list of args per subscribe request, capped at 64KB of args per frame
+    MAX_ARGS_PER_FRAME = 100
+
+    _subscriptions: Dict[Tuple[str, str], Dict[str, Any]]  # (channel, instId or instType) -> subscribe arg
+
     def __init__(
         self,
         account_type: OkxAccountType,
@@ -26,6 +38,7 @@ class OkxWSClient(WSClient):
     ):
         self._api_key = api_key
         self._secret = secret
+        self._secret_bytes = secret.encode("utf-8") if secret is not None else None
         self._passphrase = passphrase
         self._account_type = account_type
         self._authed = False
@@ -47,6 +60,7 @@ class OkxWSClient(WSClient):
             ping_idle_timeout=5,
             ping_reply_timeout=2,
         )
+        self._resubscribe_frames: List[bytes] | None = None  # rebuilt when args change
 
     @property
     def is_private(self):
@@ -57,22 +71,16 @@ class OkxWSClient(WSClient):
         )
 
     def _get_auth_payload(self):
-        timestamp = int(time.time())
-        message = str(timestamp) + "GET" + "/users/self/verify"
-        mac = hmac.new(
-            bytes(self._secret, encoding="utf8"),
-            bytes(message, encoding="utf-8"),
-            digestmod="sha256",
-        )
-        d = mac.digest()
-        sign = base64.b64encode(d)
         if self._api_key is None or self._passphrase is None or self._secret is None:
             raise ValueError("API Key, Passphrase, or Secret is missing.")
+        timestamp = int(time.time())
+        d = hmac.digest(self._secret_bytes, b"%d%s" % (timestamp, _AUTH_SUFFIX), "sha256")
+        sign = binascii.b2a_base64(d, newline=False).decode("ascii")
         arg = {
             "apiKey": self._api_key,
             "passphrase": self._passphrase,
             "timestamp": timestamp,
-            "sign": sign.decode("utf-8"),
+            "sign": sign,
         }
         payload = {"op": "login", "args": [arg]}
         return payload
@@ -94,23 +102,32 @@ class OkxWSClient(WSClient):
         }
         await self._send(payload)
 
-    async def _subscribe(self, params: Dict[str, Any], subscription_id: str, auth: bool = False):
-        if subscription_id not in self._subscriptions:
-            await self.connect()
+    def _subscribe_frames(self, args: List[Dict[str, Any]]) -> List[bytes]:
+        step = self.MAX_ARGS_PER_FRAME
+        return [
+            orjson.dumps({"op": "subscribe", "args": args[i : i + step]})
+            for i in range(0, len(args), step)
+        ]
+
+    async def _subscribe(self, args: List[Dict[str, Any]], auth: bool = False):
+        new_args: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for params in args:
+            subscription_id = (params["channel"], params.get("instId") or params.get("instType", ""))
+            if subscription_id in self._subscriptions:
+                self._log.debug(f"Already subscribed to {subscription_id}")
+                continue
+            new_args[subscription_id] = params
+        if not new_args:
+            return
 
-            if auth:
-                await self._auth()
+        await self.connect()
+        if auth:
+            await self._auth()
+        await self._send_batch(self._subscribe_frames(list(new_args.values())))
+        # recorded once sent, a failed connect or send leaves the args free to retry
+        self._subscriptions.update(new_args)
+        self._resubscribe_frames = None
 
-            payload = {
-                "op": "subscribe",
-                "args": [params],
-            }
-            
-            self._subscriptions[subscription_id] = payload
-            await self._send(payload)
-        else:
-            print(f"Already subscribed to {subscription_id}")
-    
     async def place_order(self, inst_id: str, td_mode: str, side: str, ord_type: str, sz: str, **kwargs):
         params = {
             "instId": inst_id,
@@ -133,6 +150,12 @@ class OkxWSClient(WSClient):
         await self._submit("cancel-order", params)
         
 
+    async def subscribe_many(self, channel: str, inst_ids: List[str]):
+        """
+        Subscribe `channel` for every instrument in `inst_ids` with one request
+        """
+        await self._subscribe([{"channel": channel, "instId": inst_id} for inst_id in inst_ids])
+
     async def subscribe_order_book(
         self,
         symbol: str,
@@ -143,17 +166,13 @@ class OkxWSClient(WSClient):
         """
         https://www.okx.com/docs-v5/en/#order-book-trading-market-data-ws-order-book-channel
         """
-        params = {"channel": channel, "instId": symbol}
-        subscription_id = f"{channel}.{symbol}"
-        await self._subscribe(params, subscription_id)
+        await self.subscribe_many(channel, [symbol])
 
     async def subscribe_trade(self, symbol: str):
         """
         https://www.okx.com/docs-v5/en/#order-book-trading-market-data-ws-all-trades-channel
         """
-        params = {"channel": "trades", "instId": symbol}
-        subscription_id = f"trade.{symbol}"
-        await self._subscribe(params, subscription_id)
+        await self.subscribe_many("trades", [symbol])
 
     async def subscribe_candlesticks(
         self,
@@ -165,43 +184,38 @@ class OkxWSClient(WSClient):
         """
         if not self._business_url:
             raise ValueError("candlesticks are only supported on business url")
-        channel = interval.value
-        params = {"channel": channel, "instId": symbol}
-        subscription_id = f"{channel}.{symbol}"
-        await self._subscribe(params, subscription_id)
+        await self.subscribe_many(interval.value, [symbol])
 
     async def subscribe_account(self):
         params = {"channel": "account"}
-        subscription_id = "account"
-        await self._subscribe(params, subscription_id, auth=True)
+        await self._subscribe([params], auth=True)
 
     async def subscribe_account_position(self):
         params = {"channel": "balance_and_position"}
-        subscription_id = "account_position"
-        await self._subscribe(params, subscription_id, auth=True)
+        await self._subscribe([params], auth=True)
 
     async def subscribe_positions(
         self, inst_type: Literal["MARGIN", "SWAP", "FUTURES", "OPTION", "ANY"] = "ANY"
     ):
-        subscription_id = f"position.{inst_type}"
         params = {"channel": "positions", "instType": inst_type}
-        await self._subscribe(params, subscription_id, auth=True)
+        await self._subscribe([params], auth=True)
 
     async def subscribe_orders(
         self, inst_type: Literal["MARGIN", "SWAP", "FUTURES", "OPTION", "ANY"] = "ANY"
     ):
-        subscription_id = f"orders.{inst_type}"
         params = {"channel": "orders", "instType": inst_type}
-        await self._subscribe(params, subscription_id, auth=True)
+        await self._subscribe([params], auth=True)
 
     async def subscribe_fills(self):
-        subscription_id = "fills"
         params = {"channel": "fills"}
-        await self._subscribe(params, subscription_id, auth=True)
+        await self._subscribe([params], auth=True)
 
     async def _resubscribe(self):
         if self.is_private:
             self._authed = False
             await self._auth()
-        for _, payload in self._subscriptions.items():
-            await self._send(payload)
+        if self._resubscribe_frames is None:
+            self._resubscribe_frames = self._subscribe_frames(
+                list(self._subscriptions.values())
+            )
+        await self._send_batch(self._resubscribe_frames)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from decimal import Decimal
 from typing import Dict, List, Tuple, Any
 from typing import Optional
@@ -18,7 +19,7 @@ from nexustrader.constants import (
 )
 
 
-class InstrumentId(Struct):
+class InstrumentId(Struct, frozen=True):
     symbol: str
     exchange: ExchangeType
     type: InstrumentType
@@ -36,8 +37,11 @@ class InstrumentId(Struct):
         return self.type == InstrumentType.INVERSE
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def from_str(cls, symbol: str):
         """
+        Parsed ids are cached per symbol, InstrumentId is frozen so the instance is shared
+
         BTCETH.BINANCE -> SPOT
         BTCUSDT-PERP.BINANCE -> LINEAR
         BTCUSD.BINANCE -> INVERSE
@@ -147,6 +151,18 @@ class OrderSubmit(Struct):
     trigger_type: TriggerType = TriggerType.LAST_PRICE
     kwargs: Dict[str, Any] = {}
     status: OrderStatus = OrderStatus.INITIALIZED
+    batch: List["OrderSubmit"] = []
+
+
+class BatchOrder(Struct, kw_only=True):
+    symbol: str
+    side: OrderSide
+    type: OrderType
+    amount: Decimal
+    price: Decimal | None = None
+    time_in_force: TimeInForce | None = TimeInForce.GTC
+    position_side: PositionSide | None = None
+    kwargs: Dict[str, Any] = {}
 
 
 class Order(Struct):
@@ -18,6 +18,7 @@ from nexustrader.schema import (
     Kline,
     Order,
     OrderSubmit,
+    BatchOrder,
     InstrumentId,
     BaseMarket,
     AccountBalance,
@@ -191,6 +192,55 @@ class Strategy:
         self._ems[order.instrument_id.exchange]._submit_order(order, account_type)
         return order.uuid
 
+    def create_batch_orders(
+        self,
+        orders: List[BatchOrder],
+        account_type: AccountType | None = None,
+    ) -> List[str]:
+        """
+        Create several orders in one submit, the EMS sends them concurrently.
+
+        All orders must belong to the same exchange and instrument type.
+        """
+        if not orders:
+            return []
+
+        batch = []
+        for order in orders:
+            batch.append(
+                OrderSubmit(
+                    symbol=order.symbol,
+                    instrument_id=InstrumentId.from_str(order.symbol),
+                    submit_type=SubmitType.CREATE,
+                    side=order.side,
+                    type=order.type,
+                    amount=order.amount,
+                    price=order.price,
+                    time_in_force=order.time_in_force,
+                    position_side=order.position_side,
+                    kwargs=order.kwargs,
+                )
+            )
+
+        instrument_id = batch[0].instrument_id
+        for order in batch[1:]:
+            if (
+                order.instrument_id.exchange != instrument_id.exchange
+                or order.instrument_id.type != instrument_id.type
+            ):
+                raise ValueError(
+                    f"Batch orders must share the same exchange and instrument type: {batch[0].symbol} vs {order.symbol}"
+                )
+
+        order = OrderSubmit(
+            symbol=batch[0].symbol,
+            instrument_id=instrument_id,
+            submit_type=SubmitType.BATCH,
+            batch=batch,
+        )
+        self._ems[instrument_id.exchange]._submit_order(order, account_type)
+        return [order.uuid for order in batch]
+
     def cancel_order(
         self, symbol: str, uuid: str, account_type: AccountType | None = None, **kwargs
     ) -> str:
@@ -0,0 +1,196 @@
+import hmac
+import json
+import hashlib
+import pytest
+import orjson
+from decimal import Decimal
+from urllib.parse import urlencode
+
+from nexustrader.base.api_client import encode_query, hmac_sha256
+from nexustrader.core.nautilius_core import HttpMethod
+from nexustrader.exchange.binance.error import BinanceServerError, should_retry
+from nexustrader.exchange.binance.rest_api import BinanceApiClient
+from nexustrader.exchange.bybit.rest_api import BybitApiClient, BybitOrderEncoder
+from nexustrader.exchange.okx.rest_api import OkxApiClient, OkxOrderEncoder
+
+
+class StubResponse:
+    def __init__(self, status: int, body: bytes):
+        self.status = status
+        self.body = body
+        self.headers = {}
+
+
+class StubHttpClient:
+    """Stands in for the rust `HttpClient`, records every request"""
+
+    def __init__(self, body: bytes, status: int = 200):
+        self._body = body
+        self._status = status
+        self.requests = []
+
+    async def request(
+        self, method, url, headers=None, body=None, keys=None, timeout_secs=None
+    ):
+        self.requests.append(
+            {"method": method, "url": url, "headers": headers, "body": body}
+        )
+        return StubResponse(self._status, self._body)
+
+
+def _stub(client, body: bytes) -> StubHttpClient:
+    client._client = StubHttpClient(body)
+    return client._client
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["GET", "POST", "PUT", "DELETE"])
+async def test_binance_fetch(method: str) -> None:
+    client = BinanceApiClient(api_key="key", secret="secret")
+    stub = _stub(client, b'{"listenKey":"abc"}')
+
+    raw = await client._fetch(
+        method,
+        "https://fapi.binance.com",
+        "/fapi/v1/listenKey",
+        payload={"symbol": "BTCUSDT"},
+        signed=True,
+    )
+
+    assert raw == b'{"listenKey":"abc"}'
+    (request,) = stub.requests
+    assert request["method"] == getattr(HttpMethod, method)
+    assert request["url"].startswith(
+        "https://fapi.binance.com/fapi/v1/listenKey?symbol=BTCUSDT&timestamp="
+    )
+    assert "&signature=" in request["url"]
+
+
+def test_hmac_sha256_copies_sign_independently() -> None:
+    proto = hmac_sha256("secret")
+    for query in ["symbol=BTCUSDT&timestamp=1", "symbol=ETHUSDT&timestamp=2"]:
+        mac = proto.copy()
+        mac.update(query.encode("utf-8"))
+        expected = hmac.new(b"secret", query.encode("utf-8"), hashlib.sha256)
+        assert mac.hexdigest() == expected.hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_bybit_fetch() -> None:
+    client = BybitApiClient(api_key="key", secret="secret")
+    body = b'{"retCode":0,"retMsg":"OK","result":{},"time":1}'
+    stub = _stub(client, body)
+
+    payload = {"category": "linear", "symbol": "BTCUSDT"}
+    assert await client._fetch("POST", client._base_url, "/v5/order/cancel", payload, signed=True) == body
+    assert await client._fetch("GET", client._base_url, "/v5/order/realtime", payload, signed=True) == body
+
+    post, get = stub.requests
+    assert post["method"] == HttpMethod.POST
+    assert orjson.loads(post["body"]) == payload
+    assert "X-BAPI-SIGN" in post["headers"]
+    assert get["method"] == HttpMethod.GET
+    assert get["body"] is None
+    assert get["url"].endswith("/v5/order/realtime?category=linear&symbol=BTCUSDT")
+
+
+@pytest.mark.asyncio
+async def test_okx_fetch() -> None:
+    client = OkxApiClient(api_key="key", secret="secret", passphrase="pass")
+    body = b'{"code":"0","msg":"","data":[]}'
+    stub = _stub(client, body)
+
+    payload = {"instId": "BTC-USDT-SWAP"}
+    assert await client._fetch("POST", "/api/v5/trade/cancel-order", payload, signed=True) == body
+    assert await client._fetch("GET", "/api/v5/account/positions", payload, signed=True) == body
+
+    post, get = stub.requests
+    assert post["method"] == HttpMethod.POST
+    assert orjson.loads(post["body"]) == payload
+    assert "OK-ACCESS-SIGN" in post["headers"]
+    assert get["method"] == HttpMethod.GET
+    assert get["url"].endswith("/api/v5/account/positions?instId=BTC-USDT-SWAP")
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"symbol": "BTCUSDT", "side": "BUY", "quantity": Decimal("0.001"), "price": 50000.5},
+        {"qty": Decimal("1E+1"), "price": 1e20, "big": 1e16, "tiny": 1e-07},
+        {"qty": Decimal("-1.5"), "limit": 100, "reduceOnly": True},
+        {"clientOrderId": "a b+c/d", "orderIdList": '["1","2"]', "memo": "ü"},
+        {},
+    ],
+)
+def test_encode_query_matches_urlencode(payload) -> None:
+    assert encode_query(payload) == urlencode(payload)
+
+
+def _pairs(raw: str) -> list:
+    """Decoded key/value pairs, duplicate keys are kept"""
+    return json.loads(raw, object_pairs_hook=list)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"price": "50000", "timeInForce": "GTC"},
+        {"orderLinkId": "abc", "reduceOnly": True},
+        {"orderType": "Market"},  # duplicates a prefix key
+        {"price": "50000", "orderType": "Market", "timeInForce": "IOC"},
+    ],
+)
+def test_bybit_order_encoder(kwargs) -> None:
+    encoder = BybitOrderEncoder()
+    expected = {
+        "category": "linear",
+        "symbol": "BTCUSDT",
+        "side": "Buy",
+        "orderType": "Limit",
+        "qty": "0.001",
+        **kwargs,
+    }
+    for _ in range(2):  # the second encode reuses the cached prefix
+        raw = encoder.encode("linear", "BTCUSDT", "Buy", "Limit", Decimal("0.001"), **kwargs)
+        assert _pairs(raw) == list(expected.items())
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"px": "50000", "clOrdId": "abc"},
+        {"posSide": "long", "reduceOnly": True},
+        {"instId": "ETH-USDT-SWAP"},  # duplicates a prefix key
+        {"px": "50000", "tdMode": "isolated"},
+    ],
+)
+def test_okx_order_encoder(kwargs) -> None:
+    encoder = OkxOrderEncoder()
+    expected = {
+        "instId": "BTC-USDT-SWAP",
+        "tdMode": "cross",
+        "side": "buy",
+        "ordType": "limit",
+        "sz": "1",
+        **kwargs,
+    }
+    for _ in range(2):  # the second encode reuses the cached prefix
+        raw = encoder.encode("BTC-USDT-SWAP", "cross", "buy", "limit", "1", **kwargs)
+        assert _pairs(raw) == list(expected.items())
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ({"code": -1001, "msg": "Internal error; unable to process your request."}, True),
+        ({"code": -2019, "msg": "Margin is insufficient."}, False),
+        ({"code": 12345, "msg": "not a binance code"}, False),
+        ("<html>502 Bad Gateway</html>", False),
+        (None, False),
+    ],
+)
+def test_binance_should_retry_decoded_bodies(message, expected: bool) -> None:
+    error = BinanceServerError(502, message, {})
+    assert should_retry(error) is expected
@@ -94,6 +94,20 @@ async def test_order_management(async_cache: AsyncCache, sample_order: Order):
     )
 
 
+async def test_open_order_views_agree_after_expiry(
+    async_cache: AsyncCache, sample_order: Order
+):
+    sample_order.timestamp = 1  # a resting order older than the expiry window
+    async_cache._order_initialized(sample_order)
+    async_cache._cleanup_expired_data()
+
+    assert sample_order.uuid not in async_cache._mem_orders
+    assert async_cache.get_open_orders(symbol=sample_order.symbol) == {sample_order.uuid}
+    assert async_cache.get_open_orders(exchange=sample_order.exchange) == {
+        sample_order.uuid
+    }
+
+
 async def test_cache_cleanup(async_cache: AsyncCache, sample_order: Order):
     sample_order.timestamp = time.time() * 1000
     async_cache._order_initialized(sample_order)
@@ -114,6 +128,25 @@ async def test_cache_cleanup(async_cache: AsyncCache, sample_order: Order):
     assert async_cache.get_order(expired_order.uuid) is None
 
 
+async def test_cache_cleanup_uses_latest_timestamp(
+    async_cache: AsyncCache, sample_order: Order
+):
+    sample_order.timestamp = 1  # Very old timestamp
+    async_cache._order_initialized(sample_order)
+
+    # A later update moves the timestamp past the expiry window
+    updated_order: Order = copy(sample_order)
+    updated_order.status = OrderStatus.ACCEPTED
+    updated_order.timestamp = time.time() * 1000
+    async_cache._order_status_update(updated_order)
+    async_cache._cleanup_expired_data()
+
+    assert sample_order.uuid in async_cache._mem_orders
+    assert async_cache._order_expiry_heap == [
+        (updated_order.timestamp, sample_order.uuid)
+    ]
+
+
 ################ # test cache private position data  ###################
 
 
@@ -176,4 +209,126 @@ async def test_apply_position_with_twice_filled_orders(
     async_cache._apply_position(filled_order)
     position = async_cache.get_position(filled_order.symbol)
     assert position.signed_amount == initial_size
-    assert async_cache._mem_closed_orders.get(filled_order.uuid) is True
+
+
+class StubPipeline:
+    """Queues the calls and runs them against the StubRedis on execute"""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self._calls.append(
+            (getattr(self._redis, name), args, kwargs)
+        )
+
+    def __len__(self):
+        return len(self._calls)
+
+    async def execute(self):
+        calls, self._calls = self._calls, []
+        return [method(*args, **kwargs) for method, args, kwargs in calls]
+
+
+class StubRedis:
+    """The hash, set and sorted set commands of the warm load and sync"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.zsets = {}
+        self.sets = {}
+
+    def pipeline(self, transaction=True):
+        return StubPipeline(self)
+
+    def hset(self, name, mapping):
+        self.hashes.setdefault(name, {}).update(
+            {key.encode(): value for key, value in mapping.items()}
+        )
+
+    def unlink(self, name):
+        self.sets.pop(name, None)
+
+    def sadd(self, name, *members):
+        self.sets.setdefault(name, set()).update(members)
+
+    def hmget(self, name, keys):
+        return [self.hashes.get(name, {}).get(key) for key in keys]
+
+    def zadd(self, name, mapping):
+        self.zsets.setdefault(name, {}).update(
+            {key.encode(): score for key, score in mapping.items()}
+        )
+
+    def zrangebyscore(self, name, min, max):
+        zset = self.zsets.get(name, {})
+        return sorted((m for m, score in zset.items() if score >= min), key=zset.get)
+
+    def zremrangebyscore(self, name, min, max):
+        zset = self.zsets.get(name, {})
+        bound = float(max.lstrip("("))
+        for member in [m for m, score in zset.items() if score < bound]:
+            del zset[member]
+
+
+async def test_warm_load_keeps_orders_out_of_open_sets(
+    async_cache: AsyncCache, sample_order: Order
+):
+    now = int(time.time() * 1000)
+    sample_order.timestamp = now
+    sample_order.amount = Decimal("1")
+    closed_order = copy(sample_order)
+    closed_order.uuid = "test-uuid-2"
+    closed_order.status = OrderStatus.FILLED
+    expired_order = copy(sample_order)
+    expired_order.uuid = "test-uuid-3"
+    expired_order.timestamp = 1
+    redis = async_cache._r_async = StubRedis()
+    orders = [sample_order, closed_order, expired_order]
+    redis.hset(
+        async_cache._orders_key,
+        {order.uuid: async_cache._encode(order) for order in orders},
+    )
+    redis.zadd(async_cache._orders_ts_key, {order.uuid: order.timestamp for order in orders})
+
+    await async_cache._warm_load_from_redis()
+
+    # read-only history, the registry has no ids for them so they never get updates
+    assert async_cache._mem_orders == {
+        sample_order.uuid: sample_order,
+        closed_order.uuid: closed_order,
+    }
+    assert async_cache.get_open_orders(symbol="BTC/USDT") == set()
+    assert async_cache.get_open_orders(exchange=ExchangeType.BINANCE) == set()
+    # the expired entry left the index, the hash keeps the history
+    assert redis.zsets[async_cache._orders_ts_key].keys() == {
+        sample_order.uuid.encode(),
+        closed_order.uuid.encode(),
+    }
+    assert expired_order.uuid.encode() in redis.hashes[async_cache._orders_key]
+
+
+async def test_sync_indexes_order_timestamps(async_cache: AsyncCache, sample_order: Order):
+    sample_order.symbol = "BTCUSDT-PERP.BINANCE"
+    sample_order.timestamp = int(time.time() * 1000)
+    sample_order.amount = Decimal("1")
+    async_cache._r_async = StubRedis()
+    async_cache._order_initialized(sample_order)
+    await async_cache._sync_to_redis()
+
+    cache = AsyncCache(
+        strategy_id="test-strategy",
+        user_id="test-user",
+        msgbus=async_cache._msgbus,
+        task_manager=async_cache._task_manager,
+    )
+    cache._r_async = async_cache._r_async
+    await cache._warm_load_from_redis()
+    assert cache._mem_orders == {sample_order.uuid: sample_order}
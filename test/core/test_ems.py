@@ -0,0 +1,500 @@
+import pytest
+import asyncio
+import contextlib
+from types import SimpleNamespace
+from decimal import Decimal, ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
+
+from nexustrader.base.ems import ExecutionManagementSystem
+from nexustrader.constants import ExchangeType, OrderSide, OrderStatus, OrderType, SubmitType
+from nexustrader.core.cache import AsyncCache
+from nexustrader.core.registry import OrderRegistry
+from nexustrader.error import OrderError
+from nexustrader.exchange.binance import BinanceAccountType
+from nexustrader.exchange.binance.ems import BinanceExecutionManagementSystem
+from nexustrader.exchange.bybit import BybitAccountType
+from nexustrader.exchange.bybit.ems import BybitExecutionManagementSystem
+from nexustrader.exchange.okx import OkxAccountType
+from nexustrader.exchange.okx.ems import OkxExecutionManagementSystem
+from nexustrader.schema import InstrumentId, Order, OrderSubmit, Precision
+
+
+ROUNDING = {"round": ROUND_HALF_UP, "ceil": ROUND_CEILING, "floor": ROUND_FLOOR}
+
+
+def quantize(value, precision: float, mode: str) -> Decimal:
+    """The exact Decimal quantize the precision helpers used to run"""
+    value = Decimal(str(value))
+    if precision >= 1:
+        exp, precision_decimal = Decimal(int(precision)), Decimal("1")
+    else:
+        exp, precision_decimal = Decimal("1"), Decimal(str(precision))
+    return (value / exp).quantize(precision_decimal, rounding=ROUNDING[mode]) * exp
+
+
+def snap(value, precision: float, mode: str) -> Decimal:
+    step = ExecutionManagementSystem._precision_step(precision)
+    return ExecutionManagementSystem._snap_to_step(value, step, mode)
+
+
+@pytest.mark.parametrize("mode", ["round", "ceil", "floor"])
+@pytest.mark.parametrize(
+    "value, precision",
+    [
+        # amounts
+        (12345.678, 0.001),
+        (98765.4321, 0.0001),
+        (7388.76066599998, 1e-08),
+        (3538747.96516799, 1e-06),
+        (123456789.123456, 0.000001),
+        (0.00012345, 1e-08),
+        (41712465.66, 0.0001),
+        (38521.88, 1e-08),
+        (169624.88061963, 1e-08),
+        (69289185.046733, 1e-08),
+        (150000.0, 10),
+        (1234567.0, 100),
+        # prices
+        (98765.43, 0.01),
+        (104999.99, 0.1),
+        (123456789.12, 0.01),
+        (91611981584.3703, 0.01),
+        (554966765196.398, 0.1),
+        (0.000012345678, 1e-10),
+        (5655843776.9, 0.01),
+        # past float resolution of the step ratio
+        (9395813278050.01, 10),
+        (496893068807548.0, 100),
+        (123456789012.345, 0.001),
+        (6844894891.4746, 1e-08),
+        (9507919101371.97, 1e-08),
+        # negatives, half-way ties round away from zero
+        (-0.125, 0.01),
+        (-0.015, 0.01),
+        (-12345.678, 0.001),
+        (-98765.4321, 0.01),
+        (-150000.0, 10),
+        (-0.000012345678, 1e-10),
+        (-9395813278050.01, 10),
+    ],
+)
+def test_snap_to_step_matches_decimal_quantize(value: float, precision: float, mode: str) -> None:
+    assert snap(value, precision, mode) == quantize(value, precision, mode)
+
+
+@pytest.mark.parametrize("mode", ["round", "ceil", "floor"])
+@pytest.mark.parametrize(
+    "value, precision",
+    [
+        (Decimal("12345678.123456789"), 0.00001),
+        (Decimal("0.015"), 0.01),
+        (Decimal("1E+1"), 1),
+    ],
+)
+def test_snap_to_step_decimal_value(value: Decimal, precision: float, mode: str) -> None:
+    assert snap(value, precision, mode) == quantize(value, precision, mode)
+
+
+@pytest.mark.parametrize(
+    "value, precision, expected",
+    [
+        (0.1 + 0.2, 0.1, Decimal("0.3")),  # float noise on an exact multiple is not a tick
+        (12345.678 * 3 / 3, 0.001, Decimal("12345.678")),
+        (0.015, 0.01, Decimal("0.02")),  # half way rounds up
+        (0.025, 0.01, Decimal("0.03")),
+    ],
+)
+def test_snap_to_step_absorbs_float_error(value: float, precision: float, expected: Decimal) -> None:
+    assert snap(value, precision, "round") == expected
+    assert snap(value, precision, "ceil") >= expected
+    assert snap(value, precision, "floor") <= expected
+
+
+class StubConnector:
+    """Private connector stand-in, a create blocks while the gate of its symbol is closed"""
+
+    def __init__(self, events: list):
+        self._events = events
+        self.gates = {}
+        self.status = OrderStatus.PENDING
+        self.error = None
+
+    async def create_order(self, symbol, side, type, amount, price, time_in_force, position_side, **kwargs):
+        self._events.append(("create", symbol, amount))
+        gate = self.gates.get(symbol)
+        if gate is not None:
+            await gate.wait()
+        if self.error is not None:
+            raise self.error
+        self._events.append(("created", symbol, amount))
+        return Order(
+            exchange=ExchangeType.BINANCE,
+            symbol=symbol,
+            status=self.status,
+            id=f"{symbol}-{amount}",
+            amount=amount,
+            type=type,
+            side=side,
+        )
+
+
+class StubCache:
+    def _order_initialized(self, order):
+        pass
+
+    def _order_status_update(self, order):
+        pass
+
+
+class StubMsgBus:
+    def __init__(self, events: list):
+        self._events = events
+
+    def send(self, endpoint, msg):
+        self._events.append((endpoint, msg.symbol, msg.amount))
+
+    def subscribe(self, topic, handler):
+        pass
+
+
+class StubEMS(ExecutionManagementSystem):
+    ACCOUNT_TYPE = BinanceAccountType
+
+    def _set_account_type(self):
+        pass
+
+    def _submit_order(self, order, account_type=None):
+        self._put_order_submit(account_type, order)
+
+    def _get_min_order_amount(self, symbol, market):
+        return Decimal(0)
+
+
+class StubTaskManager:
+    def __init__(self):
+        self.tasks = []
+
+    def create_task(self, coro, name=None):
+        task = asyncio.create_task(coro, name=name)
+        self.tasks.append(task)
+        return task
+
+
+@contextlib.asynccontextmanager
+async def running_ems(cache_cls=StubCache, **kwargs):
+    events = []
+    connectors = {
+        BinanceAccountType.SPOT: StubConnector(events),
+        BinanceAccountType.USD_M_FUTURE: StubConnector(events),
+    }
+    task_manager = StubTaskManager()
+    msgbus = StubMsgBus(events)
+    if cache_cls is AsyncCache:
+        cache = AsyncCache(
+            strategy_id="test-strategy",
+            user_id="test-user",
+            msgbus=msgbus,
+            task_manager=task_manager,
+        )
+    else:
+        cache = cache_cls()
+    ems = StubEMS(
+        market={},
+        cache=cache,
+        msgbus=msgbus,
+        task_manager=task_manager,
+        registry=OrderRegistry(),
+        **kwargs,
+    )
+    ems._build(connectors)
+    await ems.start()
+    try:
+        yield ems, connectors, events
+    finally:
+        for task in task_manager.tasks:
+            task.cancel()
+        await asyncio.gather(*task_manager.tasks, return_exceptions=True)
+
+
+def test_ems_builds_queues_only_for_its_exchange() -> None:
+    # the engine hands every ems the private connectors of all exchanges
+    connectors = {
+        BinanceAccountType.SPOT: StubConnector([]),
+        BybitAccountType.UNIFIED: StubConnector([]),
+        BinanceAccountType.USD_M_FUTURE: StubConnector([]),
+        OkxAccountType.LIVE: StubConnector([]),
+        OkxAccountType.DEMO: StubConnector([]),
+    }
+    kwargs = dict(
+        market={},
+        cache=StubCache(),
+        msgbus=StubMsgBus([]),
+        task_manager=StubTaskManager(),
+        registry=OrderRegistry(),
+    )
+    binance = BinanceExecutionManagementSystem(**kwargs)
+    bybit = BybitExecutionManagementSystem(**kwargs)
+    okx = OkxExecutionManagementSystem(**kwargs)
+    for ems in (binance, bybit, okx):
+        ems._build(connectors)
+
+    assert list(binance._order_submit_queues) == [
+        BinanceAccountType.SPOT,
+        BinanceAccountType.USD_M_FUTURE,
+    ]
+    assert list(bybit._order_submit_queues) == [BybitAccountType.UNIFIED]
+    assert list(okx._order_submit_queues) == [OkxAccountType.DEMO]
+
+    submit = create_submit("BTCUSDT.BYBIT", "1")
+    bybit._submit_order(submit)
+    with pytest.raises(OrderError):
+        binance._submit_order(submit, BybitAccountType.UNIFIED)
+
+
+def create_submit(symbol: str, amount: str) -> OrderSubmit:
+    return OrderSubmit(
+        symbol=symbol,
+        instrument_id=InstrumentId.from_str(symbol),
+        submit_type=SubmitType.CREATE,
+        side=OrderSide.BUY,
+        type=OrderType.MARKET,
+        amount=Decimal(amount),
+    )
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_slow_account_does_not_block_other_accounts() -> None:
+    async with running_ems() as (ems, connectors, events):
+        connectors[BinanceAccountType.SPOT].gates["BTCUSDT.BINANCE"] = asyncio.Event()
+
+        ems._submit_order(create_submit("BTCUSDT.BINANCE", "1"), BinanceAccountType.SPOT)
+        await settle()
+        ems._submit_order(create_submit("BTCUSDT-PERP.BINANCE", "2"), BinanceAccountType.USD_M_FUTURE)
+        await settle()
+
+        assert ("pending", "BTCUSDT-PERP.BINANCE", Decimal("2")) in events
+        assert ("created", "BTCUSDT.BINANCE", Decimal("1")) not in events
+
+        connectors[BinanceAccountType.SPOT].gates["BTCUSDT.BINANCE"].set()
+        await settle()
+        assert ("pending", "BTCUSDT.BINANCE", Decimal("1")) in events
+
+
+@pytest.mark.asyncio
+async def test_creates_of_different_symbols_are_sent_concurrently() -> None:
+    async with running_ems() as (ems, connectors, events):
+        gate = connectors[BinanceAccountType.SPOT].gates["BTCUSDT.BINANCE"] = asyncio.Event()
+
+        ems._submit_order(create_submit("BTCUSDT.BINANCE", "1"), BinanceAccountType.SPOT)
+        ems._submit_order(create_submit("ETHUSDT.BINANCE", "2"), BinanceAccountType.SPOT)
+        await settle()
+
+        assert ("pending", "ETHUSDT.BINANCE", Decimal("2")) in events
+        assert ("created", "BTCUSDT.BINANCE", Decimal("1")) not in events
+
+        gate.set()
+        await settle()
+        assert ("pending", "BTCUSDT.BINANCE", Decimal("1")) in events
+
+
+@pytest.mark.asyncio
+async def test_creates_of_same_symbol_are_sent_in_order() -> None:
+    async with running_ems() as (ems, connectors, events):
+        gate = connectors[BinanceAccountType.SPOT].gates["BTCUSDT.BINANCE"] = asyncio.Event()
+
+        # drained in one batch, the second create must still wait for the first
+        ems._submit_order(create_submit("BTCUSDT.BINANCE", "1"), BinanceAccountType.SPOT)
+        ems._submit_order(create_submit("ETHUSDT.BINANCE", "2"), BinanceAccountType.SPOT)
+        ems._submit_order(create_submit("BTCUSDT.BINANCE", "3"), BinanceAccountType.SPOT)
+        await settle()
+
+        assert ("create", "BTCUSDT.BINANCE", Decimal("3")) not in events
+
+        del connectors[BinanceAccountType.SPOT].gates["BTCUSDT.BINANCE"]
+        gate.set()
+        await settle()
+
+        btc = [event for event in events if event[1] == "BTCUSDT.BINANCE"]
+        assert btc == [
+            ("create", "BTCUSDT.BINANCE", Decimal("1")),
+            ("created", "BTCUSDT.BINANCE", Decimal("1")),
+            ("pending", "BTCUSDT.BINANCE", Decimal("1")),
+            ("create", "BTCUSDT.BINANCE", Decimal("3")),
+            ("created", "BTCUSDT.BINANCE", Decimal("3")),
+            ("pending", "BTCUSDT.BINANCE", Decimal("3")),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_create_order_timeout_reconciles_late_response() -> None:
+    async with running_ems(AsyncCache, order_timeout=0.01) as (ems, connectors, events):
+        gate = connectors[BinanceAccountType.SPOT].gates["BTCUSDT.BINANCE"] = asyncio.Event()
+        submit = create_submit("BTCUSDT.BINANCE", "1")
+
+        order = await ems._create_order(submit, BinanceAccountType.SPOT)
+
+        # the request may be live on the exchange, it is pending rather than failed
+        assert order.status == OrderStatus.PENDING
+        assert order.uuid == submit.uuid
+        assert order.id is None
+        assert ("pending", "BTCUSDT.BINANCE", Decimal("1")) in events
+
+        gate.set()
+        await settle()
+        assert ems._registry.get_uuid("BTCUSDT.BINANCE-1") == submit.uuid
+        assert not any(event[0] == "failed" for event in events)
+        # the placeholder is replaced, the cached order can be canceled by id
+        cached = ems._cache.get_order(submit.uuid).unwrap()
+        assert cached.id == "BTCUSDT.BINANCE-1"
+        assert cached.status == OrderStatus.PENDING
+        assert events[-1] == ("pending", "BTCUSDT.BINANCE", Decimal("1"))
+
+
+@pytest.mark.asyncio
+async def test_create_order_timeout_fails_rejected_late_response() -> None:
+    async with running_ems(AsyncCache, order_timeout=0.01) as (ems, connectors, events):
+        connector = connectors[BinanceAccountType.SPOT]
+        gate = connector.gates["BTCUSDT.BINANCE"] = asyncio.Event()
+        connector.status = OrderStatus.FAILED
+        submit = create_submit("BTCUSDT.BINANCE", "1")
+
+        order = await ems._create_order(submit, BinanceAccountType.SPOT)
+        assert order.status == OrderStatus.PENDING
+
+        gate.set()
+        await settle()
+        assert events[-1] == ("failed", "BTCUSDT.BINANCE", Decimal("1"))
+        assert ems._registry.get_uuid("BTCUSDT.BINANCE-1") is None
+        assert ems._cache.get_order(submit.uuid).unwrap().status == OrderStatus.FAILED
+        assert submit.uuid not in ems._cache.get_open_orders(symbol="BTCUSDT.BINANCE")
+
+
+@pytest.mark.asyncio
+async def test_create_order_timeout_fails_raised_late_response() -> None:
+    async with running_ems(AsyncCache, order_timeout=0.01) as (ems, connectors, events):
+        connector = connectors[BinanceAccountType.SPOT]
+        gate = connector.gates["BTCUSDT.BINANCE"] = asyncio.Event()
+        connector.error = ConnectionError("reset by peer")
+        submit = create_submit("BTCUSDT.BINANCE", "1")
+
+        order = await ems._create_order(submit, BinanceAccountType.SPOT)
+        assert order.status == OrderStatus.PENDING
+        assert submit.uuid in ems._cache.get_open_orders(symbol="BTCUSDT.BINANCE")
+
+        gate.set()
+        await settle()
+        assert events[-1] == ("failed", "BTCUSDT.BINANCE", Decimal("1"))
+        assert ems._cache.get_order(submit.uuid).unwrap().status == OrderStatus.FAILED
+        assert submit.uuid not in ems._cache.get_open_orders(symbol="BTCUSDT.BINANCE")
+
+
+@pytest.mark.parametrize(
+    "total_ticks, slices, min_ticks, expected",
+    [
+        (1000, 5, 0, (200, 5)),
+        (1003, 3, 0, (334, 3)),  # 334.33 rounds down
+        (1005, 2, 0, (503, 1)),  # 502.5 rounds half up
+        (1000, 5, 500, (500, 2)),  # the min order amount wins
+        (1, 5, 0, (1, 1)),  # never below one tick
+    ],
+)
+def test_twap_slice_ticks(total_ticks: int, slices: int, min_ticks: int, expected) -> None:
+    assert ExecutionManagementSystem._twap_slice_ticks(total_ticks, slices, min_ticks) == expected
+
+
+def twap_ems(amount_precision: float) -> StubEMS:
+    market = {"BTCUSDT.BINANCE": SimpleNamespace(precision=Precision(amount=amount_precision))}
+    return StubEMS(
+        market=market,
+        cache=StubCache(),
+        msgbus=StubMsgBus([]),
+        task_manager=StubTaskManager(),
+        registry=OrderRegistry(),
+    )
+
+
+@pytest.mark.parametrize(
+    "total_amount, duration, wait, min_order_amount, expected",
+    [
+        ("1", 10, 2, "0.01", ([200] * 5, Decimal("0"), 2)),
+        # the last slice is too small to send on its own, it is merged
+        ("1.0037", 9, 3, "0.01", ([334, 334, 335], Decimal("0.0007"), 3)),
+        # the remainder is sent as its own slice
+        ("1.003", 10, 5, "0.05", ([502, 501], Decimal("0"), 5)),
+        ("1.2", 10, 2, "0.1", ([240] * 5, Decimal("0"), 2)),
+        ("1.25", 15, 5, "0.01", ([417, 417, 416], Decimal("0"), 5)),
+        ("1", 10, 2, "0.5", ([500, 500], Decimal("0"), 5)),
+    ],
+)
+def test_calculate_twap_orders(total_amount, duration, wait, min_order_amount, expected) -> None:
+    ems = twap_ems(0.001)
+    total_amount = Decimal(total_amount)
+    tick_list, residual, wait = ems._calculate_twap_orders(
+        "BTCUSDT.BINANCE", total_amount, duration, wait, Decimal(min_order_amount), reduce_only=True
+    )
+    assert (tick_list, residual, wait) == expected
+    assert sum(tick_list) * Decimal("0.001") + residual == total_amount
+
+
+def test_calculate_twap_orders_below_min_order_amount() -> None:
+    ems = twap_ems(0.001)
+    args = ("BTCUSDT.BINANCE", Decimal("0.0025"), 10, 2, Decimal("0.01"))
+    assert ems._calculate_twap_orders(*args) == ([], Decimal(0), 0)
+    assert ems._calculate_twap_orders(*args, reduce_only=True) == ([2], Decimal("0.0005"), 0)
+
+
+@pytest.mark.parametrize(
+    "amount, precision, expected",
+    [
+        ("1.0037", 0.001, (1003, Decimal("0.0007"))),
+        ("12345678.9", 0.1, (123456789, Decimal("0"))),
+        ("150", 10, (15, Decimal("0"))),
+        ("155", 10, (15, Decimal("5"))),
+    ],
+)
+def test_amount_to_ticks(amount: str, precision: float, expected) -> None:
+    assert twap_ems(precision)._amount_to_ticks("BTCUSDT.BINANCE", Decimal(amount)) == expected
+
+
+def status_order(status: OrderStatus) -> Order:
+    return Order(
+        exchange=ExchangeType.BINANCE,
+        symbol="BTCUSDT.BINANCE",
+        status=status,
+        uuid="uuid-1",
+        amount=Decimal("1"),
+        type=OrderType.LIMIT,
+        side=OrderSide.BUY,
+    )
+
+
+@pytest.mark.parametrize(
+    "current, updates, expected",
+    [
+        # late updates cannot move the order back to an open state
+        (OrderStatus.CANCELING, [OrderStatus.ACCEPTED], OrderStatus.CANCELING),
+        (OrderStatus.FILLED, [OrderStatus.PARTIALLY_FILLED], OrderStatus.FILLED),
+        (
+            OrderStatus.PENDING,
+            [OrderStatus.PARTIALLY_FILLED, OrderStatus.ACCEPTED, OrderStatus.FILLED],
+            OrderStatus.FILLED,
+        ),
+        (OrderStatus.ACCEPTED, [OrderStatus.CANCELING, OrderStatus.CANCELED], OrderStatus.CANCELED),
+    ],
+)
+@pytest.mark.asyncio
+async def test_order_updates_follow_status_transitions(current, updates, expected) -> None:
+    ems = twap_ems(0.001)
+    queue = ems._order_updates["uuid-1"] = asyncio.Queue()
+    for status in updates:
+        queue.put_nowait(status_order(status))
+    order = ems._drain_order_updates("uuid-1", status_order(current))
+    assert order.status == expected
+
+    queue.put_nowait(status_order(OrderStatus.ACCEPTED))
+    order = await ems._wait_order_update("uuid-1", 0.01, order)
+    assert order.status == expected
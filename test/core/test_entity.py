@@ -1,6 +1,6 @@
 import pytest
 import asyncio
-from nexustrader.core.entity import TaskManager
+from nexustrader.core.entity import TaskManager, SPSCQueue
 
 
 @pytest.mark.asyncio
@@ -38,3 +38,45 @@ async def test_task_cancellation(task_manager: TaskManager) -> None:
 
     # assert not task_manager._tasks
     # assert task.done()
+
+
+@pytest.mark.asyncio
+async def test_spsc_queue_order_and_wakeup() -> None:
+    queue: SPSCQueue[int] = SPSCQueue()
+
+    consumer = asyncio.create_task(queue.get())
+    await asyncio.sleep(0.01)
+    assert not consumer.done()  # waits while empty
+
+    queue.put_nowait(1)
+    queue.put_nowait(2)
+    assert await consumer == 1
+    assert await queue.get() == 2
+    assert queue.empty()
+
+
+def test_spsc_queue_full() -> None:
+    queue: SPSCQueue[int] = SPSCQueue(maxsize=2)
+    queue.put_nowait(1)
+    queue.put_nowait(2)
+
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(3)
+    assert queue.qsize() == 2
+
+    assert queue.get_nowait() == 1
+    assert queue.get_nowait() == 2
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+@pytest.mark.asyncio
+async def test_spsc_queue_wraps_around() -> None:
+    queue: SPSCQueue[int] = SPSCQueue(maxsize=3)
+
+    for i in range(10):
+        queue.put_nowait(i)
+        queue.put_nowait(i + 100)
+        assert await queue.get() == i
+        assert await queue.get() == i + 100
+    assert queue.empty()
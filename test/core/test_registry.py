@@ -42,6 +42,15 @@ async def test_wait_for_order_id(order_registry: OrderRegistry, sample_order: Or
     await wait_task
 
 
+@pytest.mark.asyncio
+async def test_wait_for_registered_order_id(order_registry: OrderRegistry, sample_order: Order) -> None:
+    order_registry.register_order(sample_order)
+
+    # Already registered, should return without creating an event
+    await asyncio.wait_for(order_registry.wait_for_order_id(sample_order.id), timeout=0.1)
+    assert sample_order.id not in order_registry._uuid_init_events
+
+
 @pytest.mark.asyncio
 async def test_remove_order(order_registry: OrderRegistry, sample_order: Order) -> None:
     order_registry.register_order(sample_order)
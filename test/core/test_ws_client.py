@@ -0,0 +1,112 @@
+import pytest
+import orjson
+
+from nexustrader.exchange.binance.constants import BinanceAccountType
+from nexustrader.exchange.binance.websockets import BinanceWSClient
+from nexustrader.exchange.bybit.constants import BybitAccountType
+from nexustrader.exchange.bybit.websockets import BybitWSClient
+from nexustrader.exchange.okx.constants import OkxAccountType
+from nexustrader.exchange.okx.websockets import OkxWSClient
+
+
+class RecordingTransport:
+    """Patched onto a ws client, records frames instead of sending them"""
+
+    def __init__(self, client):
+        self.frames = []
+        self.batches = []
+        client.connect = self.connect
+        client._send = self.send
+        client._send_batch = self.send_batch
+
+    async def connect(self):
+        pass
+
+    async def send(self, payload: dict):
+        self.frames.append(orjson.dumps(payload))
+
+    async def send_batch(self, raws):
+        self.batches.append(raws)
+
+
+@pytest.mark.asyncio
+async def test_bybit_resubscribe_reuses_frames_until_topics_change() -> None:
+    client = BybitWSClient(BybitAccountType.LINEAR, handler=print, task_manager=None)
+    transport = RecordingTransport(client)
+
+    topics = [f"orderbook.1.SYM{i}USDT" for i in range(12)]
+    for topic in topics:
+        await client._subscribe(topic)
+    await client._subscribe(topics[0])
+    assert len(transport.frames) == 12
+
+    await client._resubscribe()
+    await client._resubscribe()
+    first, second = transport.batches
+    assert first is second
+    assert [orjson.loads(raw)["args"] for raw in first] == [topics[:10], topics[10:]]
+
+    await client._subscribe("publicTrade.BTCUSDT")
+    await client._resubscribe()
+    assert orjson.loads(transport.batches[-1][-1])["args"] == topics[10:] + ["publicTrade.BTCUSDT"]
+
+
+@pytest.mark.asyncio
+async def test_okx_resubscribe_reuses_frames_until_args_change() -> None:
+    client = OkxWSClient(OkxAccountType.LIVE, handler=print, task_manager=None)
+    transport = RecordingTransport(client)
+
+    inst_ids = [f"SYM{i}-USDT-SWAP" for i in range(150)]
+    await client.subscribe_many("bbo-tbt", inst_ids)
+    await client.subscribe_many("bbo-tbt", inst_ids[:2])
+    (subscribe,) = transport.batches
+    assert [len(orjson.loads(raw)["args"]) for raw in subscribe] == [100, 50]
+
+    await client._resubscribe()
+    await client._resubscribe()
+    assert transport.batches[1] is transport.batches[2]
+    assert transport.batches[1] == subscribe
+
+    await client.subscribe_trade("BTC-USDT-SWAP")
+    await client._resubscribe()
+    assert orjson.loads(transport.batches[-1][-1])["args"][-1] == {
+        "channel": "trades",
+        "instId": "BTC-USDT-SWAP",
+    }
+
+
+@pytest.mark.asyncio
+async def test_okx_subscribe_records_args_only_after_send() -> None:
+    client = OkxWSClient(OkxAccountType.LIVE, handler=print, task_manager=None)
+    transport = RecordingTransport(client)
+
+    async def refused():
+        raise ConnectionError("refused")
+
+    client.connect = refused
+    with pytest.raises(ConnectionError):
+        await client.subscribe_trade("BTC-USDT-SWAP")
+    assert client._subscriptions == {}
+
+    client.connect = transport.connect
+    await client.subscribe_trade("BTC-USDT-SWAP")
+    (subscribe,) = transport.batches
+    assert orjson.loads(subscribe[0])["args"] == [{"channel": "trades", "instId": "BTC-USDT-SWAP"}]
+    assert ("trades", "BTC-USDT-SWAP") in client._subscriptions
+
+
+@pytest.mark.asyncio
+async def test_binance_flush_waits_for_resubscribe_when_disconnected() -> None:
+    client = BinanceWSClient(BinanceAccountType.USD_M_FUTURE, handler=print, task_manager=None)
+    transport = RecordingTransport(client)
+    client._subscriptions["book_ticker.BTCUSDT"] = "btcusdt@bookTicker"
+    client._pending_streams.append("btcusdt@bookTicker")
+
+    await client._flush_subscriptions()
+    assert transport.batches == []
+    assert client._pending_streams == []
+    assert client._pending_acks == {}
+
+    await client._resubscribe()
+    (resubscribe,) = transport.batches
+    assert orjson.loads(resubscribe[0])["params"] == ["btcusdt@bookTicker"]